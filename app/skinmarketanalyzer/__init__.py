@@ -0,0 +1,66 @@
+# skinmarketanalyzer — CS2 item'ları için Steam Market fiyat takibi
+#
+# Paket içe aktarımı Qt yüklemez: GUI yalnız `gui` modülü (veya
+# `python -m skinmarketanalyzer`) çağrıldığında açılır. Aşağıdaki adlar
+# ilk erişimde ilgili alt modülden yüklenir; `import skinmarketanalyzer`
+# bu yüzden birkaç milisaniye sürer.
+#
+#   names     — isim ayrıştırma, fiyat metni, Pricempire URL'leri
+#   steam     — Steam uç noktaları, yanıt ayrıştırma, paylaşılan HTTP oturumu
+#   items     — JSON içe aktarma / normalizasyon
+#   cache     — kalıcı fiyat önbelleği, item_nameid indeksi, görsel önbelleği
+#   ratelimit — token bucket ve AIMD hız denetleyicisi
+#   fetch     — fiyat çekme motorları (aiofetch: asyncio motoru)
+#   watch     — sürekli izleme modu (uyarlanabilir yenileme takvimi)
+#   metrics   — çekme metrikleri (sayaçlar, gecikme histogramları, JSON/Prometheus)
+#   search    — tablo arama indeksi ve yapılandırılmış sorgular
+
+import importlib
+
+_EXPORTS = {
+    "build_market_hash_name": "names",
+    "build_pricempire_url": "names",
+    "parse_item_name": "names",
+    "parse_money_to_float": "names",
+    "pricempire_canonicalize": "names",
+    "pricempire_url_for": "names",
+    "pricempire_urls": "names",
+    "slugify": "names",
+    "make_session": "steam",
+    "SessionManager": "steam",
+    "shared_sessions": "steam",
+    "parse_order_histogram": "steam",
+    "normalize_items": "items",
+    "parse_items_json": "items",
+    "ImageCache": "cache",
+    "NameIdIndex": "cache",
+    "PriceCache": "cache",
+    "AimdRateController": "ratelimit",
+    "AsyncTokenBucket": "ratelimit",
+    "TokenBucket": "ratelimit",
+    "FETCH_ENGINES": "fetch",
+    "FETCH_MODES": "fetch",
+    "FETCH_PRIORITIES": "fetch",
+    "FetchQueue": "fetch",
+    "PriceFetcher": "fetch",
+    "make_fetcher": "fetch",
+    "PriceWatcher": "watch",
+    "FetchMetrics": "metrics",
+    "SearchIndex": "search",
+    "parse_query": "search",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    mod = _EXPORTS.get(name)
+    if mod is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{mod}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,9 @@
+# __main__.py — python -m skinmarketanalyzer [gui | fetch ...]
+
+import sys
+
+# Mutlak içe aktarma: PyInstaller bu dosyayı betik olarak çalıştırır
+from skinmarketanalyzer.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
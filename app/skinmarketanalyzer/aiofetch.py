@@ -0,0 +1,219 @@
+# aiofetch.py — asyncio + aiohttp fiyat motoru (yalnız seçilince içe aktarılır)
+
+from typing import Callable, Optional
+import sys, asyncio
+
+import aiohttp
+
+from .cache import PriceCache
+from .fetch import FetchQueue, PriceFetcher, histogram_summary
+from .metrics import FetchMetrics, summary_line
+from .names import parse_money_to_float
+from .ratelimit import AsyncTokenBucket
+from .steam import (
+    STEAM_HEADERS, histogram_url, listing_url, parse_nameid, priceoverview_url,
+)
+
+
+class AsyncPriceFetcher(PriceFetcher):
+    """Tüm item'ları tek olay döngüsünde coroutine olarak çeker.
+
+    Thread yerine paylaşılan bir aiohttp bağlantı havuzu ve asenkron token
+    bucket kullanır; geri çağrılar PriceFetcher ile aynıdır.
+    """
+    def __init__(self, items, currency: int, rps: float,
+                 cache: Optional[PriceCache] = None, adaptive: bool = True,
+                 max_connections: int = 16, priority: str = "profit", mode: str = "overview",
+                 on_progress: Optional[Callable[[str, float, float], None]] = None,
+                 on_rate_change: Optional[Callable[[float], None]] = None,
+                 on_orders: Optional[Callable[[str, float, int, int], None]] = None,
+                 metrics: Optional[FetchMetrics] = None):
+        super().__init__(items, currency, max_workers=1, rps=rps, cache=cache,
+                         adaptive=adaptive, priority=priority, mode=mode,
+                         on_progress=on_progress, on_rate_change=on_rate_change,
+                         on_orders=on_orders, metrics=metrics)
+        self.max_connections = max(1, int(max_connections))
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tasks: set = set()
+        self.abucket: Optional[AsyncTokenBucket] = None
+
+    def _open_session(self):
+        # aiohttp oturumu olay döngüsüne bağlı; run() içinde, döngüde açılır
+        return None
+
+    def stop(self):
+        super().stop()
+        loop = self._loop
+        if loop is not None and loop.is_running():
+            loop.call_soon_threadsafe(self._cancel_tasks)
+
+    def _cancel_tasks(self):
+        if self.abucket is not None:
+            self.abucket.cancel()
+        for t in list(self._tasks):
+            t.cancel()
+
+    async def _get(self, url: str, as_json: bool = True, endpoint: str = "priceoverview"):
+        """429/5xx ve ağ hatalarında üstel geri çekilmeli GET; başarısızsa None.
+
+        PriceFetcher._get gibi çağrı başına tek metrik olayı yazar.
+        """
+        loop = asyncio.get_running_loop()
+        waited = spent = 0.0
+        status, nbytes, attempt = "cancelled", 0, 0
+        try:
+            for attempt in range(4):
+                t = loop.time()
+                if not await self.abucket.acquire(1.0, self._should_stop):
+                    status = "cancelled"
+                    return None
+                waited += loop.time() - t
+                t = loop.time()
+                try:
+                    async with self.session.get(url) as r:
+                        status = r.status
+                        body = await r.read()
+                        spent += loop.time() - t
+                        nbytes += len(body)
+                        if r.status == 429:
+                            self.metrics.throttle(endpoint)
+                            self.rate_ctl.on_throttle()
+                            continue
+                        if r.status in (500, 502, 503, 504):
+                            await asyncio.sleep(0.5 * (2 ** attempt))
+                            continue
+                        if r.status >= 400:
+                            return None
+                        self.rate_ctl.on_success()
+                        if as_json:
+                            return await r.json(content_type=None)
+                        return await r.text()
+                except asyncio.TimeoutError:
+                    spent += loop.time() - t
+                    status = "timeout"
+                    self.rate_ctl.on_throttle()
+                except (aiohttp.ClientError, ValueError) as e:
+                    spent += loop.time() - t
+                    status = "error"
+                    self.metrics.error(endpoint, e)
+                    await asyncio.sleep(0.5 * (2 ** attempt))
+            return None
+        finally:
+            if status != "cancelled" or spent:
+                self.metrics.request(endpoint, status, spent, nbytes, attempt, waited)
+
+    async def _histogram_async(self, mh: str, nameid: str):
+        """PriceFetcher._histogram'ın asenkron karşılığı: (özet | None, ağdan geldi mi)."""
+        hist = self._cache_get("histogram", mh)
+        if hist is not None and hist.fresh:
+            return histogram_summary(hist.value), False
+        data = await self._get(histogram_url(nameid, self.currency), endpoint="histogram")
+        summary = self._store_histogram(mh, data)
+        return summary, summary is not None
+
+    async def _fetch_one_async(self, mh: str):
+        if self.mode == "histogram":
+            nameid = self.cache.nameids.get(mh)
+            if nameid:
+                hist, fetched = await self._histogram_async(mh, nameid)
+                market_low = float((hist or {}).get("sell") or 0.0)
+                self._emit_orders(mh, hist)
+                if fetched:
+                    self._record_history(mh, market_low, 0.0)
+                return (mh, market_low, self._cached_median(mh))
+
+        lp = mp = None
+        lso = None
+        fetched = False
+
+        # --- priceoverview ---
+        po = self._cache_get("priceoverview", mh)
+        if po is not None and po.fresh:
+            lp, mp = (po.value or [None, None])[:2]
+        else:
+            url = priceoverview_url(mh, self.currency)
+            data = await self._get(url)
+            if isinstance(data, dict) and not data.get("success", True):
+                self.metrics.reject("priceoverview")
+                self.rate_ctl.on_throttle()
+                data = await self._get(url)
+            if isinstance(data, dict) and data.get("success", True):
+                lp = parse_money_to_float(data.get("lowest_price"))
+                mp = parse_money_to_float(data.get("median_price"))
+                self.cache.put("priceoverview", mh, self.currency, [lp, mp])
+                fetched = True
+
+        # --- fallback: histogram.lowest_sell_order ---
+        if lp is None or lp == 0.0:
+            self.metrics.fallback()
+            nameid = self.cache.nameids.get(mh)
+            self.metrics.cache("nameid", "hit" if nameid else "miss")
+            if not nameid:
+                html = await self._get(listing_url(mh), as_json=False, endpoint="listings")
+                nameid = parse_nameid(html) if html else None
+                if nameid:
+                    self.cache.nameids.set(mh, nameid)
+
+            if nameid:
+                hist, got = await self._histogram_async(mh, nameid)
+                lso = (hist or {}).get("sell")
+                fetched = fetched or got
+                self._emit_orders(mh, hist)
+
+        market_low = float(lp if lp not in (None, 0) else (lso or 0.0))
+        if fetched:
+            self._record_history(mh, market_low, float(mp or 0.0))
+        return (mh, market_low, float(mp or 0.0))
+
+    async def _worker_async(self, queue: FetchQueue):
+        while not self._should_stop():
+            mh = queue.pop()
+            if mh is None:
+                return
+            try:
+                key, market_low, median = await self._fetch_one_async(mh)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.metrics.error("worker", e)
+                print("Async fetch error:", e, file=sys.stderr)
+                self._orders.pop(mh, None)
+                continue
+            if self._should_stop():
+                return
+            self._emit_result(key, market_low, median)
+
+    async def _run_async(self, queue: FetchQueue):
+        self.abucket = AsyncTokenBucket(self.bucket.rate, self.bucket.capacity)
+        self.rate_ctl.bucket = self.abucket
+        connector = aiohttp.TCPConnector(limit=self.max_connections, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=12)
+        async with aiohttp.ClientSession(headers=STEAM_HEADERS, connector=connector,
+                                         timeout=timeout) as session:
+            self.session = session
+            # Bağlantı sayısı kadar işçi; her biri boşaldıkça kuyruktan en öncelikliyi alır
+            n = min(self.max_connections, len(queue))
+            tasks = [asyncio.ensure_future(self._worker_async(queue)) for _ in range(n)]
+            self._tasks = set(tasks)
+            try:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            finally:
+                self._cancel_tasks()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                self._tasks = set()
+                self.session = None
+
+    def run(self):
+        queue = self._build_queue()
+        self.metrics.start(len(queue))
+        if not queue or self._should_stop():
+            return
+        loop = asyncio.new_event_loop()
+        self._loop = loop
+        try:
+            loop.run_until_complete(self._run_async(queue))
+        finally:
+            self._loop = None
+            loop.close()
+        print("[RATE]", self.abucket.stats(), file=sys.stderr)
+        print("[METRICS]", summary_line(self.metrics), file=sys.stderr)
@@ -0,0 +1,483 @@
+# cache.py — kalıcı fiyat önbelleği, item_nameid indeksi ve fiyat geçmişi (SQLite)
+
+from typing import Optional
+import os, sys, csv, json, time, sqlite3, hashlib, threading
+
+
+# -------------------- Kalıcı fiyat önbelleği (SQLite) --------------------
+APP_DIR_NAME = "SkinMarketAnalyzer"
+
+# Uç nokta başına tazelik süresi (sn). None → hiç bayatlamaz.
+# item_nameid hiç değişmediği için ayrı bir kalıcı indekste (NameIdIndex) tutulur.
+CACHE_TTLS = {
+    "priceoverview": 15 * 60,
+    "histogram": 10 * 60,
+}
+
+
+def user_data_dir() -> str:
+    """Kullanıcı veri klasörü (Windows: %APPDATA%, macOS: Application Support, Linux: XDG)."""
+    if sys.platform.startswith("win"):
+        base = os.environ.get("APPDATA") or os.path.expanduser("~")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Application Support")
+    else:
+        base = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    path = os.path.join(base, APP_DIR_NAME)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+class CacheEntry:
+    __slots__ = ("value", "fetched_at", "fresh")
+
+    def __init__(self, value, fetched_at: float, fresh: bool):
+        self.value = value
+        self.fetched_at = fetched_at
+        self.fresh = fresh
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+
+class NameIdIndex:
+    """market_hash_name → item_nameid kalıcı indeksi.
+
+    Bir kez öğrenilen id sonsuza dek geçerlidir; açılışta tamamı belleğe alınır,
+    listings sayfası istenmeden önce buraya bakılır. JSON/CSV ile toplu
+    içe/dışa aktarılabilir.
+    """
+    def __init__(self, conn: sqlite3.Connection, lock: threading.Lock):
+        self.conn = conn
+        self.lock = lock
+        with self.lock:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS nameid_index ("
+                " mh TEXT PRIMARY KEY,"
+                " nameid TEXT NOT NULL"
+                ") WITHOUT ROWID"
+            )
+            self.conn.commit()
+            rows = self.conn.execute("SELECT mh, nameid FROM nameid_index").fetchall()
+        self._map: dict[str, str] = {mh: nid for mh, nid in rows}
+
+    def __len__(self):
+        return len(self._map)
+
+    def __contains__(self, mh: str):
+        return mh in self._map
+
+    def get(self, mh: str) -> Optional[str]:
+        return self._map.get(mh)
+
+    def set(self, mh: str, nameid) -> None:
+        self.update({mh: nameid})
+
+    def update(self, mapping: dict) -> int:
+        """Geçerli (sayısal) id'leri ekle; eklenen/değişen kayıt sayısını döndür."""
+        rows = []
+        for mh, nid in mapping.items():
+            nid = str(nid).strip() if nid is not None else ""
+            if not mh or not nid.isdigit() or self._map.get(mh) == nid:
+                continue
+            rows.append((mh, nid))
+        if not rows:
+            return 0
+        with self.lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO nameid_index (mh, nameid) VALUES (?, ?)", rows
+            )
+            self.conn.commit()
+        self._map.update(rows)
+        return len(rows)
+
+    def to_dict(self) -> dict:
+        return dict(self._map)
+
+    # ---- Toplu içe/dışa aktarma ----
+    def import_file(self, path: str) -> int:
+        """JSON ({mh: id} veya [{market_hash_name, item_nameid}, ...]) ya da CSV oku."""
+        if path.lower().endswith(".csv"):
+            with open(path, "r", encoding="utf-8-sig", newline="") as f:
+                rows = list(csv.DictReader(f))
+            return self.update({_row_mh(r): _row_nameid(r) for r in rows})
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict) and isinstance(data.get("items"), list):
+            data = data["items"]
+        if isinstance(data, dict):
+            return self.update(data)
+        if isinstance(data, list):
+            return self.update({_row_mh(r): _row_nameid(r) for r in data if isinstance(r, dict)})
+        raise ValueError("Beklenen format: {mh: nameid} veya [{market_hash_name, item_nameid}, ...]")
+
+    def export_file(self, path: str) -> int:
+        items = sorted(self._map.items())
+        if path.lower().endswith(".csv"):
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                wr = csv.writer(f)
+                wr.writerow(["market_hash_name", "item_nameid"])
+                wr.writerows(items)
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(dict(items), f, ensure_ascii=False, indent=1)
+        return len(items)
+
+
+def _row_mh(row: dict) -> str:
+    return str(row.get("market_hash_name") or row.get("mh") or row.get("name") or "").strip()
+
+def _row_nameid(row: dict):
+    return row.get("item_nameid") or row.get("nameid")
+
+
+# -------------------- Fiyat geçmişi (zaman serisi) --------------------
+# Saklama/seyreltme: ham gözlemler HISTORY_RAW_SECONDS boyunca tutulur; daha
+# eskiler saatlik, HISTORY_HOURLY_SECONDS'tan eskiler günlük ortalamaya indirilir,
+# HISTORY_MAX_SECONDS'tan eskiler silinir.
+HISTORY_RAW_SECONDS = 2 * 86400
+HISTORY_HOURLY_SECONDS = 30 * 86400
+HISTORY_MAX_SECONDS = 365 * 86400
+HISTORY_COMPACT_INTERVAL = 86400    # açılışta sıkıştırma en fazla bu sıklıkla çalışır
+
+
+def _cents(v) -> Optional[int]:
+    try:
+        v = float(v)
+    except (TypeError, ValueError):
+        return None
+    return int(round(v * 100)) if v == v and v > 0 else None
+
+
+def _price(c) -> Optional[float]:
+    return None if c is None else c / 100.0
+
+
+class PriceHistory:
+    """Her fiyat gözleminin (market_low, median) kalıcı zaman serisi.
+
+    Yer kazanmak için mh bir kez `history_items` tablosunda tutulur; seride
+    tamsayı id, saniye cinsinden ts ve kuruş cinsinden fiyatlar saklanır.
+    Birincil anahtar (mh_id, currency, ts) olduğundan "X item'ının son N
+    saati" sorgusu indeks aralık taramasıdır.
+    """
+    def __init__(self, conn: sqlite3.Connection, lock: threading.Lock):
+        self.conn = conn
+        self.lock = lock
+        with self.lock:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS history_items ("
+                " id INTEGER PRIMARY KEY,"
+                " mh TEXT NOT NULL UNIQUE"
+                ")"
+            )
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS price_history ("
+                " mh_id INTEGER NOT NULL,"
+                " currency INTEGER NOT NULL,"
+                " ts INTEGER NOT NULL,"
+                " low INTEGER,"
+                " median INTEGER,"
+                " PRIMARY KEY (mh_id, currency, ts)"
+                ") WITHOUT ROWID"
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS price_history_ts ON price_history (ts)")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS history_meta ("
+                " key TEXT PRIMARY KEY,"
+                " value REAL NOT NULL"
+                ") WITHOUT ROWID"
+            )
+            self.conn.commit()
+            rows = self.conn.execute("SELECT mh, id FROM history_items").fetchall()
+        self._ids: dict[str, int] = {mh: i for mh, i in rows}
+
+    def _id(self, mh: str) -> int:
+        # self.lock tutulurken çağrılır
+        i = self._ids.get(mh)
+        if i is None:
+            self.conn.execute("INSERT OR IGNORE INTO history_items (mh) VALUES (?)", (mh,))
+            i = self.conn.execute("SELECT id FROM history_items WHERE mh=?", (mh,)).fetchone()[0]
+            self._ids[mh] = i
+        return i
+
+    def record(self, mh: str, currency: int, low, median, ts: Optional[float] = None) -> None:
+        self.record_many([(mh, currency, low, median, ts)])
+
+    def record_many(self, rows) -> int:
+        """[(mh, currency, low, median, ts|None), ...] ekle; fiyatsız gözlemler atlanır."""
+        now = int(time.time())
+        with self.lock:
+            data = []
+            for mh, currency, low, median, ts in rows:
+                low_c, med_c = _cents(low), _cents(median)
+                if not mh or (low_c is None and med_c is None):
+                    continue
+                data.append((self._id(mh), int(currency), now if ts is None else int(ts), low_c, med_c))
+            if not data:
+                return 0
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO price_history (mh_id, currency, ts, low, median)"
+                " VALUES (?, ?, ?, ?, ?)", data
+            )
+            self.conn.commit()
+        return len(data)
+
+    def series(self, mh: str, currency: int = 1, hours: Optional[float] = None,
+               since: Optional[float] = None) -> list[tuple[int, Optional[float], Optional[float]]]:
+        """Bir item'ın [(ts, low, median), ...] serisi (eskiden yeniye)."""
+        i = self._ids.get(mh)
+        if i is None:
+            return []
+        if since is None:
+            since = time.time() - hours * 3600 if hours is not None else 0
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT ts, low, median FROM price_history"
+                " WHERE mh_id=? AND currency=? AND ts>=? ORDER BY ts",
+                (i, int(currency), int(since)),
+            ).fetchall()
+        return [(ts, _price(lo), _price(md)) for ts, lo, md in rows]
+
+    def latest(self, mh: str, currency: int = 1):
+        """Son gözlem (ts, low, median) ya da None."""
+        i = self._ids.get(mh)
+        if i is None:
+            return None
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT ts, low, median FROM price_history"
+                " WHERE mh_id=? AND currency=? ORDER BY ts DESC LIMIT 1",
+                (i, int(currency)),
+            ).fetchone()
+        return None if row is None else (row[0], _price(row[1]), _price(row[2]))
+
+    def drops(self, currency: int = 1, pct: float = 10.0, hours: float = 24.0):
+        """`hours` öncesine göre low'u en az `pct` yüzde düşen item'lar.
+
+        [(mh, önceki_low, son_low, değişim_%), ...] en büyük düşüş önce.
+        Referans, o andan önceki son gözlemdir.
+        """
+        ref_ts = int(time.time() - hours * 3600)
+        with self.lock:
+            rows = self.conn.execute(
+                "WITH last AS ("
+                "  SELECT mh_id, low, MAX(ts) AS ts FROM price_history"
+                "  WHERE currency=? AND low IS NOT NULL GROUP BY mh_id),"
+                " ref AS ("
+                "  SELECT mh_id, low, MAX(ts) AS ts FROM price_history"
+                "  WHERE currency=? AND low IS NOT NULL AND ts<=? GROUP BY mh_id)"
+                " SELECT i.mh, ref.low, last.low FROM last"
+                " JOIN ref ON ref.mh_id = last.mh_id"
+                " JOIN history_items i ON i.id = last.mh_id"
+                " WHERE last.low <= ref.low * (1 - ? / 100.0)",
+                (int(currency), int(currency), ref_ts, float(pct)),
+            ).fetchall()
+        out = [(mh, old / 100.0, new / 100.0, (new - old) / old * 100.0) for mh, old, new in rows]
+        out.sort(key=lambda r: r[3])
+        return out
+
+    def compact_due(self, now: Optional[float] = None) -> bool:
+        """Son sıkıştırmadan bu yana HISTORY_COMPACT_INTERVAL geçti mi?"""
+        now = time.time() if now is None else now
+        with self.lock:
+            row = self.conn.execute("SELECT value FROM history_meta WHERE key='compacted_at'").fetchone()
+        return row is None or now - row[0] >= HISTORY_COMPACT_INTERVAL
+
+    def maybe_compact(self, now: Optional[float] = None) -> Optional[int]:
+        """Vadesi geldiyse compact(); gelmediyse None (açılışta tek sorgu maliyeti)."""
+        return self.compact(now) if self.compact_due(now) else None
+
+    def compact(self, now: Optional[float] = None) -> int:
+        """Eski gözlemleri saatlik/günlük ortalamaya indir, çok eskileri sil; silinen satır sayısı."""
+        now = int(time.time() if now is None else now)
+        removed = 0
+        with self.lock:
+            cur = self.conn.execute("DELETE FROM price_history WHERE ts < ?",
+                                    (now - HISTORY_MAX_SECONDS,))
+            removed += cur.rowcount
+            for lo, hi, bucket in (
+                (now - HISTORY_HOURLY_SECONDS, now - HISTORY_RAW_SECONDS, 3600),
+                (now - HISTORY_MAX_SECONDS, now - HISTORY_HOURLY_SECONDS, 86400),
+            ):
+                removed += self._downsample(lo, hi, bucket)
+            self.conn.execute("INSERT OR REPLACE INTO history_meta (key, value) VALUES ('compacted_at', ?)",
+                              (float(now),))
+            self.conn.commit()
+        return removed
+
+    def _downsample(self, lo: int, hi: int, bucket: int) -> int:
+        # Kova başına birden çok (ya da kova başında olmayan) satırı tek ortalamaya indir
+        self.conn.execute("DROP TABLE IF EXISTS temp.history_agg")
+        self.conn.execute(
+            "CREATE TEMP TABLE history_agg AS"
+            " SELECT mh_id, currency, (ts / ?) * ? AS b,"
+            "        CAST(ROUND(AVG(low)) AS INTEGER) AS low,"
+            "        CAST(ROUND(AVG(median)) AS INTEGER) AS median"
+            " FROM price_history WHERE ts >= ? AND ts < ?"
+            " GROUP BY mh_id, currency, b"
+            " HAVING COUNT(*) > 1 OR MIN(ts) != b",
+            (bucket, bucket, lo, hi),
+        )
+        cur = self.conn.execute(
+            "DELETE FROM price_history WHERE ts >= ? AND ts < ?"
+            " AND (mh_id, currency, (ts / ?) * ?) IN (SELECT mh_id, currency, b FROM temp.history_agg)",
+            (lo, hi, bucket, bucket),
+        )
+        removed = cur.rowcount
+        cur = self.conn.execute(
+            "INSERT OR REPLACE INTO price_history (mh_id, currency, ts, low, median)"
+            " SELECT mh_id, currency, b, low, median FROM temp.history_agg"
+        )
+        removed -= cur.rowcount
+        self.conn.execute("DROP TABLE temp.history_agg")
+        return removed
+
+
+class PriceCache:
+    """market_hash_name + para birimi anahtarlı, uç nokta bazlı TTL'li kalıcı önbellek.
+
+    Süresi dolmuş kayıtlar da döner (fresh=False); arayan taraf bunları hemen
+    gösterip arka planda yeniler (stale-while-revalidate). Aynı dosyada
+    item_nameid indeksi (.nameids) ve fiyat geçmişi (.history) tutulur.
+    """
+    def __init__(self, path: Optional[str] = None, ttls: Optional[dict] = None):
+        if path is None:
+            try:
+                path = os.path.join(user_data_dir(), "price_cache.sqlite3")
+            except Exception:
+                path = ":memory:"
+        self.path = path
+        self.ttls = dict(CACHE_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.lock = threading.Lock()
+        try:
+            self.conn = sqlite3.connect(path, check_same_thread=False)
+        except sqlite3.Error:
+            self.path = ":memory:"
+            self.conn = sqlite3.connect(":memory:", check_same_thread=False)
+        with self.lock:
+            try:
+                self.conn.execute("PRAGMA journal_mode=WAL")
+                self.conn.execute("PRAGMA synchronous=NORMAL")
+            except sqlite3.Error:
+                pass
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS price_cache ("
+                " endpoint TEXT NOT NULL,"
+                " mh TEXT NOT NULL,"
+                " currency INTEGER NOT NULL,"
+                " value TEXT,"
+                " fetched_at REAL NOT NULL,"
+                " PRIMARY KEY (endpoint, mh, currency)"
+                ") WITHOUT ROWID"
+            )
+            self.conn.commit()
+        self.nameids = NameIdIndex(self.conn, self.lock)
+        self.history = PriceHistory(self.conn, self.lock)
+        try:
+            self.history.maybe_compact()
+        except sqlite3.Error as e:
+            print("History compaction error:", e, file=sys.stderr)
+
+    def is_fresh(self, endpoint: str, fetched_at: float) -> bool:
+        ttl = self.ttls.get(endpoint, 0)
+        if ttl is None:
+            return True
+        return (time.time() - fetched_at) < ttl
+
+    def get(self, endpoint: str, mh: str, currency: int = 1) -> Optional[CacheEntry]:
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT value, fetched_at FROM price_cache WHERE endpoint=? AND mh=? AND currency=?",
+                (endpoint, mh, int(currency)),
+            ).fetchone()
+        if not row:
+            return None
+        try:
+            value = json.loads(row[0]) if row[0] is not None else None
+        except ValueError:
+            return None
+        return CacheEntry(value, float(row[1]), self.is_fresh(endpoint, float(row[1])))
+
+    def put(self, endpoint: str, mh: str, currency: int, value, fetched_at: Optional[float] = None):
+        ts = time.time() if fetched_at is None else float(fetched_at)
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO price_cache (endpoint, mh, currency, value, fetched_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (endpoint, mh, int(currency), json.dumps(value), ts),
+            )
+            self.conn.commit()
+
+    def purge(self, older_than: float):
+        """fetched_at'i verilen andan eski olan (TTL'li) kayıtları sil."""
+        with self.lock:
+            self.conn.execute(
+                "DELETE FROM price_cache WHERE fetched_at < ?",
+                (float(older_than),),
+            )
+            self.conn.commit()
+
+    def close(self):
+        with self.lock:
+            try:
+                self.conn.close()
+            except sqlite3.Error:
+                pass
+
+
+# -------------------- Disk görsel önbelleği --------------------
+class ImageCache:
+    """URL anahtarlı, içerik adresli (sha1) disk önbelleği.
+
+    Küçültülmüş görsel baytları <kök>/ab/abcdef….png olarak saklanır; aynı
+    liste yeniden açıldığında görseller ağdan değil diskten gelir. Yazma
+    atomiktir (geçici dosya + os.replace), eşzamanlı okuyucular yarım dosya görmez.
+    """
+    def __init__(self, root: Optional[str] = None):
+        if root is None:
+            try:
+                root = os.path.join(user_data_dir(), "images")
+            except Exception:
+                root = None
+        self.root = root
+        if root:
+            try:
+                os.makedirs(root, exist_ok=True)
+            except OSError:
+                self.root = None
+
+    @staticmethod
+    def key(url: str, variant: str = "") -> str:
+        return hashlib.sha1(f"{url}|{variant}".encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], key + ".png")
+
+    def get(self, url: str, variant: str = "") -> Optional[bytes]:
+        if not self.root or not url:
+            return None
+        try:
+            with open(self._path(self.key(url, variant)), "rb") as f:
+                return f.read() or None
+        except OSError:
+            return None
+
+    def put(self, url: str, data: bytes, variant: str = "") -> None:
+        if not self.root or not url or not data:
+            return
+        path = self._path(self.key(url, variant))
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
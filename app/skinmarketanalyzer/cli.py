@@ -0,0 +1,183 @@
+# cli.py — komut satırı / başsız (Qt'siz) toplu fiyat çekme
+
+from typing import Optional
+import sys, json, time, argparse, threading
+
+from .fetch import FETCH_ENGINES, FETCH_MODES, FETCH_PRIORITIES
+
+
+def _open_out(path: str, append: bool = False):
+    """Çıktı dosyası; varsayılan olarak üzerine yazılır (--append: sona eklenir)."""
+    if path == "-":
+        return sys.stdout
+    return open(path, "a" if append else "w", encoding="utf-8")
+
+
+def cmd_fetch(args) -> int:
+    """items.json → JSON Lines: her sonuç geldiği anda bir satır yazılır (--watch: her değişimde)."""
+    from .cache import PriceCache
+    from .fetch import make_fetcher
+    from .items import ItemStore, iter_items, iter_items_file
+
+    try:
+        # Akışla okunur: çok büyük dökümler de tüm metin belleğe alınmadan işlenir
+        src = iter_items(sys.stdin) if args.items == "-" else iter_items_file(args.items)
+        items = ItemStore.from_raw(src)
+    except Exception as e:
+        print(f"JSON okunamadı/uyarlanamadı: {e}", file=sys.stderr)
+        return 2
+
+    cache = PriceCache(":memory:" if args.no_cache else args.cache)
+    out = _open_out(args.out, args.append)
+    lock = threading.Lock()
+    orders: dict[str, dict] = {}
+
+    def on_orders(key, highest_buy, sell_count, buy_count):
+        # Çekici aynı anahtarın on_progress'inden hemen önce çağırır; kayda eklenir
+        with lock:
+            orders[key] = {"highest_buy": highest_buy, "sell_listings": sell_count,
+                           "buy_orders": buy_count}
+
+    def on_progress(key, market_low, median):
+        rec = {"market_hash_name": key, "market_low": market_low,
+               "median": median, "ts": round(time.time(), 3)}
+        with lock:
+            rec.update(orders.pop(key, ()))
+            out.write(json.dumps(rec, ensure_ascii=False) + "\n")
+            out.flush()
+
+    fetcher = make_fetcher(args.engine, items, args.currency, args.workers, args.rps,
+                           cache=cache, adaptive=not args.fixed_rate,
+                           priority=args.priority, mode=args.mode, watch=args.watch,
+                           on_progress=on_progress, on_orders=on_orders)
+    # Çekici ayrı thread'de: Ctrl+C ana thread'e düşer ve stop() ile temiz kapanır
+    t = threading.Thread(target=fetcher.run, name="price-fetcher", daemon=True)
+    t.start()
+    try:
+        while t.is_alive():
+            t.join(0.2)
+    except KeyboardInterrupt:
+        fetcher.stop()
+        t.join()
+        return 130
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        cache.close()
+        if args.metrics:
+            try:
+                fetcher.metrics.export(args.metrics)
+            except OSError as e:
+                print(f"Metrikler yazılamadı: {e}", file=sys.stderr)
+    return 0
+
+
+def cmd_links(args) -> int:
+    """items.json → JSON Lines: her item için Pricempire linki (--missing: üretilemeyenler)."""
+    from .items import ItemStore, iter_items, iter_items_file
+
+    try:
+        src = iter_items(sys.stdin) if args.items == "-" else iter_items_file(args.items)
+        items = ItemStore.from_raw(src)
+    except Exception as e:
+        print(f"JSON okunamadı/uyarlanamadı: {e}", file=sys.stderr)
+        return 2
+
+    t0 = time.perf_counter()
+    urls = items.pricempire_urls()
+    elapsed = time.perf_counter() - t0
+    out = _open_out(args.out, args.append)
+    missing = 0
+    try:
+        for name, quality, url in zip(items.names, items.qualities, urls):
+            missing += url is None
+            if args.missing and url is not None:
+                continue
+            out.write(json.dumps({"name": name, "quality": quality, "pricempire_url": url},
+                                 ensure_ascii=False) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(f"[LINKS] {len(urls)} item, {missing} link üretilemedi, {elapsed * 1000:.0f} ms", file=sys.stderr)
+    return 0
+
+
+def cmd_history(args) -> int:
+    """Fiyat geçmişi sorguları: bir item'ın serisi ya da son N saatte düşenler (JSON Lines)."""
+    from .cache import PriceCache
+
+    cache = PriceCache(args.cache)
+    try:
+        if args.drops is not None:
+            for mh, old, new, change in cache.history.drops(args.currency, args.drops, args.hours):
+                print(json.dumps({"market_hash_name": mh, "low_before": old, "low_now": new,
+                                  "change_pct": round(change, 2)}, ensure_ascii=False))
+            return 0
+        if not args.name:
+            print("Item adı (market_hash_name) ya da --drops gerekli.", file=sys.stderr)
+            return 2
+        for ts, low, median in cache.history.series(args.name, args.currency, hours=args.hours):
+            print(json.dumps({"ts": ts, "market_low": low, "median": median}))
+        return 0
+    finally:
+        cache.close()
+
+
+def cmd_gui(args) -> int:
+    from .gui import main as gui_main
+    gui_main()
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(prog="skinmarketanalyzer",
+                                description="CS2 item'ları için Steam Market fiyat takibi.")
+    sub = p.add_subparsers(dest="command")
+
+    sub.add_parser("gui", help="Masaüstü arayüzünü aç (varsayılan)")
+
+    f = sub.add_parser("fetch", help="Qt açmadan fiyatları çek, JSON Lines olarak yaz")
+    f.add_argument("items", help="items.json (liste, {\"items\": [...]} veya JSON Lines); '-' = stdin")
+    f.add_argument("--out", "-o", default="-", help="Çıktı .jsonl dosyası (varsayılan: stdout)")
+    f.add_argument("--append", action="store_true", help="--out dosyasının üzerine yazma, sonuna ekle")
+    f.add_argument("--currency", type=int, default=1, help="Steam para birimi kodu (1 = USD)")
+    f.add_argument("--engine", choices=list(FETCH_ENGINES), default="threads")
+    f.add_argument("--workers", type=int, default=4)
+    f.add_argument("--priority", choices=list(FETCH_PRIORITIES), default="profit",
+                   help="Çekme sırası: bilinen kâr oranı, site fiyatı, önbellek yaşı veya liste sırası")
+    f.add_argument("--mode", choices=list(FETCH_MODES), default="overview",
+                   help="histogram: name id'si bilinen item başına tek istek (alış emri ve derinlik dahil)")
+    f.add_argument("--rps", type=float, default=1.8, help="Başlangıç istek/sn")
+    f.add_argument("--fixed-rate", action="store_true", help="Uyarlanabilir hızı kapat")
+    f.add_argument("--watch", action="store_true",
+                   help="Ctrl+C'ye dek sürekli yenile; yalnız değişen fiyatlar yazılır")
+    f.add_argument("--cache", default=None, help="Önbellek dosyası (varsayılan: kullanıcı veri klasörü)")
+    f.add_argument("--no-cache", action="store_true", help="Kalıcı önbelleği kullanma")
+    f.add_argument("--metrics", default=None, metavar="PATH",
+                   help="Bitişte istek metriklerini yaz (.prom/.txt → Prometheus metni, diğerleri → JSON)")
+
+    k = sub.add_parser("links", help="Item listesinin Pricempire linklerini üret / doğrula (JSON Lines)")
+    k.add_argument("items", help="items.json (liste, {\"items\": [...]} veya JSON Lines); '-' = stdin")
+    k.add_argument("--out", "-o", default="-", help="Çıktı .jsonl dosyası (varsayılan: stdout)")
+    k.add_argument("--append", action="store_true", help="--out dosyasının üzerine yazma, sonuna ekle")
+    k.add_argument("--missing", action="store_true", help="Yalnız link üretilemeyen item'ları yaz")
+
+    h = sub.add_parser("history", help="Kayıtlı fiyat geçmişini sorgula")
+    h.add_argument("name", nargs="?", help="market_hash_name (ör. \"AK-47 | Redline (Field-Tested)\")")
+    h.add_argument("--hours", type=float, default=24.0, help="Geriye bakılacak saat (varsayılan 24)")
+    h.add_argument("--drops", type=float, default=None, metavar="PCT",
+                   help="Son --hours içinde low'u en az PCT yüzde düşen item'ları listele")
+    h.add_argument("--currency", type=int, default=1)
+    h.add_argument("--cache", default=None, help="Önbellek dosyası (varsayılan: kullanıcı veri klasörü)")
+    return p
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.command == "fetch":
+        return cmd_fetch(args)
+    if args.command == "links":
+        return cmd_links(args)
+    if args.command == "history":
+        return cmd_history(args)
+    return cmd_gui(args)
@@ -0,0 +1,555 @@
+# fetch.py — fiyat çekme motorları (thread havuzu / asyncio)
+
+from typing import Callable, Optional
+import sys, time, heapq, random, threading, importlib.util
+
+from .cache import PriceCache
+from .items import ItemStore
+from .metrics import FetchMetrics, summary_line
+from .names import build_market_hash_name, parse_money_to_float
+from .ratelimit import AimdRateController, TokenBucket
+from .steam import (
+    histogram_url, listing_url, parse_nameid, parse_order_histogram, priceoverview_url,
+    shared_sessions,
+)
+
+
+# -------------------- Çekme motorları --------------------
+FETCH_ENGINES = {
+    "threads": "Thread havuzu",
+    "async": "Asenkron (aiohttp)",
+}
+
+
+# İstek stratejisi: "histogram" name id'si bilinen item'larda priceoverview'u atlar
+FETCH_MODES = {
+    "overview": "priceoverview (+ histogram yedeği)",
+    "histogram": "Yalnız histogram (name id bilinenler)",
+}
+
+
+def aiohttp_available() -> bool:
+    """aiohttp'yi içe aktarmadan kurulu olup olmadığına bak."""
+    return importlib.util.find_spec("aiohttp") is not None
+
+
+def fetch_keys(items) -> tuple[list[str], dict[str, str]]:
+    """ItemStore ya da normalize edilmiş dict listesinden (tekil market_hash_name'ler, {mh: nameid}).
+
+    Aynı skin listede birden çok kez (farklı site fiyatlarıyla) geçebilir; her
+    anahtar bir kez çekilir, sonuç (on_progress) anahtar başına bir kez
+    yayınlanır ve eşleşen tüm satırlara arayan taraf dağıtır. nameid mh'nin
+    fonksiyonu olduğundan histogram istekleri de böylece tekilleşir.
+    """
+    if isinstance(items, ItemStore):
+        pairs = zip(items.keys, items.nameids)
+    else:
+        pairs = []
+        for it in items:
+            raw = it.get("_raw") if isinstance(it.get("_raw"), dict) else {}
+            pairs.append((build_market_hash_name(it), raw.get("nameid") or ""))
+    keys: dict[str, None] = {}
+    seed: dict[str, str] = {}
+    for mh, nid in pairs:
+        if not mh:
+            continue
+        keys[mh] = None
+        if nid and mh not in seed:
+            seed[mh] = nid
+    return list(keys), seed
+
+
+# -------------------- Öncelikli çekme kuyruğu --------------------
+# Skor büyük olan önce çekilir; eşitlikte liste sırası korunur.
+FETCH_PRIORITIES = {
+    "profit": "Bilinen kâr oranı",
+    "site_price": "Site fiyatı",
+    "stale": "En eski önbellek",
+    "order": "Liste sırası",
+}
+
+
+def site_prices_by_key(items) -> dict[str, tuple[float, float]]:
+    """mh → (en düşük, en yüksek) site fiyatı; fiyatı olmayan anahtarlar yer almaz."""
+    if isinstance(items, ItemStore):
+        pairs = zip(items.keys, items.site)
+    else:
+        pairs = ((build_market_hash_name(it), parse_money_to_float(it.get("site_price")))
+                 for it in items)
+    out: dict[str, tuple[float, float]] = {}
+    for mh, s in pairs:
+        if s is None or s != s or s <= 0:
+            continue
+        lo_hi = out.get(mh)
+        out[mh] = (s, s) if lo_hi is None else (min(lo_hi[0], s), max(lo_hi[1], s))
+    return out
+
+
+class FetchQueue:
+    """Çekilecek anahtarlar için thread güvenli öncelik kuyruğu.
+
+    Önce öne alınmış (ör. ekranda görünen) anahtarlar, sonra skoru yüksek
+    olanlar gelir. İşçiler bir anahtarı ancak boşaldıklarında aldığından
+    prioritize() çalışma sırasında da etkilidir; eski heap girdileri tembel
+    olarak atlanır.
+    """
+    def __init__(self, keys, scores: Optional[dict] = None):
+        self._lock = threading.Lock()
+        self._seq: dict[str, int] = {}
+        self._scores: dict[str, float] = {}     # yalnız henüz alınmamış anahtarlar
+        self._boost: set[str] = set()
+        for n, key in enumerate(keys):
+            s = scores.get(key, 0.0) if scores else 0.0
+            self._seq[key] = n
+            self._scores[key] = s if s == s else float("-inf")
+        self._heap = [self._entry(k) for k in self._scores]
+        heapq.heapify(self._heap)
+
+    def _entry(self, key: str):
+        return (0 if key in self._boost else 1, -self._scores[key], self._seq[key], key)
+
+    def __len__(self):
+        return len(self._scores)
+
+    def pop(self) -> Optional[str]:
+        with self._lock:
+            while self._heap:
+                entry = heapq.heappop(self._heap)
+                key = entry[3]
+                if key in self._scores and entry == self._entry(key):
+                    del self._scores[key]
+                    self._boost.discard(key)
+                    return key
+        return None
+
+    def prioritize(self, keys) -> None:
+        """Verilen anahtarları öne al; önceki öne alınanlar normal sıraya döner."""
+        with self._lock:
+            new = {k for k in keys if k in self._scores}
+            changed = new ^ self._boost
+            self._boost = new
+            for key in changed:
+                heapq.heappush(self._heap, self._entry(key))
+            self._compact()
+
+    def set_scores(self, scores: dict) -> None:
+        with self._lock:
+            for key, s in scores.items():
+                if key in self._scores:
+                    self._scores[key] = s if s == s else float("-inf")
+                    heapq.heappush(self._heap, self._entry(key))
+            self._compact()
+
+    def _compact(self):
+        # Sık kaydırmada biriken eski girdiler heap'i şişirmesin
+        if len(self._heap) > 4 * len(self._scores) + 1024:
+            self._heap = [self._entry(k) for k in self._scores]
+            heapq.heapify(self._heap)
+
+
+# -------------------- Fiyat çekme (yalnız pazar fiyatı) --------------------
+def histogram_summary(value) -> Optional[dict]:
+    """Önbellekteki histogram değerini parse_order_histogram biçimine getir.
+
+    Eski kayıtlar yalnız lowest_sell_order (float/None) tutar.
+    """
+    if value is None or isinstance(value, dict):
+        return value
+    return {"sell": value, "buy": None, "sell_count": 0, "buy_count": 0}
+
+
+class PriceFetcher:
+    """Qt'siz fiyat çekici: thread havuzu + global token bucket.
+
+    Sonuçlar geldikçe on_progress(key, market_low, median) çağrılır; GUI'de
+    PriceFetchWorker, komut satırında cli.fetch bunu sarar. Anahtarlar
+    FetchQueue'dan `priority` skoruna göre alınır; prioritize() ile çalışırken
+    öne alınabilir. Histogram verisi olan item'lar için aynı anahtarın
+    on_progress'inden hemen önce on_orders(key, highest_buy, sell_count,
+    buy_count) çağrılır; sonuç yayınlanmazsa alış verisi de atılır.
+    """
+    def __init__(self, items, currency: int, max_workers: int, rps: float,
+                 cache: Optional[PriceCache] = None, adaptive: bool = True,
+                 priority: str = "profit", mode: str = "overview",
+                 on_progress: Optional[Callable[[str, float, float], None]] = None,
+                 on_rate_change: Optional[Callable[[float], None]] = None,
+                 on_orders: Optional[Callable[[str, float, int, int], None]] = None,
+                 metrics: Optional[FetchMetrics] = None):
+        self.on_progress = on_progress
+        self.on_orders = on_orders
+        self.metrics = metrics if metrics is not None else FetchMetrics()
+        self.bucket = TokenBucket(rate=max(0.4, float(rps)), burst=3)
+        self.rate_ctl = AimdRateController(self.bucket, enabled=adaptive,
+                                           on_change=on_rate_change)
+        self._mini_delay_overview = (0.15, 0.25)
+        self._mini_delay_listing  = (0.20, 0.30)
+        self._mini_delay_hist     = (0.20, 0.30)
+
+        self.items = items
+        self.keys, self._nameid_seed = fetch_keys(items)
+        self.currency = currency
+        self.max_workers = max_workers
+        self.priority = priority if priority in FETCH_PRIORITIES else "profit"
+        self.mode = mode if mode in FETCH_MODES else "overview"
+        self.queue: Optional[FetchQueue] = None
+        self._boost: list[str] = []
+        self._shown_stale: set[str] = set()     # bayat önbellek değeri yayınlanmış, yenilenecek anahtarlar
+        self._orders: dict[str, dict] = {}      # sonucuyla birlikte yayınlanacak histogram özeti
+        self.force_refresh = False  # True → taze önbellek kaydı da ağdan yenilenir (izleme modu)
+        self._stop = False
+
+        # Kalıcı önbellek verilmezse yalnız bu çalıştırmaya ait bellek içi önbellek
+        self.cache = cache if cache is not None else PriceCache(":memory:")
+
+        self.session = self._open_session()
+
+    def _open_session(self):
+        # Uygulama ömrü boyunca paylaşılan oturum: bağlantılar çalıştırmalar arasında sıcak kalır
+        return shared_sessions().session(pool_size=self.max_workers)
+
+    def stop(self):
+        self._stop = True
+        self.bucket.cancel()
+
+    def prioritize(self, keys) -> None:
+        """Bu anahtarları (ör. ekrandaki satırlar) sıradaki ilk istekler yap; thread güvenli."""
+        self._boost = list(keys)
+        if self.queue is not None:
+            self.queue.prioritize(self._boost)
+
+    def _emit(self, key: str, market_low: float, median: float):
+        hist = self._orders.pop(key, None)
+        if hist is not None:
+            self.on_orders(key, float(hist.get("buy") or 0.0),
+                           int(hist.get("sell_count") or 0), int(hist.get("buy_count") or 0))
+        if self.on_progress is not None:
+            self.on_progress(key, market_low, median)
+
+    def _emit_result(self, key: str, market_low: float, median: float):
+        """Ağ sonucunu yayınla; bayat değeri gösterilmiş anahtarın yenilemesi fiyatsız
+        döndüyse (hata, boş yanıt) yayınlanmaz, gösterilen önbellek fiyatı korunur."""
+        self.metrics.item(market_low > 0)
+        if market_low <= 0 and key in self._shown_stale:
+            self._orders.pop(key, None)
+            return
+        self._emit(key, market_low, median)
+
+    def _emit_orders(self, key: str, hist: Optional[dict]):
+        """Histogram özetini anahtarın sıradaki _emit'ine ekle (on_orders oradan çağrılır)."""
+        if self.on_orders is not None and hist:
+            self._orders[key] = hist
+
+    def _should_stop(self):
+        return self._stop
+
+    def _cached_median(self, mh: str) -> float:
+        po = self.cache.get("priceoverview", mh, self.currency)
+        return float(((po.value or [None, None])[1] if po is not None else None) or 0.0)
+
+    def _cached_result(self, mh: str):
+        """Ağa çıkmadan önbellekten (market_low, median, fresh, fetched_at) üret; kayıt yoksa None."""
+        nameid = self.cache.nameids.get(mh)
+        hist = self.cache.get("histogram", mh, self.currency) if nameid else None
+        if self.mode == "histogram" and nameid:
+            sell = (histogram_summary(hist.value) or {}).get("sell") if hist is not None else None
+            if not sell:
+                # Geçmişteki fiyat gösterilir ama histogram (alış emri) için yine de çekilir
+                last = self._history_result(mh)
+                return (last[0], last[1], False, last[3]) if last else None
+            return (float(sell), self._cached_median(mh), hist.fresh, hist.fetched_at)
+        po = self.cache.get("priceoverview", mh, self.currency)
+        if po is None:
+            return self._history_result(mh)
+        lp, mp = (po.value or [None, None])[:2]
+        fresh = po.fresh
+        lso = None
+        if lp in (None, 0):
+            if hist is None:
+                return None
+            lso = (histogram_summary(hist.value) or {}).get("sell")
+            fresh = fresh and hist.fresh
+        market_low = float(lp if lp not in (None, 0) else (lso or 0.0))
+        if market_low <= 0:
+            return None
+        return (market_low, float(mp or 0.0), fresh, po.fetched_at)
+
+    def _history_result(self, mh: str):
+        """Önbellekte kayıt yoksa fiyat geçmişindeki son gözlemi kullan (sıcak açılış)."""
+        last = self.cache.history.latest(mh, self.currency)
+        if last is None or not last[1]:
+            return None
+        ts, low, median = last
+        return (low, median or 0.0, self.cache.is_fresh("priceoverview", ts), float(ts))
+
+    def _record_history(self, mh: str, market_low: float, median: float):
+        if market_low <= 0:
+            return
+        try:
+            self.cache.history.record(mh, self.currency, market_low, median)
+        except Exception as e:
+            self.metrics.error("history", e)
+            print("History write error:", e, file=sys.stderr)
+
+    def _cache_get(self, endpoint: str, mh: str):
+        """Önbellek bakışı + hit/stale/miss metriği."""
+        entry = self.cache.get(endpoint, mh, self.currency)
+        self.metrics.cache(endpoint, "miss" if entry is None else "hit" if entry.fresh else "stale")
+        return entry
+
+    def _get(self, url: str, delay: tuple[float, float], as_json: bool = True,
+             endpoint: str = "priceoverview"):
+        """Token alıp GET; 429/zaman aşımında hızı düşürüp yeniden dener. Başarısızsa None.
+
+        Çağrı başına bir metrik olayı yazılır: son durum, ağda geçen süre, bayt,
+        yeniden deneme, token bucket beklemesi ve istemci tarafı mini gecikme (ayrı).
+        """
+        import requests
+        waited = slept = spent = 0.0
+        status, nbytes, attempt = "cancelled", 0, 0
+        try:
+            for attempt in range(3):
+                t = time.monotonic()
+                if not self.bucket.acquire(1.0, self._should_stop):
+                    status = "cancelled"
+                    return None
+                waited += time.monotonic() - t
+                t = time.monotonic()
+                time.sleep(random.uniform(*delay))
+                slept += time.monotonic() - t
+                t = time.monotonic()
+                try:
+                    r = self.session.get(url, timeout=12)
+                except requests.Timeout:
+                    spent += time.monotonic() - t
+                    status = "timeout"
+                    self.rate_ctl.on_throttle()
+                    continue
+                except Exception:
+                    spent += time.monotonic() - t
+                    status = "error"
+                    raise
+                spent += time.monotonic() - t
+                status = r.status_code
+                nbytes += len(r.content)
+                if r.status_code == 429:
+                    self.metrics.throttle(endpoint)
+                    self.rate_ctl.on_throttle()
+                    continue
+                if not r.ok:
+                    return None
+                self.rate_ctl.on_success()
+                return r.json() if as_json else r.text
+            return None
+        finally:
+            if status != "cancelled" or spent:
+                self.metrics.request(endpoint, status, spent, nbytes, attempt, waited, slept)
+
+    def _cached_histogram(self, mh: str) -> Optional[dict]:
+        hist = self.cache.get("histogram", mh, self.currency) if self.cache.nameids.get(mh) else None
+        return histogram_summary(hist.value) if hist is not None else None
+
+    def _store_histogram(self, mh: str, data) -> Optional[dict]:
+        """Histogram yanıtını ayrıştırıp önbelleğe yaz; geçersiz yanıtta None."""
+        if not isinstance(data, dict) or not data.get("success", True):
+            return None
+        hist = parse_order_histogram(data)
+        self.cache.put("histogram", mh, self.currency, hist)
+        return hist
+
+    def _histogram(self, mh: str, nameid: str):
+        """(özet | None, ağdan geldi mi); taze önbellek kaydı varsa istek atılmaz."""
+        hist = self._cache_get("histogram", mh)
+        if hist is not None and hist.fresh and not self.force_refresh:
+            return histogram_summary(hist.value), False
+        if self._should_stop():
+            return None, False
+        try:
+            data = self._get(histogram_url(nameid, self.currency), self._mini_delay_hist,
+                             endpoint="histogram")
+        except Exception as e:
+            self.metrics.error("histogram", e)
+            return None, False
+        summary = self._store_histogram(mh, data)
+        return summary, summary is not None
+
+    def _fetch_histogram_only(self, mh: str, nameid: str):
+        """Tek istek: lowest_sell_order pazar fiyatı olur, median önbellekteki priceoverview'dan."""
+        hist, fetched = self._histogram(mh, nameid)
+        market_low = float((hist or {}).get("sell") or 0.0)
+        self._emit_orders(mh, hist)
+        if fetched:
+            self._record_history(mh, market_low, 0.0)   # median bu istekte gözlenmedi
+        try:
+            print(f"[PRICE] {mh} -> market_low={market_low:.2f} (histogram)", file=sys.stderr)
+        except Exception:
+            pass    # konsol kodlaması (ör. cp1252'de ™) yazdırmayı bozabilir
+        return (mh, market_low, self._cached_median(mh))
+
+    def _fetch_one(self, mh: str):
+        if self._should_stop():
+            return (mh, 0.0, 0.0)
+        if self.mode == "histogram":
+            nameid = self.cache.nameids.get(mh)
+            if nameid:
+                return self._fetch_histogram_only(mh, nameid)
+
+        lp = mp = None
+        lso = None
+        fetched = False     # ağdan yeni veri geldiyse geçmişe yazılır
+
+        # --- priceoverview ---
+        po = self._cache_get("priceoverview", mh)
+        if po is not None and po.fresh and not self.force_refresh:
+            lp, mp = (po.value or [None, None])[:2]
+        else:
+            try:
+                url = priceoverview_url(mh, self.currency)
+                data = self._get(url, self._mini_delay_overview)
+                if isinstance(data, dict) and not data.get("success", True):
+                    # success:false genelde yumuşak kısıtlama: hızı düşür, bir kez daha dene
+                    self.metrics.reject("priceoverview")
+                    self.rate_ctl.on_throttle()
+                    data = self._get(url, self._mini_delay_overview)
+                if isinstance(data, dict) and data.get("success", True):
+                    lp = parse_money_to_float(data.get("lowest_price"))
+                    mp = parse_money_to_float(data.get("median_price"))
+                    self.cache.put("priceoverview", mh, self.currency, [lp, mp])
+                    fetched = True
+            except Exception as e:
+                self.metrics.error("priceoverview", e)
+        if self._should_stop():
+            return (mh, float(lp or 0.0), float(mp or 0.0))
+
+        # --- fallback: histogram.lowest_sell_order ---
+        if lp is None or lp == 0.0:
+            self.metrics.fallback()
+            nameid = self.cache.nameids.get(mh)
+            self.metrics.cache("nameid", "hit" if nameid else "miss")
+            if not nameid:
+                try:
+                    html = self._get(listing_url(mh), self._mini_delay_listing, as_json=False,
+                                     endpoint="listings")
+                    nameid = parse_nameid(html) if html else None
+                    if nameid:
+                        self.cache.nameids.set(mh, nameid)
+                except Exception as e:
+                    self.metrics.error("listings", e)
+                    nameid = None
+
+            if nameid:
+                hist, got = self._histogram(mh, nameid)
+                lso = (hist or {}).get("sell")
+                fetched = fetched or got
+                self._emit_orders(mh, hist)
+
+        market_low = float(lp if lp not in (None, 0) else (lso or 0.0))
+        median = float(mp or 0.0)
+        if fetched:
+            self._record_history(mh, market_low, median)
+
+        try:
+            print(f"[PRICE] {mh} -> market_low={market_low:.2f}", file=sys.stderr)
+        except Exception:
+            pass    # konsol kodlaması (ör. cp1252'de ™) yazdırmayı bozabilir
+
+        return (mh, market_low, median)
+
+    def _score(self, mh: str, cached, sites: dict, now: float) -> float:
+        mode = self.priority
+        if mode == "site_price":
+            return sites.get(mh, (0.0, 0.0))[1]
+        if mode == "stale":
+            return float("inf") if cached is None else now - cached[3]
+        if mode == "profit":
+            lo = sites.get(mh, (0.0, 0.0))[0]
+            if cached is None or lo <= 0:
+                return 0.0      # bilinmiyor: kârlı bilinenlerden sonra, zararlılardan önce
+            return (cached[0] - lo) / lo * 100.0
+        return 0.0
+
+    def sites_for_priority(self) -> dict:
+        if self.priority in ("profit", "site_price"):
+            return site_prices_by_key(self.items)
+        return {}
+
+    def _build_queue(self) -> FetchQueue:
+        """Name id tohumla, önbellekteki sonuçları yayınla; ağdan çekilecekleri kuyrukla."""
+        # JSON'da gelen item_nameid'leri indekse ekle (listings isteğine gerek kalmaz)
+        if self._nameid_seed:
+            self.cache.nameids.update(self._nameid_seed)
+
+        # Önbellek turu: taze kayıtlar ağsız dolar, bayat olanlar hemen gösterilip yenilenir
+        pending, scores = [], {}
+        self._shown_stale = set()
+        sites = self.sites_for_priority()
+        now = time.time()
+        for mh in self.keys:
+            cached = None
+            try:
+                cached = self._cached_result(mh)
+            except Exception as e:
+                self.metrics.error("cache", e)
+                print("Cache read error:", e, file=sys.stderr)
+            self.metrics.cache("result", "miss" if cached is None else "hit" if cached[2] else "stale")
+            if cached is not None:
+                market_low, median, fresh, _ = cached
+                if self.on_orders is not None:
+                    self._emit_orders(mh, self._cached_histogram(mh))
+                self._emit(mh, market_low, median)
+                if fresh:
+                    continue
+                self._shown_stale.add(mh)
+            pending.append(mh)
+            scores[mh] = self._score(mh, cached, sites, now)
+        self.queue = FetchQueue(pending, scores)
+        if self._boost:
+            self.queue.prioritize(self._boost)
+        return self.queue
+
+    def _worker(self, queue: FetchQueue):
+        while not self._should_stop():
+            mh = queue.pop()
+            if mh is None:
+                return
+            try:
+                key, market_low, median = self._fetch_one(mh)
+            except Exception as e:
+                self.metrics.error("worker", e)
+                print("Fetch worker error:", e, file=sys.stderr)
+                self._orders.pop(mh, None)
+                continue
+            if self._should_stop():
+                return
+            self._emit_result(key, market_low, median)
+
+    def run(self):
+        from concurrent.futures import ThreadPoolExecutor
+        try:
+            queue = self._build_queue()
+            self.metrics.start(len(queue))
+            if not queue or self._should_stop():
+                return
+            # Her işçi boşaldıkça kuyruktan en öncelikli anahtarı alır
+            n = max(1, min(int(self.max_workers), len(queue)))
+            with ThreadPoolExecutor(max_workers=n) as ex:
+                for fut in [ex.submit(self._worker, queue) for _ in range(n)]:
+                    fut.result()
+        finally:
+            print("[RATE]", self.bucket.stats(), file=sys.stderr)
+            print("[HTTP]", shared_sessions().stats(), file=sys.stderr)
+            print("[METRICS]", summary_line(self.metrics), file=sys.stderr)
+
+def make_fetcher(engine: str, items, currency: int, max_workers: int, rps: float,
+                 watch: bool = False, **kwargs) -> PriceFetcher:
+    """FETCH_ENGINES anahtarına göre çekici oluştur ("async" aiohttp yoksa thread'e düşer).
+
+    watch=True → durdurulana dek yenileyen PriceWatcher (thread motoru; izleme
+    isteği bütçe ile sınırlı olduğundan asenkron motora gerek yok).
+    """
+    if watch:
+        from .watch import PriceWatcher
+        return PriceWatcher(items, currency, max_workers=max_workers, rps=rps, **kwargs)
+    if engine == "async" and aiohttp_available():
+        from .aiofetch import AsyncPriceFetcher
+        return AsyncPriceFetcher(items, currency, rps=rps, **kwargs)
+    return PriceFetcher(items, currency, max_workers=max_workers, rps=rps, **kwargs)
@@ -0,0 +1,2121 @@
+# gui.py — PySide6 arayüzü (MainWindow, tablo, görsel yükleyici)
+
+from typing import Optional
+from collections import OrderedDict
+import io, os, sys, json, heapq, threading, webbrowser
+
+from PySide6.QtCore import (
+    Qt, QPoint, QRect, QSize, QUrl, QObject, Signal, Slot, QBuffer, QByteArray, QThread,
+    QAbstractTableModel, QModelIndex, QRunnable, QThreadPool, QTimer
+)
+from PySide6.QtGui import (
+    QPalette, QColor, QIcon, QAction, QPixmap, QImageReader, QPen
+)
+from PySide6.QtWidgets import (
+    QApplication, QWidget, QHBoxLayout, QVBoxLayout, QSplitter, QTextEdit,
+    QPushButton, QTableView, QStyledItemDelegate, QLabel, QFileDialog,
+    QHeaderView, QToolBar, QMessageBox, QLineEdit, QFrame, QAbstractItemView,
+    QSpinBox, QDoubleSpinBox, QFormLayout , QMenu, QToolButton,   # <-- eklendi
+    QComboBox, QCheckBox, QTableWidget, QTableWidgetItem
+)
+
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+
+from .cache import ImageCache, PriceCache
+from .fetch import FETCH_ENGINES, FETCH_MODES, FETCH_PRIORITIES, aiohttp_available, make_fetcher
+from .metrics import FetchMetrics, diagnose
+from .items import NAN, ItemStore, iter_batches, iter_items, iter_items_file
+from .names import pricempire_url_for
+from .search import SearchIndex, parse_query
+from .steam import shared_sessions
+
+
+# -------------------- Genel sabitler --------------------
+COLUMNS = [
+    "Görsel", "İsim", "Kalite", "Site Fiyatı", "Pazar Fiyatı",
+    "Sipariş Fiyatı", "Kâr Oranı (%)", "Kâr Miktarı"
+]
+FILTER_DEBOUNCE_MS = 150    # filtre kutusunda yazma bu kadar duraklayınca uygulanır
+
+# UI modes
+UI_MODES = {
+    "dark": "Karanlık",
+    "light": "Aydınlık",
+    "grad_dark": "Mor",
+    "grad_light": "Gradyan (Açık)",
+    "asimov": "Asiimov"
+}
+
+
+PLACEHOLDER_JSON = """{
+  "items": [
+    {
+      "id": 939,
+      "name": "FAMAS | Hexane (Minimal Wear)",
+      "sell_price": 3.85,
+      "image_url": "https%3A%2F%2Fcommunity.akamai.steamstatic.com%2Feconomy%2Fimage%2F-9a81dlWLwJ2UUGcVs_nsVtzdOEdtWwKGZZLQHTxDZ7I56KU0Zwwo4NUX4oFJZEHLbXH5ApeO4YmlhxYQknCRvCo04DEVlxkKgposLuoKhRf2-r3czFX6dSzjL-HnvD8J_XXlzIH7ZB02bqZp4rwiwCy_UJvZG7yJYCde1NtaVvWqAK4weq51JW4ot2Xni4H79h_%2F360fx360f",
+      "quality": "Minimal Wear",
+      "color": "#4b69ff",
+      "stattrak": false,
+      "type": "7"
+    },
+    {
+      "id": 3139,
+      "name": "P250 | Steel Disruption (Factory New)",
+      "sell_price": 3.85,
+      "image_url": "https%3A%2F%2Fcommunity.akamai.steamstatic.com%2Feconomy%2Fimage%2F-9a81dlWLwJ2UUGcVs_nsVtzdOEdtWwKGZZLQHTxDZ7I56KU0Zwwo4NUX4oFJZEHLbXH5ApeO4YmlhxYQknCRvCo04DEVlxkKgpopujwezhh3szMdS1D-NizmpOOqOT9P63UhFRd4cJ5nqeV9trw2gbm-Rc5NWvwLYacegZraQyBqVi2kLi80MO4tc-bzSQ3uyl0-z-DyEXRh4R0%2F360fx360f",
+      "quality": "Factory New",
+      "color": "#4b69ff",
+      "stattrak": false,
+      "type": "1"
+    }
+  ]
+}
+"""
+
+def dark_palette():
+    pal = QPalette()
+    pal.setColor(QPalette.Window, QColor(30, 32, 34))
+    pal.setColor(QPalette.WindowText, QColor(220, 220, 220))
+    pal.setColor(QPalette.Base, QColor(24, 26, 27))
+    pal.setColor(QPalette.AlternateBase, QColor(36, 38, 40))
+    pal.setColor(QPalette.ToolTipBase, QColor(220, 220, 220))
+    pal.setColor(QPalette.ToolTipText, QColor(30, 30, 30))
+    pal.setColor(QPalette.Text, QColor(230, 230, 230))
+    pal.setColor(QPalette.Button, QColor(45, 47, 50))
+    pal.setColor(QPalette.ButtonText, QColor(235, 235, 235))
+    pal.setColor(QPalette.BrightText, Qt.red)
+    pal.setColor(QPalette.Highlight, QColor(76, 110, 245))
+    pal.setColor(QPalette.HighlightedText, Qt.white)
+    return pal
+def light_palette():
+    pal = QPalette()
+    pal.setColor(QPalette.Window, QColor("#F5F7FA"))
+    pal.setColor(QPalette.WindowText, QColor("#202124"))
+    pal.setColor(QPalette.Base, QColor("#FFFFFF"))
+    pal.setColor(QPalette.AlternateBase, QColor("#EEF1F5"))
+    pal.setColor(QPalette.ToolTipBase, QColor("#FFFFFF"))
+    pal.setColor(QPalette.ToolTipText, QColor("#202124"))
+    pal.setColor(QPalette.Text, QColor("#202124"))
+    pal.setColor(QPalette.Button, QColor("#FFFFFF"))
+    pal.setColor(QPalette.ButtonText, QColor("#202124"))
+    pal.setColor(QPalette.BrightText, Qt.red)
+    pal.setColor(QPalette.Highlight, QColor("#1769E0"))
+    pal.setColor(QPalette.HighlightedText, Qt.white)
+    return pal
+
+ASIIMOV_ACCENT = "#df7116"
+
+
+# -------------------- Görsel indirme (Qt Network) --------------------
+THUMB_SIZE = QSize(128, 64)
+_THUMB_VARIANT = f"{THUMB_SIZE.width()}x{THUMB_SIZE.height()}"
+THUMB_CACHE_SIZE = 2000     # bellekte tutulan küçük resim sayısı (~32 KB/adet)
+
+
+class ThumbnailLRU:
+    """URL → küçük resim (QPixmap | None) sınırlı LRU.
+
+    Model değişse de (yeni içe aktarma) korunur; aynı liste tekrar açıldığında
+    görseller için ne ağ ne çözme işi yapılır.
+    """
+    def __init__(self, capacity: int = THUMB_CACHE_SIZE):
+        self.capacity = capacity
+        self._d: "OrderedDict[str, Optional[QPixmap]]" = OrderedDict()
+
+    def __len__(self):
+        return len(self._d)
+
+    def __contains__(self, url: str):
+        return url in self._d
+
+    def get(self, url: str):
+        pix = self._d.get(url)
+        if url in self._d:
+            self._d.move_to_end(url)
+        return pix
+
+    def put(self, url: str, pix) -> None:
+        self._d[url] = pix
+        self._d.move_to_end(url)
+        while len(self._d) > self.capacity:
+            self._d.popitem(last=False)
+
+
+MAX_IMAGE_DOWNLOADS = 6     # eşzamanlı görsel indirme üst sınırı
+PRIO_VISIBLE = 0            # ekrandaki satır
+PRIO_PREFETCH = 1           # yakında görünecek satır (ön yükleme)
+PREFETCH_SCREENS = 1        # görünür alanın üstünde/altında ön yüklenen ekran sayısı
+
+
+def _decode_thumbnail(data: Optional[bytes], url: str, disk_cache: Optional[ImageCache]):
+    """Ham baytı (ya da disk önbelleğindeki PNG'yi) çöz ve küçült → QImage | None.
+
+    İşçi thread'de çalışır: yalnız QImage kullanılır (QPixmap GUI thread'ine bağlıdır).
+    """
+    from_disk = data is None
+    if from_disk:
+        data = disk_cache.get(url, _THUMB_VARIANT) if disk_cache is not None else None
+        if not data:
+            return None
+    buf = QBuffer()
+    buf.setData(QByteArray(data))
+    buf.open(QBuffer.ReadOnly)
+    img = QImageReader(buf).read()
+    if img.isNull():
+        return None
+    if img.width() > THUMB_SIZE.width() or img.height() > THUMB_SIZE.height():
+        img = img.scaled(THUMB_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    if not from_disk and disk_cache is not None:
+        out = QBuffer()
+        out.open(QBuffer.WriteOnly)
+        if img.save(out, "PNG"):
+            disk_cache.put(url, bytes(out.data()), _THUMB_VARIANT)
+    return img
+
+
+class _DecodeSignals(QObject):
+    done = Signal(str, object, bool)   # url, QImage | None, disk'ten mi
+
+
+class _DecodeTask(QRunnable):
+    def __init__(self, url: str, data: Optional[bytes], disk_cache, signals: _DecodeSignals):
+        super().__init__()
+        self.url = url
+        self.data = data
+        self.disk_cache = disk_cache
+        self.signals = signals
+
+    def run(self):
+        try:
+            img = _decode_thumbnail(self.data, self.url, self.disk_cache)
+        except Exception as e:
+            print("IMG DECODE ERR:", self.url, e, file=sys.stderr)
+            img = None
+        self.signals.done.emit(self.url, img, self.data is None)
+
+
+class ImageLoader(QObject):
+    """Görsel hattı: disk önbelleği → sınırlı indirme kuyruğu → işçi havuzunda çözme.
+
+    GUI thread'i yalnız istek başlatır ve hazır küçük resmi (QPixmap) alır;
+    çözme/küçültme/PNG yazma QThreadPool'da yapılır. Aynı anda en fazla
+    MAX_IMAGE_DOWNLOADS indirme çalışır, bekleyenler önceliğe göre (ekrandaki
+    satırlar önce, aynı öncelikte en son istenen önce) başlatılır.
+    """
+    image_ready = Signal(str, object)  # url, QPixmap | None
+
+    def __init__(self, parent=None, disk_cache: Optional[ImageCache] = None,
+                 max_downloads: int = MAX_IMAGE_DOWNLOADS):
+        super().__init__(parent)
+        self.manager = QNetworkAccessManager(self)
+        self.disk_cache = disk_cache
+        self.max_downloads = max(1, int(max_downloads))
+        self._pending = {}                      # reply → (hop, url)
+        self._queue: list = []                  # heap: (öncelik, -sıra, url)
+        self._queued: dict[str, int] = {}       # kuyruktaki url → güncel öncelik
+        self._busy: set[str] = set()            # diskte/ağda/çözmede olan url'ler
+        self._wanted: dict[str, int] = {}       # disk bakışındaki url → istenen öncelik
+        self._cancelled: set[str] = set()       # iptal edilmiş, sonucu beklenmeyen url'ler
+        self._aborted: set[str] = set()         # cancel() ile indirmesi kesilen url'ler
+        self._revived: dict[str, int] = {}      # kesildikten sonra yeniden istenen url → öncelik
+        self._seq = 0
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max(2, QThreadPool.globalInstance().maxThreadCount() // 2))
+        self._signals = _DecodeSignals(self)
+        self._signals.done.connect(self._on_decoded)
+        try:
+            self.manager.sslErrors.connect(self._on_ssl_errors)
+        except Exception:
+            pass
+
+    def fetch(self, url: str, priority: int = PRIO_VISIBLE):
+        if not url:
+            return
+        if url in self._cancelled:
+            self._cancelled.discard(url)        # iptal edilmişse yeniden canlan
+            if url in self._aborted:
+                self._revived[url] = priority   # kesilen indirme bitince yeniden kuyruğa girer
+        if url in self._busy:
+            if priority < self._wanted.get(url, priority):
+                self._wanted[url] = priority    # disk bakışı sürerken öne alındı
+            return
+        if url in self._queued:
+            if priority <= self._queued[url]:
+                self._push(url, priority)   # öne al / tazele
+            return
+        self._busy.add(url)
+        if self.disk_cache is not None:
+            self._wanted[url] = priority
+            self.pool.start(_DecodeTask(url, None, self.disk_cache, self._signals))
+        else:
+            self._busy.discard(url)
+            self._push(url, priority)
+
+    def _push(self, url: str, priority: int):
+        self._seq += 1
+        self._queued[url] = priority
+        heapq.heappush(self._queue, (priority, -self._seq, url))
+        self._pump()
+
+    def cancel(self, urls):
+        """Artık gerekmeyen url'leri kuyruktan düşür, süren indirmeleri kes."""
+        urls = set(urls)
+        for url in urls:
+            if self._queued.pop(url, None) is None and url in self._busy:
+                self._cancelled.add(url)
+        if self._cancelled:
+            for reply, (_, origin) in list(self._pending.items()):
+                if origin in self._cancelled:
+                    self._aborted.add(origin)
+                    reply.abort()
+
+    def _pump(self):
+        while self._queue and len(self._pending) < self.max_downloads:
+            priority, _, url = heapq.heappop(self._queue)
+            if self._queued.get(url) != priority:
+                continue                    # eski (öne alınmış) kayıt
+            del self._queued[url]
+            self._busy.add(url)
+            self._start_request(QUrl(url), hop=0, origin=url)
+
+    @Slot(str, object, bool)
+    def _on_decoded(self, url: str, img, from_disk: bool):
+        priority = self._wanted.pop(url, PRIO_VISIBLE)
+        if url in self._cancelled:
+            self._cancelled.discard(url)
+            self._busy.discard(url)
+            if img is not None:     # iş zaten bitti; sonucu önbelleğe yine de ver
+                self.image_ready.emit(url, QPixmap.fromImage(img))
+            return
+        if from_disk and img is None:
+            # disk önbelleğinde yok → istendiği öncelikle ağdan indirilecek
+            self._busy.discard(url)
+            self._push(url, priority)
+            return
+        self._busy.discard(url)
+        self.image_ready.emit(url, QPixmap.fromImage(img) if img is not None else None)
+
+    def _start_request(self, qurl: QUrl, hop: int, origin: str):
+        req = QNetworkRequest(qurl)
+        req.setRawHeader(b"User-Agent",
+                         b"Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                         b"(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+        req.setRawHeader(b"Referer", b"https://steamcommunity.com/")
+        req.setRawHeader(b"Accept", b"image/avif,image/webp,image/*,*/*;q=0.8")
+        try:
+            req.setTransferTimeout(15000)
+        except Exception:
+            pass
+        reply = self.manager.get(req)
+        reply.finished.connect(lambda r=reply: self._on_finished(r))
+        self._pending[reply] = (hop, origin)
+
+    @Slot()
+    def _on_finished(self, reply: QNetworkReply):
+        hop, origin = self._pending.get(reply, (None, None))
+        redir = None
+        try:
+            redir = reply.attribute(QNetworkRequest.RedirectionTargetAttribute)
+        except Exception:
+            pass
+        if not redir:
+            try:
+                redir = reply.attribute(QNetworkRequest.RedirectTargetAttribute)
+            except Exception:
+                pass
+        if redir:
+            try:
+                new_url = reply.url().resolved(QUrl(str(redir)))
+                reply.deleteLater()
+                self._pending.pop(reply, None)
+                if hop is not None and hop < 5:
+                    self._start_request(new_url, hop + 1, origin)
+                    return
+            except Exception:
+                pass
+
+        err = reply.error()
+        data = reply.readAll() if err == QNetworkReply.NetworkError.NoError else None
+        reply.deleteLater()
+        self._pending.pop(reply, None)
+        if origin and err == QNetworkReply.NetworkError.OperationCanceledError:
+            self._busy.discard(origin)
+            revived = self._revived.pop(origin, None)
+            if origin in self._aborted:
+                # cancel() ile kesildi: yalnız sonradan yeniden istendiyse kuyruğa döner
+                self._aborted.discard(origin)
+                self._cancelled.discard(origin)
+                if revived is not None:
+                    self._push(origin, revived)
+            else:
+                # setTransferTimeout zaman aşımı: başarısız say (yanıt vermeyen sunucu
+                # ekrandaki diğer görselleri sonsuza dek bekletmesin)
+                self._cancelled.discard(origin)
+                self.image_ready.emit(origin, None)
+            self._pump()
+            return
+        if origin:
+            self._aborted.discard(origin)       # kesilmeden önce bitmiş olabilir
+            self._revived.pop(origin, None)
+            if data is not None and data.size() > 0:
+                # çözme/küçültme işçi havuzunda; url çözme bitene dek meşgul sayılır
+                self.pool.start(_DecodeTask(origin, bytes(data), self.disk_cache, self._signals))
+            else:
+                self._busy.discard(origin)
+                self.image_ready.emit(origin, None)
+        self._pump()
+
+    def _on_ssl_errors(self, reply, errors):
+        for e in errors:
+            print("SSL ERR:", e.errorString())
+
+
+# -------------------- Tablo modeli (sanal, sütun bazlı) --------------------
+SORT_ROLE = Qt.UserRole + 1     # sıralama değeri (sayısal sütunlarda float)
+
+
+FLAG_COLOR = QColor(255, 196, 0, 55)    # kâr eşiğini aşan satırın arka planı
+MAX_ROW_RUNS = 64   # satır ekleme/çıkarma bundan çok parçalıysa tek modelReset daha ucuz
+
+
+def _fmt(v: float) -> str:
+    return "" if v != v else f"{v:.2f}"
+
+
+def _same(a: float, b: float) -> bool:
+    return a == b or (a != a and b != b)
+
+
+def _runs(flags) -> list[tuple[int, int]]:
+    """True olan ardışık konumların [ilk, son] aralıkları."""
+    out, start = [], None
+    for r, f in enumerate(flags):
+        if f and start is None:
+            start = r
+        elif not f and start is not None:
+            out.append((start, r - 1))
+            start = None
+    if start is not None:
+        out.append((start, len(flags) - 1))
+    return out
+
+
+class ItemTableModel(QAbstractTableModel):
+    """ItemStore üzerinde sanal tablo modeli.
+
+    Satır hücresi/widget'ı yaratılmaz; görünüm yalnız ekrandaki satırlar için
+    data() çağırır. Depo sırası (storage index) sabittir; sıralama ve filtre
+    yalnız görünüm sırasını (_order) değiştirir, böylece anahtar → satır
+    eşlemesi sıralamadan sonra da geçerli kalır.
+    """
+    thumbnail_needed = Signal(str, int)     # image url, öncelik
+    thumbnails_cancelled = Signal(list)     # artık beklenmeyen url'ler
+    threshold_crossed = Signal(int)         # kâr oranı eşiğin üstüne çıkan depo indeksi
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.store = ItemStore()
+        self.thumbs = ThumbnailLRU()                 # url → QPixmap | None (görsel yok)
+        self._waiting: dict[str, list[int]] = {}     # yüklenmekte olan url → bekleyen depo indeksleri
+        self._depth: dict[str, tuple[int, int]] = {}  # anahtar → (satış ilanı, alış emri) adedi
+        self._order: list[int] = []      # görünüm satırı → depo indeksi
+        self._pos: list[int] = []        # depo indeksi → görünüm satırı (-1: gizli)
+        self._sorted: list[int] = []     # sıralı tüm depo indeksleri
+        self._sort = (-1, Qt.AscendingOrder)
+        self._filter = ""
+        self._rank_cache: Optional[list[int]] = None
+        self._query = parse_query("")
+        self.search = SearchIndex()      # filtre için önceden hesaplanmış alanlar
+        self.flag_threshold: Optional[float] = None   # kâr oranı (%) eşiği; None → kapalı
+
+    # ---- Qt model arayüzü ----
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._order)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return COLUMNS[section]
+        return None
+
+    def _numeric_column(self, col: int):
+        s = self.store
+        return {3: s.site, 4: s.market, 5: s.order_price, 6: s.ratio, 7: s.profit}.get(col)
+
+    def _numeric(self, col: int, i: int) -> float:
+        column = self._numeric_column(col)
+        return column[i] if column is not None else NAN
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        i = self._order[index.row()]
+        col = index.column()
+        if role == Qt.DisplayRole:
+            if col == 1: return self.store.names[i]
+            if col == 2: return self.store.qualities[i]
+            if col >= 3: return _fmt(self._numeric(col, i))
+            return None
+        if role == SORT_ROLE:
+            if col == 1: return self.store.names[i]
+            if col == 2: return self.store.qualities[i]
+            return self._numeric(col, i)
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignCenter) if col >= 3 else int(Qt.AlignVCenter | Qt.AlignLeft)
+        if role == Qt.ForegroundRole and col in (6, 7):
+            v = self._numeric(col, i)
+            if v != v:
+                return None
+            return QColor(60, 190, 90) if v > 0 else QColor(220, 80, 80) if v < 0 else QColor(220, 220, 220)
+        if role == Qt.BackgroundRole and self._flagged(i):
+            return FLAG_COLOR
+        if role == Qt.ToolTipRole and col == 4:
+            m = self.store.median[i]
+            return f"Median: {m:.2f}" if m == m and m > 0 else None
+        if role == Qt.ToolTipRole and col == 5:
+            depth = self._depth.get(self.store.keys[i])
+            return f"Satış ilanı: {depth[0]}, alış emri: {depth[1]}" if depth else None
+        return None
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self._sort = (column, order)
+        self._sorted = self._sorted_indices()
+        self._rank_cache = None
+        self._update_rows()
+
+    def _update_rows(self):
+        """Görünüm sırasını yeniden hesapla ve Qt model sözleşmesine uygun bildir.
+
+        Satır kümesi aynıysa layoutChanged (seçim korunur). Satır girip çıkıyor
+        ama kalanların göreli sırası değişmiyorsa (akışlı ekleme) ardışık
+        aralıklar halinde beginRemoveRows/beginInsertRows. Diğer durumlarda
+        ya da aralık sayısı MAX_ROW_RUNS'ı aşarsa modelReset.
+        """
+        old, new = self._order, self._filtered_order()
+        in_new = bytearray(len(self.store))
+        for i in new:
+            in_new[i] = 1
+        in_old = bytearray(len(self.store))
+        for i in old:
+            in_old[i] = 1
+        if len(old) == len(new) and all(in_new[i] for i in old):
+            if new != old:
+                self._relayout(new)
+            return
+        if [i for i in old if in_new[i]] == [i for i in new if in_old[i]]:
+            removed = _runs([not in_new[i] for i in old])
+            inserted = _runs([not in_old[i] for i in new])
+            if len(removed) + len(inserted) <= MAX_ROW_RUNS:
+                for first, last in reversed(removed):
+                    self.beginRemoveRows(QModelIndex(), first, last)
+                    del self._order[first:last + 1]
+                    self.endRemoveRows()
+                for first, last in inserted:
+                    self.beginInsertRows(QModelIndex(), first, last)
+                    self._order[first:first] = new[first:last + 1]
+                    self.endInsertRows()
+                self._set_order(new)
+                return
+        self.beginResetModel()
+        self._set_order(new)
+        self.endResetModel()
+
+    def _relayout(self, new: list[int]):
+        """Aynı satırların yeni sırası: kalıcı indeksler (seçim, geçerli hücre) taşınır."""
+        self.layoutAboutToBeChanged.emit()
+        old = self.persistentIndexList()
+        old_storage = [(self._order[ix.row()], ix.column()) for ix in old]
+        self._set_order(new)
+        self.changePersistentIndexList(
+            old, [self.index(self._pos[i], c) if self._pos[i] >= 0 else QModelIndex()
+                  for i, c in old_storage])
+        self.layoutChanged.emit()
+
+    def _sorted_indices(self) -> list[int]:
+        column, order = self._sort
+        idx = list(range(len(self.store)))
+        if column in (1, 2):
+            col = self.store.names if column == 1 else self.store.qualities
+            idx.sort(key=lambda i: col[i].casefold(), reverse=(order == Qt.DescendingOrder))
+        elif column >= 3:
+            # NaN (boş) değerler her iki yönde de en sonda
+            vals = self._numeric_column(column)
+            present = [i for i in idx if vals[i] == vals[i]]
+            missing = [i for i in idx if vals[i] != vals[i]]
+            present.sort(key=vals.__getitem__, reverse=(order == Qt.DescendingOrder))
+            idx = present + missing
+        return idx
+
+    def _filtered_order(self) -> list[int]:
+        matched = self.search.match(self._query, self.store)
+        if matched is None:
+            return list(self._sorted)
+        if len(matched) * 8 < len(self._sorted):
+            # Az eşleşme: sıralı listeyi gezmek yerine eşleşenleri sıra konumuna göre diz
+            rank = self._rank()
+            return sorted(matched, key=rank.__getitem__)
+        keep = bytearray(len(self.store))
+        for i in matched:
+            keep[i] = 1
+        return [i for i in self._sorted if keep[i]]
+
+    def _set_order(self, order: list[int]):
+        self._order = order
+        pos = [-1] * len(self.store)
+        for r, i in enumerate(order):
+            pos[i] = r
+        self._pos = pos
+
+    def _apply_filter(self):
+        self._set_order(self._filtered_order())
+
+    # ---- Uygulama arayüzü ----
+    def set_store(self, store: ItemStore):
+        self.beginResetModel()
+        self.store = store
+        self._waiting = {}
+        self._depth = {}
+        self._sorted = self._sorted_indices()
+        self._rank_cache = None
+        self.search.rebuild(store)
+        self._apply_filter()
+        self.endResetModel()
+
+    def append_rows(self, batch: ItemStore):
+        """Akışlı içe aktarma partisini ekle; sıralama/filtre yoksa yalnız sona satır eklenir."""
+        n = len(batch)
+        if not n:
+            return
+        start = len(self.store)
+        if self._sort[0] < 0 and not self._query:
+            rows = len(self._order)
+            self.beginInsertRows(QModelIndex(), rows, rows + n - 1)
+            self.store.extend(batch)
+            self.search.extend(self.store)
+            self._rank_cache = None
+            new = range(start, start + n)
+            self._sorted.extend(new)
+            self._order.extend(new)
+            self._pos.extend(range(rows, rows + n))
+            self.endInsertRows()
+        else:
+            # Yeni satırlar sıraya/filtreye yerleşir; eski satırların göreli sırası
+            # değişmediğinden çoğunlukla ekleme sinyalleriyle bildirilir, seçim korunur
+            self.store.extend(batch)
+            self.search.extend(self.store)
+            self._sorted = self._sorted_indices()
+            self._rank_cache = None
+            self._update_rows()
+
+    def set_filter(self, text: str):
+        """Arama sorgusu (bkz. search.parse_query): `wear:fn stattrak profit>10 redline`."""
+        text = " ".join(text.lower().split())
+        if text == self._filter:
+            return
+        self.beginResetModel()
+        self._filter = text
+        self._query = parse_query(text)
+        self._apply_filter()
+        self.endResetModel()
+
+    def refresh_filter(self):
+        """Sorgu fiyat koşulu içeriyorsa (profit>10 gibi) güncel değerlerle yeniden süz.
+
+        Koşulu yeni sağlayan/artık sağlamayan satırlar ekleme/çıkarma (gerekirse
+        reset) sinyalleriyle bildirilir; satır kümesi değişirken layoutChanged
+        kullanılmaz.
+        """
+        if self._query.numeric:
+            self._sorted = self._sorted_indices()   # sıralama sütunu da değişmiş olabilir
+            self._rank_cache = None
+            self._update_rows()
+
+    def _rank(self) -> list[int]:
+        """Depo indeksi → sıralı konum (küçük eşleşme kümelerini sıraya dizmek için)."""
+        if self._rank_cache is None:
+            rank = [0] * len(self.store)
+            for r, i in enumerate(self._sorted):
+                rank[i] = r
+            self._rank_cache = rank
+        return self._rank_cache
+
+    def storage_index(self, row: int) -> int:
+        return self._order[row] if 0 <= row < len(self._order) else -1
+
+    def _emit_row_changed(self, i: int, first: int, last: int):
+        r = self._pos[i] if 0 <= i < len(self._pos) else -1
+        if r >= 0:
+            self.dataChanged.emit(self.index(r, first), self.index(r, last))
+
+    def _emit_rows_changed(self, indices, first: int, last: int):
+        """Depo indekslerini görünüm satırlarına çevirip ardışık aralıklar halinde bildir."""
+        pos = self._pos
+        rows = sorted(r for r in (pos[i] for i in indices) if r >= 0)
+        start = prev = None
+        for r in rows:
+            if start is None:
+                start = prev = r
+            elif r == prev + 1:
+                prev = r
+            else:
+                self.dataChanged.emit(self.index(start, first), self.index(prev, last))
+                start = prev = r
+        if start is not None:
+            self.dataChanged.emit(self.index(start, first), self.index(prev, last))
+
+    def _flagged(self, i: int) -> bool:
+        thr = self.flag_threshold
+        r = self.store.ratio[i]
+        return thr is not None and r == r and r >= thr
+
+    def set_flag_threshold(self, threshold: Optional[float]):
+        self.flag_threshold = threshold
+        if self._order:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._order) - 1, len(COLUMNS) - 1),
+                                  [Qt.BackgroundRole])
+
+    def _store_market(self, i: int, market_low: Optional[float], median: Optional[float]):
+        """Fiyatı depoya yaz; değişiklik yoksa None, varsa (kâr değişti, vurgu değişti)."""
+        st = self.store
+        low = NAN if market_low is None else float(market_low)
+        med = NAN if median is None else float(median)
+        if _same(low, st.market[i]) and _same(med, st.median[i]):
+            return None     # değişiklik yok → yeniden boyama yok
+        was_flagged = self._flagged(i)
+        st.market[i] = low
+        st.median[i] = med
+        # Kâr yalnız bu satır için, anında (tam tablo geçişi yok)
+        profit_changed = st.update_profit(i)
+        flagged = self._flagged(i)
+        if flagged and not was_flagged:
+            self.threshold_crossed.emit(i)
+        return profit_changed, flagged != was_flagged
+
+    def set_market(self, i: int, market_low: Optional[float], median: Optional[float]):
+        res = self._store_market(i, market_low, median)
+        if res is None:
+            return
+        profit_changed, reflagged = res
+        if reflagged:
+            self._emit_row_changed(i, 0, len(COLUMNS) - 1)   # satır arka planı değişti
+        else:
+            self._emit_row_changed(i, 4, 7 if profit_changed else 4)
+
+    def set_markets(self, updates):
+        """(depo indeksi, market_low, median) partisi; değişen satırlar ardışık aralıklarla bildirilir."""
+        changed, reflagged = [], []
+        for i, market_low, median in updates:
+            res = self._store_market(i, market_low, median)
+            if res is not None:
+                (reflagged if res[1] else changed).append(i)
+        self._emit_rows_changed(changed, 4, 7)
+        self._emit_rows_changed(reflagged, 0, len(COLUMNS) - 1)
+
+    def _store_order(self, i: int, highest_buy: float, sell_count: int, buy_count: int) -> bool:
+        price = float(highest_buy) if highest_buy and highest_buy > 0 else NAN
+        self._depth[self.store.keys[i]] = (sell_count, buy_count)
+        if _same(price, self.store.order_price[i]):
+            return False
+        self.store.order_price[i] = price
+        return True
+
+    def set_order(self, i: int, highest_buy: float, sell_count: int, buy_count: int):
+        """Histogramdan gelen en yüksek alış emrini (Sipariş Fiyatı) ve derinliği yaz."""
+        if self._store_order(i, highest_buy, sell_count, buy_count):
+            self._emit_row_changed(i, 5, 5)
+
+    def set_orders(self, updates):
+        """(depo indeksi, en yüksek alış, satış ilanı, alış emri) partisi."""
+        self._emit_rows_changed([u[0] for u in updates if self._store_order(*u)], 5, 5)
+
+    def compute_profits(self) -> int:
+        changed = self.store.compute_profits()
+        self._emit_rows_changed(changed, 6, 7)
+        return len(changed)
+
+    # ---- Küçük resimler ----
+    def thumbnail(self, i: int, priority: int = PRIO_VISIBLE, bump: bool = False):
+        """(pixmap | None, durum) döndür; ilk istekte yüklemeyi tetikler.
+
+        bump=True ise zaten beklenen url de verilen öncelikle yeniden istenir
+        (ön yüklemede kuyruğa girmiş görsel ekrana gelince öne alınır).
+        """
+        url = self.store.image_urls[i]
+        if not url:
+            return None, "missing"
+        if url in self.thumbs:
+            pix = self.thumbs.get(url)
+            return pix, ("ok" if pix is not None else "missing")
+        waiting = self._waiting.get(url)
+        if waiting is None:
+            self._waiting[url] = [i]
+            self.thumbnail_needed.emit(url, priority)
+        else:
+            if i not in waiting:
+                waiting.append(i)
+            if bump:
+                self.thumbnail_needed.emit(url, priority)
+        return None, "loading"
+
+    def request_thumbnails(self, first: int, last: int, priority: int):
+        """Görünüm satırları [first, last] için görselleri iste."""
+        order = self._order
+        for r in range(max(0, first), min(last, len(order) - 1) + 1):
+            self.thumbnail(order[r], priority, bump=True)
+
+    def cancel_thumbnails(self, first: int, last: int):
+        """Görünüm satırları [first, last] dışında kalan bekleyen istekleri iptal et."""
+        pos = self._pos
+        dropped = []
+        for url, idxs in list(self._waiting.items()):
+            keep = [i for i in idxs if first <= pos[i] <= last]
+            if keep:
+                self._waiting[url] = keep
+            else:
+                del self._waiting[url]
+                dropped.append(url)
+        if dropped:
+            self.thumbnails_cancelled.emit(dropped)
+
+    def set_thumbnail(self, url: str, pix):
+        """Yükleyiciden gelen (zaten küçültülmüş) görseli bu URL'yi bekleyen satırlara uygula.
+
+        Sonuç satır numarasıyla değil URL ile eşlenir; sıralama/yeniden içe
+        aktarma sonrası görsel yanlış satıra düşmez.
+        """
+        if not url:
+            return
+        if pix is not None and pix.isNull():
+            pix = None
+        self.thumbs.put(url, pix)
+        for i in self._waiting.pop(url, ()):
+            self._emit_row_changed(i, 0, 0)
+
+
+class ThumbnailDelegate(QStyledItemDelegate):
+    """Görsel sütununu çizer; görsel yalnız satır ilk kez ekrana gelince istenir."""
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        model = index.model()
+        pix, state = model.thumbnail(model.storage_index(index.row()))
+        rect = option.rect
+        box = QRect(0, 0, THUMB_SIZE.width(), THUMB_SIZE.height())
+        box.moveCenter(rect.center())
+        painter.save()
+        if pix is not None:
+            x = box.x() + (box.width() - pix.width()) // 2
+            y = box.y() + (box.height() - pix.height()) // 2
+            painter.drawPixmap(x, y, pix)
+        else:
+            pen = QPen(QColor("#555"))
+            pen.setStyle(Qt.DashLine)
+            painter.setPen(pen)
+            painter.drawRect(box.adjusted(0, 0, -1, -1))
+            painter.setPen(option.palette.color(QPalette.Text))
+            painter.drawText(box, Qt.AlignCenter, "Yükleniyor…" if state == "loading" else "Görsel yok")
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        return THUMB_SIZE
+
+
+# -------------------- Tablo --------------------
+class PriceTable(QTableView):
+    open_listing = Signal(str)  # mh
+    viewport_changed = Signal(int, int)   # ön yükleme dahil ilgilenilen görünüm satırları [ilk, son]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.items_model = ItemTableModel(self)
+        self.setModel(self.items_model)
+        self.setItemDelegateForColumn(0, ThumbnailDelegate(self))
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.verticalHeader().setVisible(False)
+        self.setAlternatingRowColors(True)
+        self.setShowGrid(False)
+        self.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.setIconSize(QSize(96, 48))
+        self.setWordWrap(False)
+        self.setSortingEnabled(True)
+        self.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        vh = self.verticalHeader()
+        vh.setSectionResizeMode(QHeaderView.Fixed)   # sabit satır yüksekliği: büyük listelerde hızlı
+        vh.setDefaultSectionSize(64)
+        hh = self.horizontalHeader()
+        hh.setSectionResizeMode(QHeaderView.Interactive)
+        hh.setStretchLastSection(True)
+        widths = [140, 260, 140, 120, 120, 120, 120, 120]
+        for i, w in enumerate(widths):
+            self.setColumnWidth(i, w)
+        # "Sipariş Fiyatı" histogram verisi (en yüksek alış emri) gelene dek gizli
+        self.setColumnHidden(5, True)
+
+        # Görünür alan değişince görselleri ön yükle / uzaktakileri iptal et (debounce)
+        self._viewport_timer = QTimer(self)
+        self._viewport_timer.setSingleShot(True)
+        self._viewport_timer.setInterval(60)
+        self._viewport_timer.timeout.connect(self._update_viewport)
+        self.verticalScrollBar().valueChanged.connect(self._schedule_viewport_update)
+        m = self.items_model
+        for sig in (m.modelReset, m.layoutChanged, m.rowsInserted, m.rowsRemoved):
+            sig.connect(self._schedule_viewport_update)
+
+    def _schedule_viewport_update(self, *args):
+        self._viewport_timer.start()
+
+    def resizeEvent(self, e):
+        super().resizeEvent(e)
+        self._schedule_viewport_update()
+
+    def visible_rows(self) -> tuple[int, int]:
+        """Ekrandaki görünüm satırları [ilk, son]; tablo boşsa (0, -1)."""
+        n = self.items_model.rowCount()
+        if n == 0:
+            return 0, -1
+        first = self.rowAt(0)
+        last = self.rowAt(self.viewport().height() - 1)
+        return max(first, 0), (last if last >= 0 else n - 1)
+
+    def _update_viewport(self):
+        model = self.items_model
+        first, last = self.visible_rows()
+        if last < first:
+            model.cancel_thumbnails(0, -1)
+            self.viewport_changed.emit(0, -1)
+            return
+        span = (last - first + 1) * PREFETCH_SCREENS
+        model.request_thumbnails(first, last, PRIO_VISIBLE)
+        model.request_thumbnails(first - span, first - 1, PRIO_PREFETCH)
+        model.request_thumbnails(last + 1, last + span, PRIO_PREFETCH)
+        # biraz pay bırak: sınırda gidip gelen kaydırmada istekler boşa kesilmesin
+        model.cancel_thumbnails(first - 2 * span, last + 2 * span)
+        self.viewport_changed.emit(max(0, first - span), last + span)
+
+    def clear_rows(self):
+        self.items_model.set_store(ItemStore())
+
+    def set_store(self, store: ItemStore):
+        self.items_model.set_store(store)
+
+    def storage_index(self, row: int) -> int:
+        return self.items_model.storage_index(row)
+
+    def update_image(self, url: str, pix):
+        self.items_model.set_thumbnail(url, pix)
+
+    def compute_profits(self) -> int:
+        return self.items_model.compute_profits()
+
+
+# -------------------- Akışlı içe aktarma --------------------
+IMPORT_BATCH = 5000             # akışlı içe aktarmada tabloya bir seferde eklenen item
+LARGE_TEXT_CHARS = 256 * 1024   # bundan büyük yapıştırma/dosya düzenleyiciye konmaz
+
+
+class JsonEdit(QTextEdit):
+    """Büyük yapıştırmaları düzenleyiciye koymadan doğrudan içe aktarmaya yönlendirir."""
+    large_paste = Signal(str)
+
+    def insertFromMimeData(self, source):
+        if source.hasText():
+            text = source.text()
+            if len(text) > LARGE_TEXT_CHARS:
+                self.large_paste.emit(text)
+                return
+        super().insertFromMimeData(source)
+
+
+class ItemImportWorker(QObject):
+    """JSON/JSON Lines'ı (dosya ya da metin) QThread'de akışla okur, partiler halinde yayınlar.
+
+    Normalizasyon (ItemStore.from_raw) da işçi thread'de yapılır; GUI yalnız
+    hazır sütunları tabloya ekler.
+    """
+    batch_ready = Signal(int, object)   # (nesil, ItemStore)
+    failed = Signal(int, str)
+    finished = Signal(int, int)         # (nesil, toplam item)
+
+    def __init__(self, generation: int, path: Optional[str] = None, text: Optional[str] = None,
+                 parent=None):
+        super().__init__(parent)
+        self.generation = generation
+        self.path = path
+        self.text = text
+        self._stop = False
+
+    def stop(self):
+        self._stop = True
+
+    @Slot()
+    def run(self):
+        total = 0
+        try:
+            items = iter_items_file(self.path) if self.path else iter_items(io.StringIO(self.text or ""))
+            for batch in iter_batches(items, IMPORT_BATCH):
+                if self._stop:
+                    break
+                self.batch_ready.emit(self.generation, ItemStore.from_raw(batch))
+                total += len(batch)
+        except Exception as e:
+            self.failed.emit(self.generation, str(e))
+        finally:
+            self.text = None
+            self.finished.emit(self.generation, total)
+
+
+# -------------------- Fiyat çekme (yalnız pazar fiyatı) --------------------
+RESULT_FLUSH_MS = 100       # sonuçlar GUI'ye en geç bu aralıkla, partiler halinde işlenir
+RESULT_BATCH_SIZE = 500     # bu kadar anahtar birikirse aralık beklenmeden işlenir
+
+
+class ResultBuffer:
+    """Çekme sonuçlarını anahtar başına biriktiren thread güvenli tampon.
+
+    Havuz thread'leri put_*() ile yazar, GUI take() ile hepsini tek seferde
+    alır. Aynı anahtarın yeni sonucu eskisinin yerine geçer (izleme modu).
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.prices: dict = {}      # key → (market_low, median)
+        self.orders: dict = {}      # key → (en yüksek alış, satış ilanı, alış emri)
+
+    def put_price(self, key, market_low: float, median: float) -> int:
+        with self._lock:
+            self.prices[key] = (market_low, median)
+            return len(self.prices) + len(self.orders)
+
+    def put_orders(self, key, highest_buy: float, sell_count: int, buy_count: int) -> int:
+        with self._lock:
+            self.orders[key] = (highest_buy, sell_count, buy_count)
+            return len(self.prices) + len(self.orders)
+
+    def take(self) -> tuple[dict, dict]:
+        with self._lock:
+            prices, orders = self.prices, self.orders
+            self.prices, self.orders = {}, {}
+        return prices, orders
+
+
+class PriceFetchWorker(QObject):
+    """make_fetcher'ın kurduğu fetch.PriceFetcher'ı (ya da aiofetch/watch alt sınıfını)
+    QThread'de çalıştırır, sonuçları ResultBuffer'da biriktirir.
+
+    Her sonuç için sinyal yerine tampon boşken dolmaya başladığında ve her
+    RESULT_BATCH_SIZE anahtarda bir results_ready yayılır; GUI tamponu
+    RESULT_FLUSH_MS aralıkla boşaltır (True → beklemeden boşalt).
+    """
+    results_ready = Signal(bool)
+    finished = Signal()
+    rate_changed = Signal(float)  # etkin istek/sn
+
+    def __init__(self, store: ItemStore, currency: int, max_workers: int, rps: float,
+                 cache: Optional[PriceCache] = None, adaptive: bool = True,
+                 engine: str = "threads", priority: str = "profit", mode: str = "overview",
+                 watch: bool = False, metrics: Optional[FetchMetrics] = None, parent=None):
+        super().__init__(parent)
+        self.watch = watch
+        self.results = ResultBuffer()
+        self.fetcher = make_fetcher(engine, store, currency, max_workers, rps, watch=watch,
+                                    cache=cache, adaptive=adaptive, priority=priority, mode=mode,
+                                    on_progress=self._on_progress,
+                                    on_rate_change=self.rate_changed.emit,
+                                    on_orders=self._on_orders, metrics=metrics)
+
+    def _notify(self, pending: int):
+        if pending == 1:
+            self.results_ready.emit(False)
+        elif pending % RESULT_BATCH_SIZE == 0:
+            self.results_ready.emit(True)
+
+    def _on_progress(self, key, market_low: float, median: float):
+        self._notify(self.results.put_price(key, market_low, median))
+
+    def _on_orders(self, key, highest_buy: float, sell_count: int, buy_count: int):
+        self._notify(self.results.put_orders(key, highest_buy, sell_count, buy_count))
+
+    @property
+    def bucket(self):
+        return self.fetcher.bucket
+
+    def stop(self):
+        self.fetcher.stop()
+
+    def prioritize(self, keys):
+        # GUI thread'inden doğrudan çağrılır; FetchQueue kendi kilidini kullanır
+        self.fetcher.prioritize(keys)
+
+    @Slot()
+    def run(self):
+        try:
+            self.fetcher.run()
+        except Exception as e:
+            print("Fetch worker error:", e, file=sys.stderr)
+        finally:
+            self.finished.emit()
+
+
+# -------------------- Metrik paneli --------------------
+class MetricsPanel(QFrame):
+    """Çekme hattının canlı metrikleri: hız, hata oranı, ETA, uç başına gecikme.
+
+    FetchMetrics'i saniyede bir okur (çekme sürerken); dışa aktarma düğmeleri
+    son çalıştırmanın metriklerini JSON ya da Prometheus metni olarak yazar.
+    """
+    ENDPOINT_COLUMNS = ["Uç", "İstek", "Hata", "429", "p50 ms", "p99 ms", "KB"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.metrics: Optional[FetchMetrics] = None
+        self.labels = {}
+        form = QFormLayout()
+        for key, title in (("progress", "İlerleme:"), ("throughput", "Hız:"), ("eta", "Kalan süre:"),
+                           ("errors", "Hata oranı:"), ("cache", "Önbellek isabeti:"),
+                           ("wait", "Bekleme payı:"), ("fallbacks", "Yedek istek:"),
+                           ("bottleneck", "Darboğaz:")):
+            self.labels[key] = QLabel("–")
+            form.addRow(title, self.labels[key])
+        self.labels["wait"].setToolTip("İstek süresinin token bucket'ta beklenen payı; yüksekse hız "
+                                       "sınırı belirleyicidir. Parantezde istemci tarafı mini gecikme.")
+
+        self.table = QTableWidget(0, len(self.ENDPOINT_COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.ENDPOINT_COLUMNS)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+
+        btn_json = QPushButton("JSON…")
+        btn_json.clicked.connect(lambda: self.export("json"))
+        btn_prom = QPushButton("Prometheus…")
+        btn_prom.clicked.connect(lambda: self.export("prom"))
+        buttons = QHBoxLayout()
+        buttons.addWidget(btn_json)
+        buttons.addWidget(btn_prom)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel("<b>Çekme metrikleri</b>"))
+        layout.addLayout(form)
+        layout.addWidget(self.table, 1)
+        layout.addLayout(buttons)
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(1000)
+        self.timer.timeout.connect(self.refresh)
+
+    def attach(self, metrics: FetchMetrics):
+        """Yeni çalıştırmanın metriklerini izlemeye başla."""
+        self.metrics = metrics
+        self.refresh()
+        self.timer.start()
+
+    def detach(self):
+        """Çalıştırma bitti: son durumu göster, zamanlayıcıyı durdur (metrikler dışa aktarılabilir kalır)."""
+        self.timer.stop()
+        self.refresh()
+
+    @Slot()
+    def refresh(self):
+        if self.metrics is None or not self.isVisible():
+            return
+        s = self.metrics.snapshot()
+        lb = self.labels
+        total = s["items_total"]
+        lb["progress"].setText(f"{s['items_done']} / {total}" if total else str(s["items_done"]))
+        lb["throughput"].setText(f"{s['throughput']:.2f} item/sn")
+        eta = s["eta_seconds"]
+        lb["eta"].setText("–" if eta is None else f"{int(eta // 60)} dk {int(eta % 60)} sn")
+        lb["errors"].setText(f"%{s['error_rate'] * 100:.1f}  (429: {s['throttled']}, "
+                             f"success:false: {s['success_false']}, hata: {s['errors']})")
+        lb["cache"].setText(f"%{s['cache_hit_ratio'] * 100:.0f}")
+        lb["wait"].setText(f"%{s['wait_share'] * 100:.0f}  (ort. {s['avg_wait_ms']:.0f} ms, "
+                           f"gecikme {s['avg_delay_ms']:.0f} ms)")
+        lb["fallbacks"].setText(str(s["fallbacks"]))
+        lb["bottleneck"].setText(diagnose(s))
+
+        eps = sorted(s["endpoints"].items())
+        self.table.setRowCount(len(eps))
+        for r, (ep, e) in enumerate(eps):
+            vals = (ep, e["requests"], e["errors"], e["throttled"], f"{e['p50_ms']:.0f}",
+                    f"{e['p99_ms']:.0f}", f"{e['bytes'] / 1024:.1f}")
+            for c, v in enumerate(vals):
+                self.table.setItem(r, c, QTableWidgetItem(str(v)))
+
+    def export(self, kind: str):
+        if self.metrics is None:
+            QMessageBox.information(self, "Bilgi", "Henüz çekme yapılmadı.")
+            return
+        if kind == "prom":
+            path, _ = QFileDialog.getSaveFileName(self, "Prometheus Metni", "metrics.prom",
+                                                  "Prometheus (*.prom *.txt)")
+        else:
+            path, _ = QFileDialog.getSaveFileName(self, "Metrik JSON", "metrics.json", "JSON (*.json)")
+        if not path:
+            return
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(self.metrics.to_prometheus() if kind == "prom" else self.metrics.to_json())
+        except OSError as e:
+            QMessageBox.critical(self, "Hata", f"Dosya yazılamadı:\n{e}")
+
+
+# -------------------- Ana pencere --------------------
+class MainWindow(QWidget):
+
+    # --- Tema yardımcıları: SINIF METODLARI (init DIŞINDA!) ---
+    def _palette_for_mode(self, mode: str) -> QPalette:
+        # Her mod için mutlaka QPalette döndür!
+        if mode == "light":
+            return light_palette()
+        elif mode == "grad_light":
+            return light_palette()
+        elif mode == "asimov":
+            pal = QPalette()
+            pal.setColor(QPalette.Window, QColor("#eeeeee"))
+            pal.setColor(QPalette.Base, QColor("#ffffff"))
+            pal.setColor(QPalette.AlternateBase, QColor("#f6f6f6"))
+            pal.setColor(QPalette.WindowText, QColor("#000000"))
+            pal.setColor(QPalette.Text, QColor("#000000"))
+            pal.setColor(QPalette.ButtonText, QColor("#000000"))
+            pal.setColor(QPalette.ToolTipBase, QColor("#ffffff"))
+            pal.setColor(QPalette.ToolTipText, QColor("#000000"))
+            pal.setColor(QPalette.Button, QColor("#ffffff"))
+            pal.setColor(QPalette.Highlight, QColor(ASIIMOV_ACCENT))
+            pal.setColor(QPalette.HighlightedText, Qt.white)
+            pal.setColor(QPalette.Link, QColor(ASIIMOV_ACCENT))
+            pal.setColor(QPalette.BrightText, QColor(ASIIMOV_ACCENT))
+            return pal
+        elif mode == "grad_dark":
+            pal = QPalette()
+            pal.setColor(QPalette.Window, QColor("#0b0b10"))
+            pal.setColor(QPalette.Base, QColor("#12121a"))
+            pal.setColor(QPalette.AlternateBase, QColor("#191926"))
+            pal.setColor(QPalette.WindowText, QColor("#E6E6E9"))
+            pal.setColor(QPalette.Text, QColor("#E6E6E9"))
+            pal.setColor(QPalette.Button, QColor("#1b1b28"))
+            pal.setColor(QPalette.ButtonText, QColor("#E6E6E9"))
+            pal.setColor(QPalette.ToolTipBase, QColor("#1f1f2d"))
+            pal.setColor(QPalette.ToolTipText, QColor("#E6E6E9"))
+            pal.setColor(QPalette.Highlight, QColor("#8b5cf6"))
+            pal.setColor(QPalette.HighlightedText, Qt.white)
+            pal.setColor(QPalette.Link, QColor("#a855f7"))
+            pal.setColor(QPalette.BrightText, QColor("#a855f7"))
+            return pal
+        elif mode == "dark":
+            # <-- BUNU EKLE: dark açıkça dönsün
+            return dark_palette()
+
+        # Güvenli varsayılan: hiçbiri eşleşmezse dark
+        return dark_palette()
+
+
+    def set_ui_mode(self, mode: str):
+        self.ui_mode = mode
+        app = QApplication.instance()
+
+        # Palet ve stylesheet'i güvenle al
+        pal = self._palette_for_mode(mode)
+        if pal is None:                     # Savunmacı programlama
+            pal = dark_palette()
+
+        css = self._stylesheet_for_mode(mode)
+        if not isinstance(css, str):        # Boş/None gelirse en azından boş string
+            css = ""
+
+        app.setStyle("Fusion")
+        app.setPalette(pal)
+        app.setStyleSheet(css)
+
+
+    def _stylesheet_for_mode(self, mode: str) -> str:
+        if mode == "grad_dark":
+            return """
+            /* Arka plan: siyah → mor gradyan */
+            QWidget {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                            stop:0 #0b0b10, stop:0.55 #141425, stop:1 #2a0a3a);
+                color: #E6E6E9;
+                font-family: 'Segoe UI', sans-serif;
+                font-size: 11pt;
+            }
+
+            /* Toolbar: yarı saydam koyu + mor alt çizgi */
+            QToolBar {
+                background: rgba(20,20,37,0.85);
+                border: none;
+                border-bottom: 2px solid #8b5cf6;
+                padding: 6px;
+            }
+
+            /* Butonlar: koyu zemin + mor vurgu */
+            QPushButton {
+                background: #1b1b28;
+                color: #EDEDF2;
+                border: 1px solid #8b5cf6;
+                border-radius: 8px;
+                padding: 6px 12px;
+                font-weight: 600;
+            }
+            QPushButton:hover {
+                background: #26263a;
+                border-color: #a78bfa;
+            }
+            QPushButton:pressed {
+                background: #1a1630;
+                border-color: #7c3aed;
+            }
+            QPushButton:disabled {
+                color: #9a9aaa;
+                border-color: #3a3a4a;
+                background: #151520;
+            }
+
+            /* Giriş alanları */
+            QLineEdit, QSpinBox, QDoubleSpinBox, QTextEdit {
+                background: #12121a;
+                color: #E6E6E9;
+                border: 1px solid #3e3e5a;
+                border-radius: 6px;
+                padding: 4px 8px;
+                selection-background-color: #8b5cf6;
+                selection-color: white;
+            }
+            QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus, QTextEdit:focus {
+                border: 1px solid #8b5cf6;
+                box-shadow: 0 0 0 2px rgba(139,92,246,0.25);
+            }
+
+            /* Tablo başlıkları: mor şerit */
+            QHeaderView::section {
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                            stop:0 #5221b5, stop:1 #8b5cf6);
+                color: white;
+                border: none;
+                border-bottom: 1px solid #3a2a5a;
+                padding: 6px 8px;
+                font-weight: 600;
+            }
+
+            /* Tablo gövdesi */
+            QTableView {
+                background: #12121a;
+                alternate-background-color: #191926;
+                gridline-color: #2a2a3f;
+                selection-background-color: #8b5cf6;
+                selection-color: white;
+                outline: none;
+            }
+            QTableView::item {
+                padding: 4px 6px;
+                border-bottom: 1px solid #1f1f2f;
+            }
+            QTableView::item:hover {
+                background: #1a1630;
+            }
+            QTableView::item:selected {
+                background: #8b5cf6;
+                color: white;
+                font-weight: 600;
+            }
+            QTableCornerButton::section {
+                background: #2a0a3a;
+                border: none;
+            }
+
+            /* Splitter: ince mor çizgi */
+            QSplitter::handle {
+                background: #3d2a5f;
+                width: 3px;
+            }
+
+            /* ToolTip */
+            QToolTip {
+                background: #1f1f2d;
+                color: #E6E6E9;
+                border: 1px solid #8b5cf6;
+                padding: 4px 6px;
+                border-radius: 6px;
+            }
+
+            /* Tema butonu ve menü */
+            QToolButton {
+                background: #1b1b28;
+                color: #EDEDF2;
+                border: 1px solid #8b5cf6;
+                border-radius: 8px;
+                padding: 6px 10px;
+                font-weight: 600;
+            }
+            QToolButton:hover {
+                background: #26263a;
+                border-color: #a78bfa;
+            }
+            QMenu {
+                background: #151523;
+                color: #EDEDF2;
+                border: 1px solid #8b5cf6;
+            }
+            QMenu::item:selected {
+                background: #8b5cf6;
+                color: white;
+            }
+            """
+
+        if mode == "grad_light":
+            return """
+            QWidget {
+                background: qlineargradient(x1:0,y1:0, x2:0,y2:1,
+                            stop:0 #f5f7fa, stop:1 #eaeef2);
+                color: #202124;
+            }
+            QToolBar { background: #c5c5c5; border-bottom: 1px solid #d0d7de; }
+            QTableView::item:selected { background: #1769E0; color: white; }
+            """
+        if mode == "asimov":
+            return f"""
+            /* GENEL */
+            QWidget {{
+                background: #c5c5c5;
+                color: #000000;
+                font-family: 'Segoe UI', sans-serif;
+                font-size: 11pt;
+            }}
+
+            /* TOOLBAR */
+            QToolBar {{
+                background: #c5c5c5;
+                border-bottom: 3px solid {ASIIMOV_ACCENT};
+                padding: 6px;
+            }}
+
+            /* BUTONLAR */
+            QPushButton {{
+                background: {ASIIMOV_ACCENT};
+                color: #c5c5c5;
+                border: 2px solid #000000;
+                border-radius: 8px;
+                padding: 6px 12px;
+                font-weight: 600;
+            }}
+            QPushButton:hover {{
+                background: #ff8520;
+                color: #c5c5c5;
+                border-color: #000000;
+            }}
+            QPushButton:pressed {{
+                background: #c55f12;
+                color: #c5c5c5;
+            }}
+            QPushButton:disabled {{
+                background: #cccccc;
+                color: #666666;
+                border: 1px solid #999999;
+            }}
+
+            /* METİN ALANLARI */
+            QLineEdit, QSpinBox, QDoubleSpinBox, QTextEdit {{
+                background: #c5c5c5;
+                color: #000000;
+                border: 2px solid {ASIIMOV_ACCENT};
+                border-radius: 5px;
+                padding: 4px 6px;
+                selection-background-color: {ASIIMOV_ACCENT};
+                selection-color: #c5c5c5;
+            }}
+            QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus, QTextEdit:focus {{
+                border: 2px solid #000000;
+            }}
+
+            /* TABLO BAŞLIKLARI */
+            QHeaderView::section {{
+                background: {ASIIMOV_ACCENT};
+                color: #ffffff;
+                font-weight: bold;
+                border: 1px solid #c5c5c5;
+                padding: 6px;
+            }}
+
+            /* TABLO GENEL */
+            QTableView {{
+                gridline-color: #fe6903;
+                selection-background-color: {ASIIMOV_ACCENT};
+                selection-color: #ffffff;
+                alternate-background-color: #f5f5f5;
+            }}
+
+            /* TABLO HÜCRELERİ */
+            QTableView::item {{
+                border-bottom: 1px solid #cccccc;
+                padding: 4px;
+            }}
+            QTableView::item:selected {{
+                background: {ASIIMOV_ACCENT};
+                color: #ffffff;
+                font-weight: 600;
+            }}
+            QTableCornerButton::section {{
+                background: {ASIIMOV_ACCENT};
+                border: none;
+            }}
+
+            /* SPLITTER */
+            QSplitter::handle {{
+                background: {ASIIMOV_ACCENT};
+                width: 3px;
+            }}
+
+            /* TOOLTIP */
+            QToolTip {{
+                background: #ffffff;
+                color: #000000;
+                border: 2px solid {ASIIMOV_ACCENT};
+                padding: 4px;
+                border-radius: 6px;
+            }}
+
+            /* THEME MENU BUTTON */
+            QToolButton {{
+                background: #ffffff;
+                color: #000000;
+                border: 2px solid {ASIIMOV_ACCENT};
+                border-radius: 6px;
+                padding: 6px 10px;
+                font-weight: 600;
+            }}
+            QToolButton:hover {{
+                background: {ASIIMOV_ACCENT};
+                color: #ffffff;
+            }}
+
+            /* MENU */
+            QMenu {{
+                background: #ffffff;
+                color: #000000;
+                border: 2px solid {ASIIMOV_ACCENT};
+            }}
+            QMenu::item:selected {{
+                background: {ASIIMOV_ACCENT};
+                color: #ffffff;
+            }}
+            """
+
+
+        if mode == "light":
+            return """
+            QToolBar { background: #ffffff; border-bottom: 1px solid #d0d7de; }
+            QTableView::item:selected { background: #1769E0; color: white; }
+            """
+        # dark
+        return """
+        QToolBar { background: #1b1d20; border: none; }
+        QTableView::item:selected { background: #4c6ef5; color: white; }
+        """
+
+    def set_ui_mode(self, mode: str):
+        self.ui_mode = mode
+        app = QApplication.instance()
+        app.setStyle("Fusion")
+        app.setPalette(self._palette_for_mode(mode))
+        app.setStyleSheet(self._stylesheet_for_mode(mode))
+
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("SkinMarket-Analyzer")
+        self.setWindowIcon(QIcon())
+        self.resize(1350, 780)
+
+        self.image_loader = ImageLoader(self, disk_cache=ImageCache())
+        self.price_cache = PriceCache()
+        self.image_loader.image_ready.connect(self.on_image_ready)
+
+        # Toolbar
+        self.toolbar = QToolBar()
+        act_open = QAction("JSON Aç", self)
+        act_open.triggered.connect(self.open_json_file)
+        act_save = QAction("JSON Kaydet", self)
+        act_save.triggered.connect(self.save_json_file)
+        act_export = QAction("CSV Dışa Aktar", self)
+        act_export.triggered.connect(self.export_csv_file)
+        act_nid_import = QAction("Name ID İçe Aktar", self)
+        act_nid_import.triggered.connect(self.import_nameids)
+        act_nid_export = QAction("Name ID Dışa Aktar", self)
+        act_nid_export.triggered.connect(self.export_nameids)
+        self.toolbar.addAction(act_open)
+        self.toolbar.addAction(act_save)
+        self.toolbar.addAction(act_export)
+        self.toolbar.addAction(act_nid_import)
+        self.toolbar.addAction(act_nid_export)
+        self.act_metrics = QAction("Metrikler", self)
+        self.act_metrics.setCheckable(True)
+        self.act_metrics.toggled.connect(self._toggle_metrics)
+        self.toolbar.addAction(self.act_metrics)
+
+        # --- Tema butonu (açılır menü) ---
+        self.btn_theme = QToolButton(self)
+        self.btn_theme.setText("Tema")
+        self.btn_theme.setPopupMode(QToolButton.InstantPopup)
+        menu = QMenu(self)
+
+        def _add_mode(label, key):
+            act = QAction(label, self)
+            act.triggered.connect(lambda _=False, k=key: self.set_ui_mode(k))
+            menu.addAction(act)
+
+        _add_mode(UI_MODES["dark"], "dark")
+        _add_mode(UI_MODES["light"], "light")
+        _add_mode(UI_MODES["grad_dark"], "grad_dark")
+        _add_mode(UI_MODES["asimov"], "asimov")
+
+        self.btn_theme.setMenu(menu)
+        self.toolbar.addWidget(self.btn_theme)
+
+        # Sol panel
+        self.json_edit = JsonEdit()
+        self.json_edit.large_paste.connect(lambda text: self._start_import(text=text))
+        self.json_edit.setPlaceholderText("Buraya item JSON'unu yapıştır…")
+        self.json_edit.setText(PLACEHOLDER_JSON)
+        self.json_edit.setMinimumWidth(360)
+
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("Filtrele: isim/kalite, wear:fn stattrak profit>10 …")
+        self.filter_edit.setToolTip(
+            "Parçalar VE ile bağlanır:\n"
+            "  redline, ak47 — ad/kalite içinde (noktalama/boşluk yok sayılır;\n"
+            "    4+ harfte tek harf yazım hatası tolere edilir: readline, asimov)\n"
+            "  wear:fn / mw / ft / ww / bs — aşınma\n"
+            "  weapon:awp, skin:asiimov, quality:covert\n"
+            "  stattrak (st), souvenir — bayrak; adında geçen metin için name:st\n"
+            "  başında - → hariç tut: -stattrak, -wear:bs, -redline\n"
+            "  profit>10, ratio>=5, price<3, market, order, median (- yok sayılır)")
+        self.filter_edit.setClearButtonEnabled(True)
+        # Her tuşta değil, yazma duraklayınca süz; Enter beklemeden uygular
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self._apply_filter_text)
+        self.filter_edit.textChanged.connect(self._filter_timer.start)
+        self.filter_edit.returnPressed.connect(self._apply_filter_text)
+
+        self.btn_import = QPushButton("İçe Aktar")
+        self.btn_import.clicked.connect(self.import_json)
+
+        self.btn_run = QPushButton("Kârı Hesapla")
+        self.btn_run.clicked.connect(self.run_compute)
+
+        self.btn_fetch = QPushButton("Fiyatları Çek (Steam)")
+        self.btn_fetch.clicked.connect(self.fetch_prices)
+
+        self.btn_stop = QPushButton("Durdur")
+        self.btn_stop.clicked.connect(self.stop_fetch)
+        self.btn_stop.setEnabled(False)
+
+        # Hız/Worker ayarları
+        self.spin_workers = QSpinBox()
+        self.spin_workers.setRange(1, 8)
+        self.spin_workers.setValue(4)
+        self.spin_rps = QDoubleSpinBox()
+        self.spin_rps.setRange(0.5, 3.0)
+        self.spin_rps.setSingleStep(0.1)
+        self.spin_rps.setValue(1.8)
+        self.chk_adaptive = QCheckBox("Uyarlanabilir (429'da yavaşla)")
+        self.chk_adaptive.setChecked(True)
+        self.lbl_rate = QLabel("–")
+        self.lbl_http = QLabel("–")
+        self.lbl_http.setToolTip("Paylaşılan HTTP oturumu: yeniden kullanılan bağlantılar / "
+                                 "yeni bağlantı (TLS el sıkışması) / alınan veri")
+        self.combo_engine = QComboBox()
+        for key, label in FETCH_ENGINES.items():
+            self.combo_engine.addItem(label, key)
+        if not aiohttp_available():
+            # aiohttp kurulu değilse asenkron motor seçilemez
+            self.combo_engine.model().item(self.combo_engine.findData("async")).setEnabled(False)
+        self.combo_priority = QComboBox()
+        for key, label in FETCH_PRIORITIES.items():
+            self.combo_priority.addItem(label, key)
+        self.combo_priority.setToolTip("Önce hangi item'lar çekilsin? Ekrandaki satırlar her zaman öne alınır.")
+        self.combo_mode = QComboBox()
+        for key, label in FETCH_MODES.items():
+            self.combo_mode.addItem(label, key)
+        self.combo_mode.setToolTip("Histogram: name id'si bilinen item başına tek istek; en düşük satış, "
+                                   "en yüksek alış emri (Sipariş Fiyatı) ve derinlik birlikte gelir.")
+        self.chk_watch = QCheckBox("İzleme modu (durdurulana dek yenile)")
+        self.chk_watch.setToolTip("Fiyatlar sürekli yenilenir; oynak item'lar daha sık, "
+                                  "değişmeyenler daha seyrek istenir.")
+        self.spin_threshold = QDoubleSpinBox()
+        self.spin_threshold.setRange(0.0, 1000.0)
+        self.spin_threshold.setSingleStep(1.0)
+        self.spin_threshold.setSuffix(" %")
+        self.spin_threshold.setSpecialValueText("Kapalı")
+        self.spin_threshold.setValue(0.0)
+        self.spin_threshold.valueChanged.connect(self._on_threshold_changed)
+        self.lbl_watch = QLabel("–")
+        form = QFormLayout()
+        form.addRow("Motor:", self.combo_engine)
+        form.addRow("Öncelik:", self.combo_priority)
+        form.addRow("İstek:", self.combo_mode)
+        form.addRow("Worker (1-8):", self.spin_workers)
+        form.addRow("İstek/sn (0.5–3.0):", self.spin_rps)
+        form.addRow("", self.chk_adaptive)
+        form.addRow("Etkin hız:", self.lbl_rate)
+        form.addRow("Bağlantılar:", self.lbl_http)
+        form.addRow("", self.chk_watch)
+        form.addRow("Kâr eşiği:", self.spin_threshold)
+        form.addRow("Bildirim:", self.lbl_watch)
+
+        left_buttons = QHBoxLayout()
+        left_buttons.addWidget(self.btn_import)
+        left_buttons.addWidget(self.btn_run)
+        left_buttons.addWidget(self.btn_fetch)
+        left_buttons.addWidget(self.btn_stop)
+
+        left_layout = QVBoxLayout()
+        left_layout.addWidget(self.toolbar)
+        left_layout.addWidget(self.json_edit, 1)
+        left_layout.addWidget(self.filter_edit)
+        left_layout.addLayout(form)
+        left_layout.addLayout(left_buttons)
+
+        left_widget = QWidget()
+        left_widget.setLayout(left_layout)
+
+        # Tablo
+        self.table = PriceTable()
+        self.table_frame = QFrame()
+        self.table_frame.setLayout(QVBoxLayout())
+        self.table_frame.layout().addWidget(self.table)
+
+        # Çift tık → Pricempire
+        self.table.doubleClicked.connect(self._on_table_double_clicked)
+        self.table.items_model.thumbnail_needed.connect(self.image_loader.fetch)
+        self.table.viewport_changed.connect(self._on_viewport_changed)
+        self.table.items_model.threshold_crossed.connect(self._on_threshold_crossed)
+        self.table.items_model.thumbnails_cancelled.connect(self.image_loader.cancel)
+
+        # Sağ tık menüsü
+        self.table.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.table.customContextMenuRequested.connect(self._on_table_context_menu)
+
+        splitter = QSplitter(Qt.Horizontal)
+        splitter.addWidget(left_widget)
+        splitter.addWidget(self.table_frame)
+        self.metrics_panel = MetricsPanel()
+        self.metrics_panel.setVisible(False)
+        splitter.addWidget(self.metrics_panel)
+        splitter.setSizes([460, 900, 320])
+
+        root = QHBoxLayout(self)
+        root.addWidget(splitter)
+        self.setLayout(root)
+
+        self.store = ItemStore()
+        self._row_by_key = {}   # mh -> [depo indeksleri] (sıralamadan etkilenmez)
+        self._thread = None
+        self._worker = None
+        self._watching = False
+        self._results = None            # çalışan işçinin ResultBuffer'ı
+        self._results_timer = QTimer(self)
+        self._results_timer.setSingleShot(True)
+        self._results_timer.setInterval(RESULT_FLUSH_MS)
+        self._results_timer.timeout.connect(self._flush_results)
+        self._import_worker = None
+        self._import_gen = 0            # eski içe aktarmalardan kalan sinyalleri ayırt eder
+        self._imports = {}              # nesil → (QThread, işçi); bitene dek referans tutulur
+
+    # -------- Yardımcılar --------
+    def _on_table_double_clicked(self, index: QModelIndex):
+        row = index.row()
+        if row < 0:
+            return
+        self._open_pricempire_for_row(row)
+
+    def _names_for_row(self, row: int) -> tuple[int, str, str]:
+        """Görünüm satırı → (depo indeksi, isim, kalite)."""
+        i = self.table.storage_index(row)
+        if i < 0:
+            return i, "", ""
+        return i, self.store.names[i], self.store.qualities[i]
+
+    # -------- Çekme akışı --------
+    def _open_pricempire_for_row(self, row: int):
+        if row < 0:
+            return
+        i, raw_name, quality = self._names_for_row(row)
+        if i < 0:
+            return
+        stattrak_hint = None
+        link_hint = None
+
+        # Sticker engeli
+        if "sticker" in raw_name.lower():
+            QMessageBox.information(
+                self, "Bilgi", "Sticker öğeleri için Pricempire linki oluşturulmaz."
+            )
+            return
+
+        if i < len(self.store):
+            stattrak_hint = bool(self.store.stattrak[i])
+            link_hint = self.store.links[i]
+
+        # Geçerli hazır link öncelikli; yoksa addan üretilir (sonuç ad başına önbellekte)
+        url = pricempire_url_for(raw_name, quality, stattrak_hint, link_hint)
+        if not url:
+            QMessageBox.information(self, "Bilgi", "Bu item için Pricempire linki üretilemedi.")
+            return
+        webbrowser.open(url)
+
+    def _on_table_context_menu(self, pos: QPoint):
+        index = self.table.indexAt(pos)
+        row = index.row()
+        if row < 0:
+            return
+        menu = QMenu(self)
+        act_open = QAction("Pricempire linkine git", self)
+        act_copy_skin = QAction("Skin ismini kopyala", self)
+        act_copy_full = QAction("Kopyala", self)
+        menu.addAction(act_open)
+        menu.addSeparator()
+        menu.addAction(act_copy_skin)
+        menu.addAction(act_copy_full)
+        action = menu.exec(self.table.viewport().mapToGlobal(pos))
+        if not action:
+            return
+        if action is act_open:
+            self._open_pricempire_for_row(row)
+            return
+        _, raw_name, quality = self._names_for_row(row)
+        base_name = raw_name
+        if quality and raw_name.endswith(f" ({quality})"):
+            base_name = raw_name[:-(len(quality)+3)].rstrip()
+
+        cb = QApplication.clipboard()
+        if action == act_copy_skin:
+            cb.setText(base_name)
+        elif action == act_copy_full:
+            cb.setText(f"{base_name} ({quality})" if quality else base_name)
+
+    @Slot()
+    def fetch_prices(self):
+        if not len(self.store):
+            QMessageBox.information(self, "Bilgi", "Önce JSON'u içe aktar.")
+            return
+
+        # Sıralama açık kalır: model depo indeksleriyle çalışır, sonuçlar doğru satıra düşer;
+        # sıralama/filtre/kaydırma ekrandaki item'ları çekme kuyruğunda öne alır.
+        # Butonlar / ayar
+        self.btn_fetch.setEnabled(False)
+        self.btn_run.setEnabled(False)
+        self.btn_import.setEnabled(False)
+        self.btn_stop.setEnabled(True)
+
+        workers = int(self.spin_workers.value())
+        rps = float(self.spin_rps.value())
+        adaptive = self.chk_adaptive.isChecked()
+
+        # QThread + Worker
+        self._thread = QThread(self)
+        self._worker = PriceFetchWorker(self.store, currency=1, max_workers=workers, rps=rps,
+                                        cache=self.price_cache, adaptive=adaptive,
+                                        engine=self.combo_engine.currentData(),
+                                        priority=self.combo_priority.currentData(),
+                                        mode=self.combo_mode.currentData(),
+                                        watch=self.chk_watch.isChecked(),
+                                        metrics=FetchMetrics())
+        self.metrics_panel.attach(self._worker.fetcher.metrics)
+        self._results = self._worker.results
+        self._watching = self._worker.watch
+        if self._watching:
+            self.lbl_watch.setText("İzleme açık; değişen fiyatlar yerinde güncellenir.")
+        self._on_rate_changed(self._worker.bucket.rate)
+        self._on_viewport_changed(*self.table.visible_rows())
+        self._worker.moveToThread(self._thread)
+
+        self._thread.started.connect(self._worker.run)
+        self._worker.results_ready.connect(self._on_results_ready)
+        self._worker.rate_changed.connect(self._on_rate_changed)
+        self._worker.finished.connect(self._thread.quit)
+        self._worker.finished.connect(self._worker.deleteLater)
+        self._thread.finished.connect(self._thread.deleteLater)
+        self._thread.finished.connect(self._on_fetch_finished)
+
+        self._thread.start()
+
+    @Slot()
+    def stop_fetch(self):
+        if self._worker:
+            self._worker.stop()
+        self.btn_stop.setEnabled(False)
+
+    @Slot(bool)
+    def _on_results_ready(self, full: bool):
+        if full:
+            self._flush_results()
+        elif not self._results_timer.isActive():
+            self._results_timer.start()
+
+    @Slot()
+    def _flush_results(self):
+        """Tampondaki sonuçları tek partide tabloya işle (satır başına boyama yok)."""
+        if self._results is None:
+            return
+        prices, orders = self._results.take()
+        rows_of = self._row_by_key
+        model = self.table.items_model
+        if orders:
+            # Aynı mh'ye sahip tüm satırlara dağıt; 5 = Sipariş Fiyatı (+ derinlik tooltip)
+            model.set_orders([(i, *o) for key, o in orders.items() for i in rows_of.get(key, ())])
+            if self.table.isColumnHidden(5) and any(o[0] > 0 and key in rows_of
+                                                    for key, o in orders.items()):
+                self.table.setColumnHidden(5, False)
+        if prices:
+            # 4 = Pazar Fiyatı (+ Median tooltip); kâr/oran satır bazında güncellenir
+            model.set_markets([(i, low, med) for key, (low, med) in prices.items()
+                               for i in rows_of.get(key, ())])
+
+    @Slot(bool)
+    def _toggle_metrics(self, on: bool):
+        self.metrics_panel.setVisible(on)
+        self.metrics_panel.refresh()
+
+    def _update_http_stats(self):
+        st = shared_sessions().stats()
+        if st["requests"]:
+            self.lbl_http.setText(f"{st['reused']} yeniden / {st['connections']} yeni, "
+                                  f"{st['bytes_in'] / 1024:.0f} KB")
+
+    @Slot(float)
+    def _on_threshold_changed(self, value: float):
+        self.table.items_model.set_flag_threshold(value if value > 0 else None)
+
+    @Slot(int)
+    def _on_threshold_crossed(self, i: int):
+        ratio = self.store.ratio[i]
+        self.lbl_watch.setText(f"{self.store.names[i]} — kâr %{ratio:.1f} (eşik aşıldı)")
+        QApplication.alert(self)
+
+    @Slot(int, int)
+    def _on_viewport_changed(self, first: int, last: int):
+        if self._worker is None:
+            return
+        model = self.table.items_model
+        keys = self.store.keys
+        order = model._order
+        try:
+            self._worker.prioritize([keys[order[r]] for r in range(first, min(last, len(order) - 1) + 1)])
+        except RuntimeError:
+            pass    # işçi bitmiş, nesnesi silinmiş olabilir
+
+    @Slot(float)
+    def _on_rate_changed(self, rate: float):
+        self.lbl_rate.setText(f"{rate:.2f} istek/sn")
+
+    @Slot()
+    def _on_fetch_finished(self):
+        # Kâr/oran her progress'te satır bazında güncellendi; tam geçiş gerekmez
+        watching = self._watching
+        self._results_timer.stop()
+        self._flush_results()
+        self._results = None
+        self.table.items_model.refresh_filter()
+        self._update_http_stats()
+        self.metrics_panel.detach()
+        self._worker = None
+        self._watching = False
+        self.btn_fetch.setEnabled(True)
+        self.btn_run.setEnabled(True)
+        self.btn_import.setEnabled(True)
+        self.btn_stop.setEnabled(False)
+        if watching:
+            self.lbl_watch.setText("İzleme durduruldu.")
+            return
+        QMessageBox.information(self, "Bitti", "Steam fiyatları çekildi ve tabloya işlendi.")
+
+    # -------- JSON uyarlayıcıları --------
+    @Slot()
+    def import_json(self):
+        txt = self.json_edit.toPlainText().strip()
+        if not txt:
+            QMessageBox.warning(self, "Uyarı", "JSON alanı boş!")
+            return
+        self._start_import(text=txt)
+
+    def _import_blocked(self) -> bool:
+        """Çekme sürerken depo değiştirilmez: işçi sonuçları anahtarla satırlara yazıyor."""
+        if self._worker is None:
+            return False
+        QMessageBox.information(self, "Bilgi", "Fiyat çekme sürerken içe aktarılamaz; önce durdurun.")
+        return True
+
+    def _start_import(self, path: Optional[str] = None, text: Optional[str] = None):
+        """Akışlı içe aktarmayı başlat; satırlar partiler halinde tabloya eklenir."""
+        if self._import_blocked():
+            return
+        if self._import_worker is not None:
+            self._import_worker.stop()      # önceki içe aktarmanın kalan partileri yok sayılır
+        self.populate_table(ItemStore())
+        self.btn_import.setEnabled(False)
+        self.btn_fetch.setEnabled(False)
+        self.btn_import.setText("İçe aktarılıyor…")
+
+        self._import_gen += 1
+        thread = QThread(self)
+        worker = ItemImportWorker(self._import_gen, path=path, text=text)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.batch_ready.connect(self._on_import_batch)
+        worker.failed.connect(self._on_import_failed)
+        worker.finished.connect(self._on_import_finished)
+        worker.finished.connect(thread.quit)
+        worker.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        self._imports[self._import_gen] = (thread, worker)
+        self._import_worker = worker
+        thread.start()
+
+    @Slot(int, object)
+    def _on_import_batch(self, gen: int, batch: ItemStore):
+        if gen != self._import_gen:
+            return
+        start = len(self.store)
+        self.table.items_model.append_rows(batch)
+        for i, key in enumerate(batch.keys, start):
+            rows = self._row_by_key.get(key)
+            if rows is None:
+                self._row_by_key[key] = [i]
+            else:
+                rows.append(i)
+        self.btn_import.setText(f"İçe aktarılıyor… {len(self.store)}")
+
+    @Slot(int, str)
+    def _on_import_failed(self, gen: int, msg: str):
+        if gen != self._import_gen:
+            return
+        QMessageBox.critical(self, "Hata", f"JSON okunamadı/uyarlanamadı:\n{msg}")
+
+    @Slot(int, int)
+    def _on_import_finished(self, gen: int, total: int):
+        self._imports.pop(gen, None)
+        if gen != self._import_gen:
+            return
+        self._import_worker = None
+        self.btn_import.setText("İçe Aktar")
+        self.btn_import.setEnabled(self._worker is None)
+        self.btn_fetch.setEnabled(self._worker is None)
+
+    def populate_table(self, store: ItemStore):
+        # Görseller toplu istenmez: ThumbnailDelegate satır ekrana gelince ister
+        self.store = store
+        self._row_by_key = store.rows_by_key()
+        self.table.set_store(store)
+        self.table.setSortingEnabled(True)
+
+    @Slot(str, object)
+    def on_image_ready(self, url, pixmap):
+        self.table.update_image(url, pixmap)
+
+    @Slot()
+    def run_compute(self):
+        self.table.compute_profits()
+        self.table.items_model.refresh_filter()
+        QMessageBox.information(self, "Tamam", "Kâr/Oran güncellendi.")
+
+    def apply_filter(self, text):
+        self._filter_timer.stop()
+        self.table.items_model.set_filter(text)
+
+    @Slot()
+    def _apply_filter_text(self):
+        self.apply_filter(self.filter_edit.text())
+
+    def open_json_file(self):
+        path, _ = QFileDialog.getOpenFileName(self, "JSON Dosyası Aç", "", "JSON (*.json);;Tümü (*.*)")
+        if not path:
+            return
+        # Dosya akışla içe aktarılır; yalnız küçük dosyalar düzenleyicide de gösterilir
+        try:
+            small = os.path.getsize(path) <= LARGE_TEXT_CHARS
+            if small:
+                with open(path, "r", encoding="utf-8-sig") as f:
+                    self.json_edit.setPlainText(f.read())
+            elif self._worker is None:
+                self.json_edit.clear()
+                self.json_edit.setPlaceholderText(f"{os.path.basename(path)} doğrudan içe aktarıldı "
+                                                  f"(büyük dosya düzenleyicide gösterilmez).")
+        except OSError as e:
+            QMessageBox.critical(self, "Hata", f"Dosya açılamadı:\n{e}")
+            return
+        if self._worker is not None:
+            # Çekme sürerken küçük dosya yalnız düzenleyiciye konur (çekme bitince İçe Aktar)
+            if not small:
+                self._import_blocked()
+            return
+        self._start_import(path=path)
+
+    def export_csv_file(self):
+        """Tabloyu görünen sıra ve filtreyle CSV'ye yaz."""
+        if not len(self.store):
+            QMessageBox.information(self, "Bilgi", "Önce JSON'u içe aktar.")
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "CSV Olarak Kaydet", "prices.csv", "CSV (*.csv)")
+        if not path:
+            return
+        try:
+            model = self.table.items_model
+            rows = [model.storage_index(r) for r in range(model.rowCount())]
+            n = self.store.export_csv(path, rows)
+            QMessageBox.information(self, "Kaydedildi", f"{n} satır kaydedildi:\n{path}")
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", f"Kaydedilemedi:\n{e}")
+
+    def import_nameids(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Name ID Listesi Aç", "",
+                                              "JSON/CSV (*.json *.csv);;Tümü (*.*)")
+        if not path:
+            return
+        try:
+            added = self.price_cache.nameids.import_file(path)
+            QMessageBox.information(self, "Tamam",
+                                    f"{added} yeni name id eklendi (toplam {len(self.price_cache.nameids)}).")
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", f"Name ID listesi okunamadı:\n{e}")
+
+    def export_nameids(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Name ID Listesini Kaydet", "nameids.json",
+                                              "JSON (*.json);;CSV (*.csv)")
+        if not path:
+            return
+        try:
+            n = self.price_cache.nameids.export_file(path)
+            QMessageBox.information(self, "Kaydedildi", f"{n} name id kaydedildi:\n{path}")
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", f"Kaydedilemedi:\n{e}")
+
+    def save_json_file(self):
+        path, _ = QFileDialog.getSaveFileName(self, "JSON Olarak Kaydet", "items.json", "JSON (*.json)")
+        if not path:
+            return
+        try:
+            txt = self.json_edit.toPlainText()
+            json.loads(txt)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(txt)
+            QMessageBox.information(self, "Kaydedildi", f"JSON kaydedildi:\n{path}")
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", f"Kaydedilemedi:\n{e}")
+
+
+def main():
+    app = QApplication(sys.argv)
+    app.setStyle("Fusion")  # isteğe bağlı; set_ui_mode zaten paleti basıyor
+    w = MainWindow()
+    w.set_ui_mode("dark")   # <-- başlangıç modu
+    w.show()
+    rc = app.exec()
+    shared_sessions().close()
+    sys.exit(rc)
+
+
+
+if __name__ == "__main__":
+    main()
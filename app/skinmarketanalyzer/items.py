@@ -0,0 +1,367 @@
+# items.py — içe aktarılan JSON'u tablo/çekici biçimine uyarlama
+
+import re, sys, csv, json
+from array import array
+from urllib.parse import unquote
+
+from .names import market_hash_name, pricempire_urls
+
+
+# -------------------- JSON uyarlayıcıları --------------------
+def parse_items_json(txt: str) -> list:
+    """Liste ya da {"items": [...]} biçimindeki JSON metninden ham item listesini döndür."""
+    data = json.loads(txt)
+    if isinstance(data, dict) and "items" in data and isinstance(data["items"], list):
+        return data["items"]
+    if isinstance(data, list):
+        return data
+    raise ValueError("Beklenen format: liste veya {'items': [...]}")
+
+
+# -------------------- Akışlı (parça parça) JSON okuma --------------------
+_WS = " \t\r\n"
+_NUMBER_TAIL = re.compile(r"[0-9.eE+-]*")   # sayıdan sonra tampon sonuna dek yalnız bunlar → sayı sürebilir
+
+
+class _JsonStream:
+    """Dosyadan parça parça okuyup JSON değerlerini tek tek çözen yardımcı.
+
+    Tüm metin belleğe alınmaz; tampon yalnız o an çözülen değeri kapsayacak
+    kadar büyür.
+    """
+    def __init__(self, fp, chunk_size: int = 1 << 20):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        data = self.fp.read(self.chunk_size)
+        if not data:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Boşlukları atla, sıradaki karakteri döndür ("" → dosya sonu)."""
+        while True:
+            buf, p = self.buf, self.pos
+            n = len(buf)
+            while p < n and buf[p] in _WS:
+                p += 1
+            self.pos = p
+            if p < n:
+                return buf[p]
+            if not self._fill():
+                return ""
+
+    def expect(self, ch: str):
+        if self.peek() != ch:
+            raise ValueError(f"Geçersiz JSON: '{ch}' bekleniyordu")
+        self.pos += 1
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                v, end = self._decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # tamponun sonunda biten sayı/literal yarıda kesilmiş olabilir; "12." / "1e-"
+            # gibi kesik sayıları raw_decode önekten (12 / 1) çözer, bu yüzden kuyruğa da bakılır
+            cut = end == len(self.buf) or (type(v) in (int, float) and _NUMBER_TAIL.fullmatch(self.buf, end))
+            if cut and self._fill():
+                continue
+            self.pos = end
+            return v
+
+
+def _iter_array(st: _JsonStream):
+    st.expect("[")
+    if st.peek() == "]":
+        st.pos += 1
+        return
+    while True:
+        v = st.value()
+        if isinstance(v, dict):
+            yield v
+        c = st.peek()
+        st.pos += 1
+        if c == "]":
+            return
+        if c != ",":
+            raise ValueError("Geçersiz JSON: liste öğeleri arasında ',' bekleniyordu")
+
+
+def _iter_object(st: _JsonStream):
+    # {"items": [...]} ise liste akıtılır; değilse nesnenin kendisi bir item'dır (JSON Lines)
+    st.peek()
+    try:
+        # Hızlı yol: nesne tamponda bütünse tek seferde çöz (JSON Lines satırları)
+        v, end = st._decoder.raw_decode(st.buf, st.pos)
+    except json.JSONDecodeError:
+        v = None
+    if isinstance(v, dict):
+        st.pos = end
+        items = v.get("items")
+        if isinstance(items, list):
+            yield from (it for it in items if isinstance(it, dict))
+        else:
+            yield v
+        return
+    st.expect("{")
+    fields, had_items = {}, False
+    if st.peek() == "}":
+        st.pos += 1
+        return
+    while True:
+        key = st.value()
+        if not isinstance(key, str):
+            raise ValueError("Geçersiz JSON: nesne anahtarı metin olmalı")
+        st.expect(":")
+        if key == "items" and st.peek() == "[":
+            had_items = True
+            yield from _iter_array(st)
+        else:
+            fields[key] = st.value()
+        c = st.peek()
+        st.pos += 1
+        if c == "}":
+            break
+        if c != ",":
+            raise ValueError("Geçersiz JSON: nesne alanları arasında ',' bekleniyordu")
+    if not had_items:
+        yield fields
+
+
+def iter_items(fp):
+    """Liste, {"items": [...]} ya da JSON Lines akışından ham item'ları tek tek üret."""
+    st = _JsonStream(fp)
+    while True:
+        c = st.peek()
+        if c == "":
+            return
+        if c == "[":
+            yield from _iter_array(st)
+        elif c == "{":
+            yield from _iter_object(st)
+        else:
+            raise ValueError("Beklenen format: liste, {'items': [...]} veya JSON Lines")
+
+
+def iter_items_file(path: str):
+    with open(path, "r", encoding="utf-8-sig") as f:
+        yield from iter_items(f)
+
+
+def iter_batches(items, size: int):
+    """Item akışını `size`'lık listelere böl."""
+    batch = []
+    for it in items:
+        batch.append(it)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _image_url(it: dict) -> str:
+    img = it.get("image_url") or it.get("icon_url") or it.get("image") or ""
+    try:
+        img = unquote(img)
+    except Exception:
+        pass
+    return img
+
+
+def normalize_items(raw) -> list[dict]:
+    out = []
+    for it in raw:
+        img = _image_url(it)
+        out.append({
+            "name": it.get("name", ""),
+            "quality": it.get("quality", ""),
+            "image_url": img,
+            "site_price": it.get("sell_price", ""),
+            "market_price": it.get("market_price", ""),
+            "_raw": {
+                "id": it.get("id"),
+                "color": it.get("color"),
+                "stattrak": it.get("stattrak"),
+                "type": it.get("type"),
+                "link": it.get("link") or it.get("url"),
+                "nameid": it.get("item_nameid") or it.get("nameid"),
+            }
+        })
+    return out
+
+
+# -------------------- Sütun bazlı item deposu --------------------
+NAN = float("nan")
+PRICE_COLUMNS = ("site", "market", "order_price", "median", "profit", "ratio")
+EXPORT_HEADER = ["name", "quality", "market_hash_name", "site_price", "market_low",
+                 "median", "profit", "profit_ratio"]
+
+
+def _to_float(v) -> float:
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return NAN
+
+
+def _intern(v) -> str:
+    return sys.intern(str(v)) if v else ""
+
+
+def _numpy():
+    """NumPy isteğe bağlı: kuruluysa toplu hesaplar vektörel yapılır, yoksa saf Python."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _same(a: float, b: float) -> bool:
+    return a == b or (a != a and b != b)
+
+
+class ItemStore:
+    """Item başına dict yerine sütun dizileri: fiyatlar array('d') (boş → NaN),
+    tekrar eden metinler (isim, kalite, renk, tip) sys.intern ile paylaşılır.
+
+    Depo indeksi sabittir; tablo, filtre, sıralama, çekici ve dışa aktarma
+    bu indeksle okur.
+    """
+    __slots__ = ("names", "qualities", "image_urls", "keys", "stattrak",
+                 "ids", "colors", "types", "links", "nameids") + PRICE_COLUMNS
+
+    def __init__(self):
+        self.names: list[str] = []
+        self.qualities: list[str] = []
+        self.image_urls: list[str] = []
+        self.keys: list[str] = []          # market_hash_name
+        self.stattrak = bytearray()
+        self.ids: list = []
+        self.colors: list[str] = []
+        self.types: list[str] = []
+        self.links: list = []
+        self.nameids: list = []
+        for col in PRICE_COLUMNS:
+            setattr(self, col, array("d"))
+
+    def __len__(self):
+        return len(self.names)
+
+    @classmethod
+    def from_raw(cls, raw) -> "ItemStore":
+        store = cls()
+        store.extend_raw(raw)
+        return store
+
+    def extend(self, other: "ItemStore"):
+        """Başka bir deponun satırlarını sona ekle (akışlı içe aktarma partileri)."""
+        for name in self.__slots__:
+            getattr(self, name).extend(getattr(other, name))
+
+    def extend_raw(self, raw):
+        """Ham JSON item'larını (normalize_items ile aynı kurallarla) ekle."""
+        for it in raw:
+            if not isinstance(it, dict):
+                continue
+            name = _intern(it.get("name", ""))
+            stat = bool(it.get("stattrak"))
+            self.names.append(name)
+            self.qualities.append(_intern(it.get("quality", "")))
+            self.image_urls.append(_image_url(it))
+            mh = market_hash_name(name, stat)
+            self.keys.append(name if mh == name else sys.intern(mh))
+            self.stattrak.append(1 if stat else 0)
+            self.ids.append(it.get("id"))
+            self.colors.append(_intern(it.get("color")))
+            self.types.append(_intern(it.get("type")))
+            self.links.append(it.get("link") or it.get("url"))
+            self.nameids.append(it.get("item_nameid") or it.get("nameid"))
+            self.site.append(_to_float(it.get("sell_price", "")))
+            self.market.append(_to_float(it.get("market_price", "")))
+            self.order_price.append(NAN)
+            self.median.append(NAN)
+            self.profit.append(NAN)
+            self.ratio.append(NAN)
+
+    def rows_by_key(self) -> dict[str, list[int]]:
+        """market_hash_name → o anahtara sahip tüm depo indeksleri (aynı skin birden çok kez olabilir)."""
+        out: dict[str, list[int]] = {}
+        for i, key in enumerate(self.keys):
+            rows = out.get(key)
+            if rows is None:
+                out[key] = [i]
+            else:
+                rows.append(i)
+        return out
+
+    def update_profit(self, i: int) -> bool:
+        """Tek satırın kâr/oranını yeniden hesapla; değer değiştiyse True."""
+        s, m = self.site[i], self.market[i]
+        if s != s or m != m:  # NaN
+            p = r = NAN
+        else:
+            p = m - s
+            r = (p / s * 100.0) if s > 0 else 0.0
+        old_p, old_r = self.profit[i], self.ratio[i]
+        self.profit[i], self.ratio[i] = p, r
+        return not (_same(p, old_p) and _same(r, old_r))
+
+    def compute_profits(self) -> list[int]:
+        """Kâr/oranı tüm depoda tek geçişte hesapla; değişen depo indekslerini döndür."""
+        np = _numpy()
+        if np is None or not len(self):
+            return [i for i in range(len(self)) if self.update_profit(i)]
+        # array('d') tamponları üzerinde kopyasız görünümler
+        site = np.frombuffer(self.site, dtype=np.float64)
+        market = np.frombuffer(self.market, dtype=np.float64)
+        profit = np.frombuffer(self.profit, dtype=np.float64)
+        ratio = np.frombuffer(self.ratio, dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            p = market - site
+            r = np.where(site > 0, p / site * 100.0, 0.0)
+        r[np.isnan(p)] = np.nan
+        changed = ~(((p == profit) | (np.isnan(p) & np.isnan(profit))) &
+                    ((r == ratio) | (np.isnan(r) & np.isnan(ratio))))
+        profit[:] = p
+        ratio[:] = r
+        del site, market, profit, ratio  # tampon kilidini bırak (array yeniden boyutlanabilsin)
+        return np.flatnonzero(changed).tolist()
+
+    def pricempire_urls(self, rows=None) -> list:
+        """Verilen depo indeksleri (varsayılan: hepsi) için Pricempire linkleri, tek geçişte."""
+        if rows is None:
+            return pricempire_urls(self.names, self.qualities, self.links)
+        names, qualities, links = self.names, self.qualities, self.links
+        return pricempire_urls([names[i] for i in rows], [qualities[i] for i in rows],
+                               [links[i] for i in rows])
+
+    def export_csv(self, path: str, rows=None) -> int:
+        """Verilen depo indekslerini (varsayılan: hepsi) CSV'ye yaz."""
+        rows = range(len(self)) if rows is None else rows
+        n = 0
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            wr = csv.writer(f)
+            wr.writerow(EXPORT_HEADER)
+            for i in rows:
+                wr.writerow([self.names[i], self.qualities[i], self.keys[i]] +
+                            [("" if v != v else f"{v:.2f}") for v in (
+                                self.site[i], self.market[i], self.median[i],
+                                self.profit[i], self.ratio[i])])
+                n += 1
+        return n
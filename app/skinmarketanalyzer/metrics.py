@@ -0,0 +1,287 @@
+# metrics.py — çekme hattı metrikleri: istek olayları, sayaçlar, histogramlar, dışa aktarma
+
+from typing import Optional
+import json, time, threading
+from collections import Counter, deque
+
+
+# -------------------- Histogram --------------------
+# Üst sınırlar (sn); Prometheus "le" etiketleri bunlardan üretilir
+LATENCY_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    """Sabit kovalı histogram (kilitsiz; FetchMetrics kilidi altında kullanılır)."""
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)     # son kova: +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, v: float):
+        i = 0
+        for i, ub in enumerate(self.buckets):
+            if v <= ub:
+                break
+        else:
+            i = len(self.buckets)
+        self.counts[i] += 1
+        self.count += 1
+        self.sum += v
+
+    def quantile(self, q: float) -> float:
+        """Kova içinde doğrusal ara değerle yaklaşık yüzdelik (sn)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen, lower = 0, 0.0
+        for i, c in enumerate(self.counts):
+            upper = self.buckets[i] if i < len(self.buckets) else lower * 2 or 1.0
+            if c and seen + c >= rank:
+                return lower + (upper - lower) * (rank - seen) / c
+            seen += c
+            lower = upper
+        return lower
+
+    def cumulative(self):
+        """(le, birikimli adet) çiftleri; son çift ("+Inf", count)."""
+        total = 0
+        for ub, c in zip(self.buckets, self.counts):
+            total += c
+            yield (f"{ub:g}", total)
+        yield ("+Inf", self.count)
+
+
+# -------------------- Metrik toplayıcı --------------------
+class FetchMetrics:
+    """Bir çekme çalıştırmasının thread güvenli metrikleri.
+
+    PriceFetcher her HTTP isteği için request(), her önbellek bakışı için
+    cache(), Steam'in her success:false yanıtı için reject(), yutulan her
+    hata için error(), biten her item için item() çağırır.
+    snapshot() panel/CLI için özet verir; to_json() ve to_prometheus() dışa
+    aktarır.
+    """
+    THROUGHPUT_WINDOW = 30.0    # item/sn için kayan pencere (sn)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.time()
+        self.total_items = 0            # 0 → bilinmiyor (izleme modu)
+        self.items = Counter()          # ok / empty
+        self.requests = Counter()       # (uç, durum) → adet
+        self.latency: dict[str, Histogram] = {}
+        self.wait = Histogram()         # token bucket bekleme süresi
+        self.delay = Histogram()        # istemci tarafı mini gecikme (hız sınırından bağımsız)
+        self.bytes = Counter()          # uç → bayt
+        self.retries = Counter()        # uç → yeniden deneme
+        self.throttles = Counter()      # uç → 429 yanıtı (yeniden denenip başaranlar dahil)
+        self.cache_lookups = Counter()  # (uç, hit|stale|miss) → adet
+        self.rejects = Counter()        # uç → success:false yanıtı
+        self.errors = Counter()         # (yer, istisna türü) → adet
+        self.fallbacks = 0              # priceoverview'da fiyat yok → histogram yedeği
+        self._done = deque()            # son item zamanları (throughput)
+
+    # ---- Olaylar ----
+    def start(self, total_items: int = 0):
+        with self._lock:
+            self.started = time.time()
+            self.total_items = max(0, int(total_items))
+
+    def request(self, endpoint: str, status, latency: float, nbytes: int = 0,
+                retries: int = 0, wait: float = 0.0, delay: float = 0.0):
+        """Tek mantıksal istek; status HTTP kodu ya da "timeout" / "error" / "cancelled".
+
+        wait yalnız token bucket beklemesi, delay istemcinin kendi eklediği
+        rastgele gecikmedir; hız sınırı teşhisi yalnız wait'e bakar.
+        """
+        with self._lock:
+            self.requests[(endpoint, str(status))] += 1
+            h = self.latency.get(endpoint)
+            if h is None:
+                h = self.latency[endpoint] = Histogram()
+            h.observe(latency)
+            self.wait.observe(wait)
+            self.delay.observe(delay)
+            self.bytes[endpoint] += nbytes
+            self.retries[endpoint] += retries
+
+    def throttle(self, endpoint: str):
+        with self._lock:
+            self.throttles[endpoint] += 1
+
+    def reject(self, endpoint: str):
+        with self._lock:
+            self.rejects[endpoint] += 1
+
+    def cache(self, endpoint: str, result: str):
+        with self._lock:
+            self.cache_lookups[(endpoint, result)] += 1
+
+    def fallback(self):
+        with self._lock:
+            self.fallbacks += 1
+
+    def error(self, where: str, exc: BaseException):
+        with self._lock:
+            self.errors[(where, type(exc).__name__)] += 1
+
+    def item(self, ok: bool):
+        now = time.time()
+        with self._lock:
+            self.items["ok" if ok else "empty"] += 1
+            done = self._done
+            done.append(now)
+            while done and now - done[0] > self.THROUGHPUT_WINDOW:
+                done.popleft()
+
+    # ---- Özet ----
+    def snapshot(self) -> dict:
+        now = time.time()
+        with self._lock:
+            done = sum(self.items.values())
+            recent = [t for t in self._done if now - t <= self.THROUGHPUT_WINDOW]
+            span = min(self.THROUGHPUT_WINDOW, now - self.started)
+            rate = len(recent) / span if span > 0 else 0.0
+            total_req = sum(self.requests.values())
+            failed = sum(n for (_, st), n in self.requests.items() if not st.startswith("2"))
+            endpoints = {}
+            for ep, h in self.latency.items():
+                reqs = sum(n for (e, _), n in self.requests.items() if e == ep)
+                errs = sum(n for (e, st), n in self.requests.items() if e == ep and not st.startswith("2"))
+                endpoints[ep] = {
+                    "requests": reqs, "errors": errs,
+                    "p50_ms": round(h.quantile(0.5) * 1000, 1),
+                    "p99_ms": round(h.quantile(0.99) * 1000, 1),
+                    "bytes": self.bytes[ep], "retries": self.retries[ep],
+                    "throttled": self.throttles[ep],
+                    "success_false": self.rejects[ep],
+                }
+            # İsabet oranı yalnız sonuç önbelleğinden (item başına bir bakış); uç ve
+            # nameid bakışları aynı item için tekrar sayılır
+            hits = self.cache_lookups[("result", "hit")]
+            lookups = sum(n for (ep, _), n in self.cache_lookups.items() if ep == "result")
+            remaining = self.total_items - done if self.total_items else 0
+            busy = sum(h.sum for h in self.latency.values()) + self.delay.sum
+            return {
+                "elapsed": round(now - self.started, 1),
+                "items_done": done,
+                "items_total": self.total_items,
+                "items_empty": self.items["empty"],
+                "throughput": round(rate, 2),
+                "eta_seconds": round(remaining / rate, 1) if remaining > 0 and rate > 0 else None,
+                "requests": total_req,
+                "error_rate": round(failed / total_req, 4) if total_req else 0.0,
+                "throttled": sum(self.throttles.values()),
+                "success_false": sum(self.rejects.values()),
+                "cache_hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+                "avg_wait_ms": round(self.wait.sum / self.wait.count * 1000, 1) if self.wait.count else 0.0,
+                "avg_delay_ms": round(self.delay.sum / self.delay.count * 1000, 1) if self.delay.count else 0.0,
+                # İstek süresinin ne kadarı token bucket'ta beklemeyle geçti (hız sınırı mı, Steam mi?);
+                # mini gecikme yalnız paydaya girer
+                "wait_share": round(self.wait.sum / (self.wait.sum + busy), 3) if self.wait.sum + busy else 0.0,
+                "fallbacks": self.fallbacks,
+                "errors": sum(self.errors.values()),
+                "endpoints": endpoints,
+            }
+
+    # ---- Dışa aktarma ----
+    def to_json(self) -> str:
+        snap = self.snapshot()
+        with self._lock:
+            snap["requests_by_status"] = {f"{ep} {st}": n for (ep, st), n in sorted(self.requests.items())}
+            snap["cache_lookups"] = {f"{ep} {r}": n for (ep, r), n in sorted(self.cache_lookups.items())}
+            snap["errors_by_type"] = {f"{w} {t}": n for (w, t), n in sorted(self.errors.items())}
+        return json.dumps(snap, ensure_ascii=False, indent=2)
+
+    def to_prometheus(self, prefix: str = "skinmarket") -> str:
+        """Prometheus metin biçimi (node_exporter textfile toplayıcısına yazılabilir)."""
+        out: list[str] = []
+
+        def family(name, kind, help_text):
+            out.append(f"# HELP {prefix}_{name} {help_text}")
+            out.append(f"# TYPE {prefix}_{name} {kind}")
+
+        def sample(name, value, **labels):
+            lab = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+            out.append(f"{prefix}_{name}{{{lab}}} {value}" if lab else f"{prefix}_{name} {value}")
+
+        with self._lock:
+            family("http_requests_total", "counter", "Steam HTTP istekleri (uç, durum)")
+            for (ep, st), n in sorted(self.requests.items()):
+                sample("http_requests_total", n, endpoint=ep, status=st)
+            family("http_request_duration_seconds", "histogram", "İstek süresi (yeniden denemeler dahil)")
+            for ep, h in sorted(self.latency.items()):
+                for le, c in h.cumulative():
+                    sample("http_request_duration_seconds_bucket", c, endpoint=ep, le=le)
+                sample("http_request_duration_seconds_sum", f"{h.sum:.6f}", endpoint=ep)
+                sample("http_request_duration_seconds_count", h.count, endpoint=ep)
+            family("http_response_bytes_total", "counter", "Alınan gövde baytları")
+            for ep, n in sorted(self.bytes.items()):
+                sample("http_response_bytes_total", n, endpoint=ep)
+            family("http_retries_total", "counter", "429/zaman aşımı sonrası yeniden denemeler")
+            for ep, n in sorted(self.retries.items()):
+                sample("http_retries_total", n, endpoint=ep)
+            family("http_throttled_total", "counter", "429 yanıtları (her deneme)")
+            for ep, n in sorted(self.throttles.items()):
+                sample("http_throttled_total", n, endpoint=ep)
+            family("ratelimit_wait_seconds", "histogram", "Token bucket bekleme süresi")
+            for le, c in self.wait.cumulative():
+                sample("ratelimit_wait_seconds_bucket", c, le=le)
+            sample("ratelimit_wait_seconds_sum", f"{self.wait.sum:.6f}")
+            sample("ratelimit_wait_seconds_count", self.wait.count)
+            family("client_delay_seconds", "histogram", "İstemci tarafı mini gecikme (token bucket hariç)")
+            for le, c in self.delay.cumulative():
+                sample("client_delay_seconds_bucket", c, le=le)
+            sample("client_delay_seconds_sum", f"{self.delay.sum:.6f}")
+            sample("client_delay_seconds_count", self.delay.count)
+            family("success_false_total", "counter", "Steam success:false yanıtları")
+            for ep, n in sorted(self.rejects.items()):
+                sample("success_false_total", n, endpoint=ep)
+            family("cache_lookups_total", "counter", "Önbellek bakışları (hit/stale/miss)")
+            for (ep, r), n in sorted(self.cache_lookups.items()):
+                sample("cache_lookups_total", n, endpoint=ep, result=r)
+            family("fallbacks_total", "counter", "priceoverview'da fiyat yok → histogram yedeği")
+            sample("fallbacks_total", self.fallbacks)
+            family("errors_total", "counter", "Yakalanan hatalar (yer, tür)")
+            for (w, t), n in sorted(self.errors.items()):
+                sample("errors_total", n, where=w, type=t)
+            family("items_total", "counter", "Biten item'lar (ok: fiyat bulundu)")
+            for r, n in sorted(self.items.items()):
+                sample("items_total", n, result=r)
+        return "\n".join(out) + "\n"
+
+    def export(self, path: str) -> None:
+        """.prom/.txt → Prometheus metni, diğerleri → JSON."""
+        text = self.to_prometheus() if path.lower().endswith((".prom", ".txt")) else self.to_json()
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+def _escape(v) -> str:
+    return str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def diagnose(snap: dict) -> str:
+    """Yavaşlığın baskın nedeni: hız sınırı, Steam gecikmesi, yedek istekler ya da hatalar."""
+    done = snap["items_done"]
+    if not snap["requests"]:
+        return "önbellek" if done else "-"
+    if snap["error_rate"] >= 0.2:
+        return "hatalar"
+    if done and snap["fallbacks"] / done >= 0.3:
+        return "yedek istekler (listings/histogram)"
+    if (snap["throttled"] + snap["success_false"]) / snap["requests"] >= 0.1 or snap["wait_share"] >= 0.6:
+        return "hız sınırı"
+    return "Steam gecikmesi"
+
+
+def summary_line(metrics: Optional[FetchMetrics]) -> str:
+    """[METRICS] satırı için kısa özet."""
+    if metrics is None:
+        return "-"
+    s = metrics.snapshot()
+    eps = " ".join(f"{ep}:{e['requests']}/p50={e['p50_ms']:.0f}ms" for ep, e in sorted(s["endpoints"].items()))
+    return (f"items={s['items_done']} {s['throughput']:.2f}/s err={s['error_rate']:.1%} "
+            f"429={s['throttled']} cache_hit={s['cache_hit_ratio']:.0%} wait_share={s['wait_share']:.0%} "
+            f"fallbacks={s['fallbacks']} errors={s['errors']} {eps} bottleneck={diagnose(s)}")
@@ -0,0 +1,331 @@
+# names.py — item isimleri, fiyat metni ve Pricempire URL yardımcıları (Qt'siz, hafif)
+
+from typing import Optional
+import re
+from functools import lru_cache
+from html import unescape
+import urllib.parse
+
+# Ad/slug/URL sonuçları aynı ad için tekrar tekrar istenir (tablo, arama, dışa aktarma)
+NAME_CACHE_SIZE = 1 << 17
+
+
+# ------------ Pricempire yardımcıları ------------
+WEAR_MAP = {
+    "Factory New": "factory-new",
+    "Minimal Wear": "minimal-wear",
+    "Field-Tested": "field-tested",
+    "Well-Worn": "well-worn",
+    "Battle-Scarred": "battle-scarred",
+}
+WEARS = list(WEAR_MAP.keys())
+
+# Derlenmiş desenler (her çağrıda yeniden derlenmesin / önbellekte aranmasın)
+_SOUVENIR_PREFIX_RE = re.compile(r"(?i)^\s*souvenir\s+")
+_SOUVENIR_WORD_RE = re.compile(r"(?i)\bsouvenir\b")
+_MULTI_SPACE_RE = re.compile(r"\s{2,}")
+_WEAR_SUFFIX_RE = re.compile(r"\(([^)]+)\)$")
+_STATTRAK_WORD_RE = re.compile(r"\bstattrak\b", re.I)
+_SLUG_STRIP_RE = re.compile(r"[^a-z0-9\s-]")
+_SLUG_SPACE_RE = re.compile(r"\s+")
+_MULTI_DASH_RE = re.compile(r"-{2,}")
+_MULTI_SLASH_RE = re.compile(r"/{2,}")
+_MONEY_STRIP_RE = re.compile(r"[^\d,.\-]")
+
+def _strip_word_souvenir(s: str) -> str:
+    # 'Souvenir ' öneki veya metin içindeki bağımsız 'souvenir' kelimesini sil
+    s = _SOUVENIR_PREFIX_RE.sub("", s)              # baştaki "Souvenir "
+    s = _SOUVENIR_WORD_RE.sub("", s)                # kalan bağımsız kelime
+    return _MULTI_SPACE_RE.sub(" ", s).strip()      # fazla boşlukları temizle
+
+def is_glove_item(name: str, weapon: str = "", skin: str = "") -> bool:
+    txt = f"{name} {weapon} {skin}".lower()
+    # minimum kelimeler: glove, gloves, hand wraps
+    return ("glove" in txt) or ("gloves" in txt) or ("hand wraps" in txt)
+def is_souvenir_item(name: str) -> bool:
+    return "souvenir" in name.lower()
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def slugify(s: str) -> str:
+    s = s.lower()
+    s = s.replace("™", "")
+    # apostrofları tamamen kaldır (Chantico's -> chanticos)
+    s = s.replace("'", "").replace("\u2019", "")  # \u2019 = ’
+    # harf/rakam/boşluk/tire dışındakileri boşluğa çevir
+    s = _SLUG_STRIP_RE.sub(" ", s)
+    # boşlukları tek tireye çevir
+    s = _SLUG_SPACE_RE.sub("-", s.strip())
+    # birden fazla tireyi teke indir
+    s = _MULTI_DASH_RE.sub("-", s)
+    return s
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def _parse_item_name(name: str) -> tuple:
+    stat = "stattrak" in name.lower()
+    s = name.replace("StatTrak\u2122", "").replace("StatTrak", "").strip()
+    wear = None
+    m = _WEAR_SUFFIX_RE.search(s)
+    if m and m.group(1) in WEAR_MAP:
+        wear = m.group(1)
+        s = s[:m.start()].strip()
+    weapon, sep, skin = s.partition("|")
+    return weapon.strip(), skin.strip(), wear, stat
+
+
+def parse_item_name(name: str) -> dict:
+    """Ad → {weapon, skin, wear, stat}; ayrıştırma ad başına bir kez yapılır (sonuç yeni dict)."""
+    weapon, skin, wear, stat = _parse_item_name(name)
+    return {"weapon": weapon, "skin": skin, "wear": wear, "stat": stat}
+
+
+# ---- Agent helpers (added) ----
+AGENT_TEAM_TOKENS = {
+    "sabre","elite crew","the professionals","phoenix","gendarmerie nationale",
+    "fbi swat","s.w.a.t","swat","fbi hrt","gsg-9","gendarmerie","usaf tacp","sneaky beaky",
+    "sasco","sas","nzsas","seal","navi seals","nswc seal","jungle rebel","ground rebel",
+    "guerrilla warfare","pirate","professor","dragomir","rezan","mccoy","judge","ground",
+    "professionals","elite","crew","tacp","gendarmerie nationale"
+}
+
+KNOWN_WEAPON_SLUGS = frozenset({
+    "ak-47","m4a1-s","m4a4","awp","desert-eagle","glock-18","usp-s","p250",
+    "five-seven","cz75-auto","tec-9","p2000","dual-berettas","r8-revolver",
+    "famas","galil-ar","sg-553","aug","ssg-08","scar-20","g3sg1",
+    "mac-10","mp9","mp7","mp5-sd","p90","ump-45","pp-bizon","bizon",
+    "nova","xm1014","mag-7","sawed-off","m249","negev",
+    "karambit","bayonet","m9-bayonet","butterfly-knife","talon-knife","skeleton-knife",
+    "stiletto-knife","falchion-knife","shadow-daggers","gut-knife","bowie-knife",
+    "huntsman-knife","paracord-knife","survival-knife","ursus-knife","navaja-knife",
+    "nomad-knife","classic-knife","kukri-knife","daggers","karambit-knife","flip-knife"
+})
+
+def _canon(s: str) -> str:
+    return slugify(s)
+
+def is_probably_agent(weapon: str, skin: str) -> bool:
+    # Heuristic: if left side is NOT a known weapon and right side looks like a team/faction -> agent
+    w = _canon(weapon)
+    known = KNOWN_WEAPON_SLUGS
+    if w in known:
+        return False
+    # If weapon side contains obvious agent indicators or skin side looks like a faction/team, treat as agent
+    right = skin.lower()
+    if any(tok in right for tok in AGENT_TEAM_TOKENS):
+        return True
+    # If weapon contains quotes or human names, also likely agent
+    if any(ch in weapon for ch in ["'", "’"]):
+        return True
+    # As a fallback: weapon has 2+ words and none of them are weapon names → likely agent
+    return True if (len(weapon.split()) >= 2 and w not in known) else False
+
+def build_agent_slug(name: str) -> str:
+    # "Xxx | Team Yyy" -> "xxx-team-yyy" (Pricempire usually uses single '-' joiner; some items have '--' but single works for most)
+    parts = [p.strip() for p in name.split("|", 1)]
+    left = parts[0] if parts else name
+    right = parts[1] if len(parts) > 1 else ""
+    left_slug = slugify(left)
+    right_slug = slugify(right)
+    if right_slug:
+        return f"{left_slug}-{right_slug}"
+    return left_slug
+# ---- End Agent helpers ----
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def build_pricempire_url(name: str, quality: str = "", stattrak_hint: Optional[bool] = None) -> Optional[str]:
+    weapon, skin, wear, stat = _parse_item_name(name)
+    if not wear and quality in WEAR_MAP:
+        wear = quality
+
+    # ---- StatTrak yalnızca isimden gelsin ----
+    stat_from_name = bool(_STATTRAK_WORD_RE.search(name)) or ("stattrak\u2122" in name.lower())
+    stat = bool(stat_from_name)
+
+    # ✅ SOUVENIR ÖNCELİK: Souvenir ise her zaman SKIN + souvenir-{wear}; StatTrak kapalı
+    if is_souvenir_item(name):  # veya: if "souvenir" in name.lower():
+        # weapon/skin içinden 'Souvenir' kelimesini tamamen çıkar
+        clean_weapon = _strip_word_souvenir(weapon)
+        clean_skin   = _strip_word_souvenir(skin)
+
+        item_slug = slugify(f"{clean_weapon} {clean_skin}").replace("--", "-")
+        wear_slug = WEAR_MAP.get(wear or "", None)
+        if not item_slug or not wear_slug:
+            return None
+        return f"https://pricempire.com/cs2-items/skin/{item_slug}/souvenir-{wear_slug}"
+
+    # ---- Eldiven kısa yolu (ajan heuristic'inden önce) ----
+    if is_glove_item(name, weapon, skin):
+        item_slug = slugify(f"{weapon} {skin}").replace("--", "-")
+        wear_slug = WEAR_MAP.get(wear or "", None)
+        if not item_slug or not wear_slug:
+            return None
+        return f"https://pricempire.com/cs2-items/glove/{item_slug}/{wear_slug}"
+
+    # ---- Ajan tespiti ----
+    if is_probably_agent(weapon, skin):
+        agent_slug = build_agent_slug(name)
+        return f"https://pricempire.com/cs2-items/agent/{agent_slug}"
+
+    # ---- Normal skin akışı ----
+    cat = "glove" if ("glove" in weapon.lower() or "gloves" in weapon.lower()) else "skin"
+    item_slug = slugify(f"{weapon} {skin}").replace("--", "-")
+    wear_slug = WEAR_MAP.get(wear or "", None)
+    if not item_slug or not wear_slug:
+        return None
+
+    wear_part = f"stattrak-{wear_slug}" if (stat and cat == "skin") else wear_slug
+    return f"https://pricempire.com/cs2-items/{cat}/{item_slug}/{wear_part}"
+
+
+# ---- Pricempire link canonicalizer (added) ----
+PE_ALLOWED_CATS = {"skin", "glove", "agent", "sticker",
+    "tournament-sticker", "tournament-team-sticker-capsule",
+    "container", "music-kit-box", "autograph-sticker"}
+WEAR_SLUGS_CAN = {"factory-new","minimal-wear","field-tested","well-worn","battle-scarred"}
+FINISH_TYPES = {"holo","foil","gold"}
+
+_http_re = re.compile(r"(https?://pricempire\.com[^\s]+)", re.IGNORECASE)
+
+def _extract_first_pricempire_url(s: str) -> str | None:
+    if not s:
+        return None
+    m = _http_re.findall(s.replace("...tps://", " https://"))
+    return m[-1] if m else None
+
+def _clean_path(path: str) -> str:
+    path = path.split("?")[0].split("#")[0].strip()
+    path = _MULTI_SLASH_RE.sub("/", path)
+    return path.rstrip("/").strip()
+
+def _canon_path(parts: list[str]) -> list[str]:
+    out = []
+    for p in parts:
+        p = p.strip().lower()
+        p = _MULTI_DASH_RE.sub("-", p)
+        if p:
+            out.append(p)
+    return out
+
+def _fix_wear_segment_canon(wear_seg: str) -> str | None:
+    if not wear_seg:
+        return None
+    seg = wear_seg
+    has_souv = seg.startswith("souvenir-")
+    has_stat = seg.startswith("stattrak-")
+    core = seg.split("-", 1)[1] if (has_souv or has_stat) else seg
+    if core not in WEAR_SLUGS_CAN:
+        return None
+    if has_souv:
+        return f"souvenir-{core}"
+    if has_stat:
+        return f"stattrak-{core}"
+    return core
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def pricempire_canonicalize(url_or_text: str) -> str | None:
+    raw = _extract_first_pricempire_url(url_or_text)
+    if not raw:
+        return None
+    try:
+        pu = urllib.parse.urlsplit(raw)
+    except Exception:
+        return None
+    if pu.netloc.lower() != "pricempire.com":
+        return None
+
+    path = _clean_path(pu.path)
+    parts = _canon_path(path.split("/"))
+    if len(parts) < 3 or parts[0] != "cs2-items" or parts[1] not in PE_ALLOWED_CATS:
+        return None
+
+    cat = parts[1]
+    rest = parts[2:]
+    if not rest:
+        return None
+    item_slug = rest[0]
+    tail = rest[1] if len(rest) >= 2 else None
+
+    new_parts = ["cs2-items", cat, item_slug]
+
+    if cat in {"skin", "glove"}:
+        wear = _fix_wear_segment_canon(tail or "")
+        if wear:
+            new_parts.append(wear)
+    elif cat in {"sticker", "tournament-sticker"}:
+        if tail in FINISH_TYPES:
+            new_parts.append(tail)
+    elif cat == "autograph-sticker":
+        if tail == "gold":
+            new_parts.append("gold")
+    elif cat == "music-kit-box":
+        if tail == "stattrak":
+            new_parts.append("stattrak")
+    # agent/container/capsule -> only slug
+
+    canon_path = "/" + "/".join(new_parts)
+    return urllib.parse.urlunsplit(("https", "pricempire.com", canon_path, "", ""))
+# ---- End canonicalizer ----
+
+
+# -------------------- Satır linkleri (tekil / toplu) --------------------
+def pricempire_url_for(name: str, quality: str = "", stattrak: Optional[bool] = None,
+                       link: Optional[str] = None) -> Optional[str]:
+    """Tablo satırı için Pricempire linki: geçerli hazır link, yoksa addan üretilen.
+
+    Sticker'lar için None. Addaki " (kalite)" eki kaliteyle aynıysa atılır.
+    """
+    if "sticker" in name.lower():
+        return None
+    if link:
+        pe = pricempire_canonicalize(link)
+        if pe:
+            return pe
+    base = name
+    if quality and name.endswith(f" ({quality})"):
+        base = name[:-(len(quality) + 3)].rstrip()
+    return build_pricempire_url(base, quality, stattrak)
+
+
+def pricempire_urls(names, qualities=None, links=None) -> list[Optional[str]]:
+    """Tüm liste için tek geçişte pricempire_url_for; aynı (ad, kalite, link) bir kez hesaplanır."""
+    n = len(names)
+    qualities = qualities if qualities is not None else [""] * n
+    links = links if links is not None else [None] * n
+    memo: dict = {}
+    out: list[Optional[str]] = []
+    for key in zip(names, qualities, links):
+        url = memo.get(key, memo)
+        if url is memo:
+            url = memo[key] = pricempire_url_for(key[0], key[1] or "", None, key[2] or None)
+        out.append(url)
+    return out
+
+
+# -------------------- Fiyat metni / market_hash_name --------------------
+def parse_money_to_float(s: str) -> float | None:
+    if not s:
+        return None
+    s = unescape(str(s)).strip()
+    s = _MONEY_STRIP_RE.sub("", s)
+    if s.count(",") == 1 and s.count(".") == 0:
+        s = s.replace(",", ".")
+    if s.count(".") > 1:
+        parts = s.split(".")
+        s = "".join(parts[:-1]) + "." + parts[-1]
+    try:
+        return float(s)
+    except:
+        return None
+
+def market_hash_name(name: str, stattrak: bool = False) -> str:
+    name = name or ""
+    if stattrak and "StatTrak" not in name:
+        name = f"StatTrak\u2122 {name}"
+    return name
+
+def build_market_hash_name(item: dict) -> str:
+    stattrak = False
+    if item.get("_raw") and isinstance(item["_raw"], dict):
+        stattrak = bool(item["_raw"].get("stattrak", False))
+    return market_hash_name(item.get("name", "") or "", stattrak)
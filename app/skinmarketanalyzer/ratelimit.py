@@ -0,0 +1,206 @@
+# ratelimit.py — token bucket (thread + asyncio) ve AIMD hız denetleyicisi
+
+from typing import Callable, Optional
+import time, threading
+from collections import deque
+
+
+# -------------------- Global hız sınırlayıcı (token bucket) --------------------
+class _BucketStats:
+    """Token bucket metrikleri: kuyruk derinliği, ortalama bekleme, gerçekleşen hız."""
+    RATE_WINDOW = 10.0  # gerçekleşen hız için kayan pencere (sn)
+
+    def _init_stats(self):
+        self.waiting = 0
+        self.granted = 0
+        self.total_wait = 0.0
+        self._grants = deque()
+
+    def _record_grant(self, now: float, waited: float):
+        self.granted += 1
+        self.total_wait += waited
+        self._grants.append(now)
+        while self._grants and now - self._grants[0] > self.RATE_WINDOW:
+            self._grants.popleft()
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        recent = [t for t in list(self._grants) if now - t <= self.RATE_WINDOW]
+        span = (now - recent[0]) if len(recent) > 1 else 0.0
+        return {
+            "rate": self.rate,
+            "queue_depth": self.waiting,
+            "granted": self.granted,
+            "avg_wait": (self.total_wait / self.granted) if self.granted else 0.0,
+            "achieved_rate": ((len(recent) - 1) / span) if span > 0 else 0.0,
+        }
+
+
+class TokenBucket(_BucketStats):
+    """Global hız sınırı: rate (token/sn), burst (başlangıç tamponu).
+
+    Her acquire sırayla (FIFO) bir zaman dilimi rezerve eder ve tam o ana kadar
+    Condition üzerinde bekler; bu yüzden çekişmede bile hız aşılmaz.
+    cancel() bekleyen herkesi anında uyandırıp False döndürtür.
+    """
+    def __init__(self, rate: float, burst: int):
+        self.rate = float(rate)
+        self.capacity = int(burst)
+        self.tokens = float(burst)
+        self.lock = threading.Lock()
+        self.cond = threading.Condition(self.lock)
+        self.cancelled = threading.Event()
+        self.last = time.monotonic()
+        self._init_stats()
+
+    def _reserve(self, n: float, now: float) -> float:
+        """n token'ı rezerve et (borçlanarak); hazır olacağı anı döndür. Kilit altında çağrılır."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        self.tokens -= n
+        return now if self.tokens >= 0 else now + (-self.tokens) / self.rate
+
+    def acquire(self, n: float = 1.0, stop_flag: Optional[Callable[[], bool]] = None) -> bool:
+        with self.cond:
+            if self.cancelled.is_set() or (stop_flag and stop_flag()):
+                return False
+            start = time.monotonic()
+            ready_at = self._reserve(n, start)
+            self.waiting += 1
+            try:
+                while True:
+                    if self.cancelled.is_set() or (stop_flag and stop_flag()):
+                        self.tokens += n  # rezervasyonu iade et
+                        return False
+                    remaining = ready_at - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self.cond.wait(remaining)
+            finally:
+                self.waiting -= 1
+            now = time.monotonic()
+            self._record_grant(now, now - start)
+        return True
+
+    def set_rate(self, rate: float, drain: bool = False):
+        """Hızı değiştir; drain=True ise birikmiş burst tamponunu boşalt."""
+        with self.cond:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            self.rate = max(0.01, float(rate))
+            if drain:
+                self.tokens = min(self.tokens, 0.0)
+
+    def cancel(self):
+        """Bekleyen ve gelecek tüm acquire çağrılarını hemen False ile sonlandır."""
+        self.cancelled.set()
+        with self.cond:
+            self.cond.notify_all()
+
+
+class AsyncTokenBucket(TokenBucket):
+    """TokenBucket'ın asyncio ikizi: aynı FIFO rezervasyon mantığı, thread yerine olay döngüsünde bekler.
+
+    asyncio yalnız bu sınıf kullanılınca yüklenir (modül içe aktarımı hafif kalsın).
+    """
+    def __init__(self, rate: float, burst: int):
+        super().__init__(rate, burst)
+        self._cancel_event = None
+
+    def _event(self):
+        import asyncio
+        if self._cancel_event is None:
+            self._cancel_event = asyncio.Event()
+            if self.cancelled.is_set():
+                self._cancel_event.set()
+        return self._cancel_event
+
+    async def acquire(self, n: float = 1.0, stop_flag: Optional[Callable[[], bool]] = None) -> bool:
+        import asyncio
+        ev = self._event()
+        if ev.is_set() or (stop_flag and stop_flag()):
+            return False
+        start = time.monotonic()
+        # Olay döngüsü tek thread'de çalıştığı için rezervasyon await'siz ve atomiktir
+        ready_at = self._reserve(n, start)
+        wait = ready_at - start
+        if wait > 0:
+            self.waiting += 1
+            try:
+                await asyncio.wait_for(ev.wait(), timeout=wait)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                self.waiting -= 1
+            if ev.is_set() or (stop_flag and stop_flag()):
+                self.tokens += n
+                return False
+        now = time.monotonic()
+        self._record_grant(now, now - start)
+        return True
+
+    def cancel(self):
+        """Olay döngüsünün thread'inden çağrılmalı (bkz. loop.call_soon_threadsafe)."""
+        self.cancelled.set()
+        self._event().set()
+
+
+# -------------------- Uyarlanabilir hız (AIMD) --------------------
+ADAPTIVE_MIN_RPS = 0.3
+ADAPTIVE_MAX_RPS = 5.0
+
+
+class AimdRateController:
+    """Sağlıklı yanıtlarda hızı yavaşça artırır, 429 / success:false / zaman aşımında sert düşürür.
+
+    Artış yanıt başına increase/rate'tir (≈ saniyede +increase istek/sn);
+    düşüş çarpansaldır ve aynı tıkanma dalgası hızı sıfıra çekmesin diye
+    cooldown süresinde bir kez uygulanır. enabled=False iken sabit hız.
+    """
+    def __init__(self, bucket: TokenBucket, min_rate: float = ADAPTIVE_MIN_RPS,
+                 max_rate: float = ADAPTIVE_MAX_RPS, increase: float = 0.05,
+                 decrease: float = 0.5, cooldown: float = 5.0, enabled: bool = True,
+                 on_change: Optional[Callable[[float], None]] = None):
+        self.bucket = bucket
+        self.min_rate = float(min_rate)
+        self.max_rate = float(max_rate)
+        self.increase = float(increase)
+        self.decrease = float(decrease)
+        self.cooldown = float(cooldown)
+        self.enabled = enabled
+        self.on_change = on_change
+        self.lock = threading.Lock()
+        self._last_decrease = 0.0
+        self._last_reported = bucket.rate
+        self.throttles = 0
+
+    @property
+    def rate(self) -> float:
+        return self.bucket.rate
+
+    def _apply(self, rate: float, drain: bool = False):
+        self.bucket.set_rate(rate, drain=drain)
+        if self.on_change and (drain or abs(rate - self._last_reported) >= 0.05):
+            self._last_reported = rate
+            self.on_change(rate)
+
+    def on_success(self):
+        if not self.enabled:
+            return
+        with self.lock:
+            rate = self.bucket.rate
+            if rate >= self.max_rate:
+                return
+            self._apply(min(self.max_rate, rate + self.increase / max(rate, 0.1)))
+
+    def on_throttle(self):
+        with self.lock:
+            self.throttles += 1
+            if not self.enabled:
+                return
+            now = time.monotonic()
+            if now - self._last_decrease < self.cooldown:
+                return
+            self._last_decrease = now
+            self._apply(max(self.min_rate, self.bucket.rate * self.decrease), drain=True)
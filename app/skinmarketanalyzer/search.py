@@ -0,0 +1,251 @@
+# search.py — tablo araması: önceden kurulan arama indeksi ve yapılandırılmış sorgular (Qt'siz)
+
+from typing import Optional
+import re, operator
+
+from .names import WEARS, is_souvenir_item, parse_item_name
+
+
+# -------------------- Sorgu --------------------
+# wear:fn → "Factory New" (baş harfler), wear:field → önek eşleşmesi de kabul edilir
+WEAR_CODES = {"".join(p[0] for p in w.replace("-", " ").split()).lower(): i for i, w in enumerate(WEARS)}
+
+# sayısal alan → ItemStore sütunu
+NUMERIC_FIELDS = {
+    "profit": "profit", "kar": "profit", "kâr": "profit",
+    "ratio": "ratio", "oran": "ratio",
+    "price": "site", "site": "site",
+    "market": "market", "pazar": "market",
+    "order": "order_price", "buy": "order_price",
+    "median": "median",
+}
+TEXT_FIELDS = ("name", "weapon", "skin", "quality")
+FLAG_STATTRAK, FLAG_SOUVENIR = 1, 2
+FLAG_WORDS = {"stattrak": FLAG_STATTRAK, "st": FLAG_STATTRAK, "souvenir": FLAG_SOUVENIR}
+
+_OPS = {">": operator.gt, ">=": operator.ge, "<": operator.lt, "<=": operator.le,
+        "=": operator.eq, "==": operator.eq}
+_NUMERIC_RE = re.compile(r"^([a-zâ]+)(>=|<=|==|>|<|=)(-?\d+(?:[.,]\d+)?)$")
+_FIELD_RE = re.compile(r"^([a-z]+):(.+)$")
+_FOLD_RE = re.compile(r"[^0-9a-z]+")
+_WORD_FOLD_RE = re.compile(r"[^0-9a-z\s]+")    # _fold, ama sözcük aralarındaki boşluklar kalır
+FUZZY_MIN_LEN = 4       # bu uzunluktan kısa serbest metin terimleri yalnız tam (alt dize) eşleşir
+
+
+def _fold(text: str) -> str:
+    """Noktalama/boşluksuz küçük harf: "AK-47" ile "ak47" aynı eşleşir."""
+    return _FOLD_RE.sub("", text.lower())
+
+
+def _words(text: str) -> tuple:
+    """Bulanık aramaya girecek katlanmış sözcükler."""
+    return tuple(w for w in _WORD_FOLD_RE.sub("", text.lower()).split() if len(w) >= FUZZY_MIN_LEN - 1)
+
+
+def _within_one(a: str, b: str) -> bool:
+    """a ile b arasındaki düzenleme uzaklığı en fazla 1 mi (ekleme/silme/değiştirme)?"""
+    la, lb = len(a), len(b)
+    if la > lb:
+        a, b, la, lb = b, a, lb, la
+    if lb - la > 1:
+        return False
+    i = 0
+    while i < la and a[i] == b[i]:
+        i += 1
+    if la == lb:
+        return a[i + 1:] == b[i + 1:]
+    return a[i:] == b[i + 1:]
+
+
+class Query:
+    """Ayrıştırılmış arama sorgusu; boş sorgu tüm satırları eşler."""
+    __slots__ = ("terms", "not_terms", "fields", "not_fields", "wears", "not_wears", "flags", "not_flags", "numeric")
+
+    def __init__(self):
+        self.terms: list[str] = []                      # serbest metin (katlanmış)
+        self.not_terms: list[str] = []                  # "-metin": içermemeli
+        self.fields: list[tuple[str, str]] = []         # (weapon|skin|quality|name, katlanmış metin)
+        self.not_fields: list[tuple[str, str]] = []     # "-alan:değer"
+        self.wears: Optional[set[int]] = None           # WEARS indeksleri
+        self.not_wears: set[int] = set()                # "-wear:fn" (aşınmasızlar kalır)
+        self.flags = 0                                  # olması gereken bayraklar
+        self.not_flags = 0                              # olmaması gereken bayraklar
+        self.numeric: list[tuple[str, object, float]] = []  # (ItemStore sütunu, karşılaştırma, değer)
+
+    def __bool__(self):
+        return bool(self.terms or self.not_terms or self.fields or self.not_fields
+                    or self.wears is not None or self.not_wears or self.flags or self.not_flags or self.numeric)
+
+
+def parse_query(text: str) -> Query:
+    """`wear:fn stattrak profit>10 redline` gibi sorguyu ayrıştır.
+
+    Boşlukla ayrılan her parça VE ile bağlanır: alan:değer (wear, weapon, skin,
+    quality, name), bayrak (stattrak/st, souvenir), sayısal karşılaştırma
+    (profit, ratio, price, market, order, median) ya da ad/kalite içinde
+    aranan serbest metin. Tanınmayan parça serbest metindir. En az
+    FUZZY_MIN_LEN karakterlik serbest metin, ad/kalite sözcüklerinden biriyle
+    tek harf farkla da eşleşir (readline → Redline, asimov → Asiimov); alan
+    değerleri ve dışlayan terimler yalnız tam eşleşir.
+
+    Başında "-" olan bayrak, alan ve serbest metin dışlar (-stattrak,
+    -wear:bs, -redline). Sayısal koşulda "-" yok sayılır; tersini yazın
+    (profit<=10). "st" ve "souvenir" tek başına yazılınca bayraktır: adında
+    bu sözcük geçenleri metin olarak aramak için name:st kullanın.
+    """
+    q = Query()
+    for raw in text.lower().split():
+        neg = raw.startswith("-") and len(raw) > 1
+        word = raw[1:] if neg else raw
+        if neg and word.startswith("-"):
+            continue        # "--x": anlamsız, yok say
+        if word in FLAG_WORDS:
+            if neg:
+                q.not_flags |= FLAG_WORDS[word]
+            else:
+                q.flags |= FLAG_WORDS[word]
+            continue
+        m = _NUMERIC_RE.match(word)
+        if m and m.group(1) in NUMERIC_FIELDS:
+            if not neg:
+                q.numeric.append((NUMERIC_FIELDS[m.group(1)], _OPS[m.group(2)],
+                                  float(m.group(3).replace(",", "."))))
+            continue
+        m = _FIELD_RE.match(word)
+        if m and m.group(1) == "wear":
+            value = _fold(m.group(2))
+            wears = {i for code, i in WEAR_CODES.items() if code == value}
+            wears |= {i for i, w in enumerate(WEARS) if value and _fold(w).startswith(value)}
+            if neg:
+                q.not_wears |= wears
+            else:
+                q.wears = wears if q.wears is None else q.wears & wears
+            continue
+        if m and m.group(1) in TEXT_FIELDS:
+            (q.not_fields if neg else q.fields).append((m.group(1), _fold(m.group(2))))
+            continue
+        folded = _fold(word)
+        if folded:
+            (q.not_terms if neg else q.terms).append(folded)
+    return q
+
+
+# -------------------- İndeks --------------------
+class SearchIndex:
+    """ItemStore satırları için önceden hesaplanmış arama alanları.
+
+    Ad başına parse_item_name bir kez çağrılır (aynı ad tekrar ederse sonuç
+    paylaşılır); ad + kalite katlanmış tek metinde, silah/desen ayrı, aşınma
+    indeks listesi, StatTrak/Souvenir bayrak dizisi olarak tutulur. Akışlı
+    içe aktarmada extend() yalnız yeni satırları indeksler. Bulanık arama için
+    ad/kalite sözcüklerinden satır listesine bir sözlük (vocab) tutulur.
+    """
+    def __init__(self):
+        self.text: list[str] = []       # katlanmış "ad kalite"
+        self.weapon: list[str] = []
+        self.skin: list[str] = []
+        self.quality: list[str] = []
+        self.name: list[str] = []
+        self.wear = bytearray()         # WEARS indeksi, 255 → yok
+        self.flags = bytearray()
+        self.by_wear: dict[int, list[int]] = {}
+        self.vocab: dict[str, list[int]] = {}   # katlanmış sözcük → satırlar
+        self._parsed: dict[str, tuple] = {}
+        self._quality_words: dict[str, tuple] = {}
+
+    def __len__(self):
+        return len(self.text)
+
+    def clear(self):
+        self.__init__()
+
+    def _parse(self, name: str) -> tuple:
+        hit = self._parsed.get(name)
+        if hit is None:
+            p = parse_item_name(name)
+            wear = WEARS.index(p["wear"]) if p["wear"] in WEARS else 255
+            flags = (FLAG_STATTRAK if p["stat"] else 0) | (FLAG_SOUVENIR if is_souvenir_item(name) else 0)
+            hit = self._parsed[name] = (_fold(name), _fold(p["weapon"]), _fold(p["skin"]), wear, flags,
+                                        _words(name))
+        return hit
+
+    def extend(self, store):
+        """Depoda henüz indekslenmemiş satırları ekle."""
+        vocab = self.vocab
+        for i in range(len(self), len(store)):
+            name, weapon, skin, wear, flags, words = self._parse(store.names[i])
+            quality = _fold(store.qualities[i])
+            self.name.append(name)
+            self.text.append(f"{name} {quality}" if quality else name)
+            self.weapon.append(weapon)
+            self.skin.append(skin)
+            self.quality.append(quality)
+            self.wear.append(wear)
+            self.flags.append(flags | (FLAG_STATTRAK if store.stattrak[i] else 0))
+            if wear != 255:
+                self.by_wear.setdefault(wear, []).append(i)
+            qw = self._quality_words.get(store.qualities[i])
+            if qw is None:
+                qw = self._quality_words[store.qualities[i]] = _words(store.qualities[i])
+            for word in words + qw:
+                rows = vocab.get(word)
+                if rows is None:
+                    vocab[word] = [i]
+                elif rows[-1] != i:
+                    rows.append(i)
+
+    def near(self, term: str) -> set[int]:
+        """Sözcüklerinden biri terime en fazla 1 düzenleme uzaklığında olan satırlar."""
+        rows: set[int] = set()
+        n = len(term)
+        for word, idx in self.vocab.items():
+            if abs(len(word) - n) <= 1 and _within_one(word, term):
+                rows.update(idx)
+        return rows
+
+    def rebuild(self, store):
+        self.clear()
+        self.extend(store)
+
+    def match(self, query: Query, store) -> Optional[list[int]]:
+        """Sorguyu sağlayan depo indeksleri (artan); boş sorguda None (hepsi).
+
+        Her koşul aday listesini sırayla daraltır; en seçici olanlar (aşınma
+        listesi, bayraklar) önce uygulanır, sayısal koşullar güncel fiyatlarla
+        en sonda.
+        """
+        if not query:
+            return None
+        if query.wears is not None:
+            cand = sorted(i for w in query.wears for i in self.by_wear.get(w, ()))
+        else:
+            cand = range(len(self))
+        if query.not_wears:
+            wear, bad_wears = self.wear, query.not_wears
+            cand = [i for i in cand if wear[i] not in bad_wears]
+        flags = self.flags
+        if query.flags:
+            need = query.flags
+            cand = [i for i in cand if flags[i] & need == need]
+        if query.not_flags:
+            bad = query.not_flags
+            cand = [i for i in cand if not flags[i] & bad]
+        for field, value in query.fields:
+            col = getattr(self, field)
+            cand = [i for i in cand if value in col[i]]
+        for field, value in query.not_fields:
+            col = getattr(self, field)
+            cand = [i for i in cand if value not in col[i]]
+        text = self.text
+        for term in query.terms:
+            if len(term) >= FUZZY_MIN_LEN:
+                near = self.near(term)
+                cand = [i for i in cand if term in text[i] or i in near]
+            else:
+                cand = [i for i in cand if term in text[i]]
+        for term in query.not_terms:
+            cand = [i for i in cand if term not in text[i]]
+        for column, op, value in query.numeric:
+            col = getattr(store, column)
+            cand = [i for i in cand if op(col[i], value)]     # NaN hiçbir koşulu sağlamaz
+        return cand if isinstance(cand, list) else list(cand)
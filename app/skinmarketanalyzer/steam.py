@@ -0,0 +1,188 @@
+# steam.py — Steam Market uç noktaları: URL kurma, yanıt ayrıştırma, HTTP oturumu
+
+from typing import Optional
+import os, re, threading
+from urllib.parse import quote_plus
+
+from .names import parse_money_to_float
+
+
+STEAM_HEADERS = {
+    "User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                   "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"),
+    "Referer": "https://steamcommunity.com/market/",
+    "Accept": "application/json,text/html;q=0.9,*/*;q=0.8",
+}
+
+# -------------------- HTTP yardımcıları --------------------
+def make_session(pool_size: int = 20):
+    # requests yalnız gerçekten HTTP gerekince yüklenir (içe aktarma süresi)
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    s = requests.Session()
+    s.headers.update(STEAM_HEADERS)
+    # 429 burada yeniden denenmez: hız denetleyicisi (AimdRateController) görsün diye
+    # PriceFetchWorker._get ele alır.
+    retry = Retry(
+        total=3, connect=2, read=2,
+        backoff_factor=0.5,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset(['GET'])
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(1, int(pool_size)),
+                          max_retries=retry)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    return s
+
+
+class SessionManager:
+    """Uygulama ömrü boyunca paylaşılan requests oturumu.
+
+    Her çekme çalıştırması yeni oturum açıp TLS el sıkışmasını tekrarlamak
+    yerine buradan alır; bağlantılar çalıştırmalar arasında sıcak kalır.
+    Havuz boyutu istenen worker sayısına göre büyütülür (küçültülmez: mevcut
+    sıcak bağlantılar korunur). stats() bağlantı yeniden kullanımını, yeni
+    bağlantı (el sıkışma) sayısını ve aktarılan baytları verir.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._session = None
+        self._pool_size = 0
+        self._closed_pools: list = []   # yeniden boyutlandırmada bırakılan havuzların sayaçları
+        self.bytes_in = 0
+
+    def session(self, pool_size: int = 4):
+        """Paylaşılan oturumu döndür; havuz `pool_size` eşzamanlı bağlantıdan küçükse büyüt."""
+        pool_size = max(1, int(pool_size))
+        with self._lock:
+            if self._session is None:
+                self._session = make_session(pool_size)
+                self._session.hooks["response"].append(self._on_response)
+                self._pool_size = pool_size
+            elif pool_size > self._pool_size:
+                from requests.adapters import HTTPAdapter
+                old = self._session.get_adapter("https://")
+                self._closed_pools.append(self._pool_counts(old))
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size,
+                                      max_retries=old.max_retries)
+                self._session.mount("https://", adapter)
+                self._session.mount("http://", adapter)
+                old.close()
+                self._pool_size = pool_size
+            return self._session
+
+    def _on_response(self, r, *args, **kwargs):
+        # Gövde burada okunur (requests stream=False ile zaten okuyacaktı); tell() → teldeki bayt
+        try:
+            n = len(r.content)
+            wire = r.raw.tell() if r.raw is not None else 0
+        except Exception:
+            n = wire = 0
+        with self._lock:
+            self.bytes_in += wire or n
+
+    @staticmethod
+    def _pool_counts(adapter) -> tuple[int, int]:
+        conns = reqs = 0
+        pools = getattr(getattr(adapter, "poolmanager", None), "pools", None)
+        if pools is not None:
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is not None:
+                    conns += pool.num_connections
+                    reqs += pool.num_requests
+        return conns, reqs
+
+    def stats(self) -> dict:
+        with self._lock:
+            conns = sum(c for c, _ in self._closed_pools)
+            reqs = sum(r for _, r in self._closed_pools)
+            if self._session is not None:
+                c, r = self._pool_counts(self._session.get_adapter("https://"))
+                conns, reqs = conns + c, reqs + r
+            return {
+                "pool_size": self._pool_size,
+                "requests": reqs,
+                "connections": conns,           # yeni bağlantı = TLS el sıkışması
+                "reused": max(0, reqs - conns),
+                "reuse_ratio": (reqs - conns) / reqs if reqs else 0.0,
+                "bytes_in": self.bytes_in,
+            }
+
+    def close(self):
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+            self._session = None
+            self._pool_size = 0
+
+
+_shared_sessions: Optional[SessionManager] = None
+_shared_lock = threading.Lock()
+
+
+def shared_sessions() -> SessionManager:
+    """Süreç genelindeki tek SessionManager."""
+    global _shared_sessions
+    with _shared_lock:
+        if _shared_sessions is None:
+            _shared_sessions = SessionManager()
+        return _shared_sessions
+
+# Yerel taklit sunucusuna (benchmarks/steam_standin.py) yönlendirmek için ortam değişkeni
+STEAM_BASE = os.environ.get("SKINMARKET_STEAM_BASE", "https://steamcommunity.com").rstrip("/")
+
+def priceoverview_url(mh: str, currency: int) -> str:
+    return (f"{STEAM_BASE}/market/priceoverview/"
+            f"?country=TR&language=turkish&currency={currency}&appid=730"
+            f"&market_hash_name={quote_plus(mh)}")
+
+def listing_url(mh: str) -> str:
+    return f"{STEAM_BASE}/market/listings/730/{quote_plus(mh)}"
+
+def histogram_url(nameid: str, currency: int) -> str:
+    return (f"{STEAM_BASE}/market/itemordershistogram"
+            f"?country=TR&language=turkish&currency={currency}"
+            f"&item_nameid={nameid}&two_factor=0&norender=1")
+
+_NAMEID_RE_ESCAPED = re.compile(r"Market_LoadOrderSpread\\?\\?\\(\\?\\s*(\\d+)\\s*\\)")
+_NAMEID_RE = re.compile(r"Market_LoadOrderSpread\(\s*(\d+)\s*\)")
+
+def parse_nameid(html: str) -> Optional[str]:
+    """Listings sayfasındaki Market_LoadOrderSpread(<id>) çağrısından item_nameid çıkar."""
+    m = _NAMEID_RE_ESCAPED.search(html) or _NAMEID_RE.search(html)
+    return m.group(1) if m else None
+
+def _order_price(y) -> Optional[float]:
+    # Histogram fiyatları kuruş cinsinden metin ("12345"); eski yanıtlar biçimli olabilir
+    try:
+        return int(y) / 100.0 if y not in (None, "") else None
+    except Exception:
+        return parse_money_to_float(y)
+
+def parse_lowest_sell_order(data: dict) -> Optional[float]:
+    return _order_price(data.get("lowest_sell_order"))
+
+_ORDER_COUNT_RE = re.compile(r"market_commodity_orders_header_promote\">\s*([\d.,]+)")
+
+def _order_depth(summary, graph) -> int:
+    """Toplam ilan/emir adedi: özet HTML'indeki sayı, yoksa grafiğin son birikimli adedi."""
+    m = _ORDER_COUNT_RE.search(summary) if isinstance(summary, str) else None
+    if m:
+        return int(re.sub(r"[.,]", "", m.group(1)) or 0)
+    try:
+        return int(graph[-1][1]) if graph else 0
+    except (TypeError, ValueError, IndexError):
+        return 0
+
+def parse_order_histogram(data: dict) -> dict:
+    """itemordershistogram yanıtını özetle: en düşük satış, en yüksek alış, derinlikler."""
+    return {
+        "sell": _order_price(data.get("lowest_sell_order")),
+        "buy": _order_price(data.get("highest_buy_order")),
+        "sell_count": _order_depth(data.get("sell_order_summary"), data.get("sell_order_graph")),
+        "buy_count": _order_depth(data.get("buy_order_summary"), data.get("buy_order_graph")),
+    }
@@ -0,0 +1,222 @@
+# watch.py — sürekli izleme modu: uyarlanabilir aralıklarla yeniden fiyat çekme
+
+from typing import Optional
+import sys, time, heapq, threading
+
+from .fetch import PriceFetcher
+from .metrics import summary_line
+from .steam import shared_sessions
+
+
+# -------------------- Yenileme takvimi --------------------
+WATCH_MIN_INTERVAL = 60.0           # sn; oynak item'lar en sık bu aralıkla yenilenir
+WATCH_MAX_INTERVAL = 30 * 60.0      # sn; hiç değişmeyenler en seyrek bu aralıkla
+WATCH_INITIAL_INTERVAL = 5 * 60.0
+WATCH_VOLATILITY = 0.005            # bu orandan (%0.5) büyük fiyat değişimi "oynak" sayılır
+
+
+class RefreshSchedule:
+    """Anahtar başına bir sonraki yenileme zamanı tutan thread güvenli takvim.
+
+    Fiyatı değişen item'ın aralığı yarıya iner, değişmeyenin 1.5 katına çıkar
+    (min/max arasında). İşçiler take() ile sıradaki vadesi gelmiş anahtarı
+    alır; vadesi gelen yoksa en yakın vadeye kadar bekler. prioritize() ile
+    öne alınan anahtarlar (ekrandaki satırlar) vadesi gelenler arasında önce
+    verilir ve en geç min_interval sonra yenilenir.
+    """
+    def __init__(self, min_interval: float = WATCH_MIN_INTERVAL,
+                 max_interval: float = WATCH_MAX_INTERVAL,
+                 initial_interval: float = WATCH_INITIAL_INTERVAL):
+        self.min_interval = float(min_interval)
+        self.max_interval = max(self.min_interval, float(max_interval))
+        self.initial_interval = min(max(float(initial_interval), self.min_interval), self.max_interval)
+        self.intervals: dict[str, float] = {}
+        self.last: dict[str, float] = {}
+        self.last_median: dict[str, float] = {}
+        self._cv = threading.Condition()
+        self._heap: list = []               # (vade, -skor, sıra, anahtar)
+        self._due: dict[str, float] = {}    # takvimdeki (işlemde olmayan) anahtar → vade
+        self._seq = 0
+        self._boost: set[str] = set()
+        self._closed = False
+
+    def __len__(self):
+        return len(self.intervals)
+
+    def add(self, key: str, due: float, score: float = 0.0, last: Optional[float] = None,
+            median: Optional[float] = None):
+        with self._cv:
+            self.intervals.setdefault(key, self.initial_interval)
+            if last:
+                self.last[key] = last
+                self.last_median[key] = median or 0.0
+            self._push(key, due, score)
+
+    def _push(self, key: str, due: float, score: float = 0.0):
+        self._seq += 1
+        self._due[key] = due
+        heapq.heappush(self._heap, (due, -score if score == score else 0.0, self._seq, key))
+        self._cv.notify()
+
+    def prioritize(self, keys) -> None:
+        """Bu anahtarları öne al; önceki öne alınanlar normal takvime döner."""
+        with self._cv:
+            self._boost = {k for k in keys if k in self.intervals}
+            soon = time.time() + self.min_interval
+            for key in self._boost:
+                due = self._due.get(key)
+                if due is not None and due > soon:
+                    self._push(key, soon)
+
+    def _take_boosted(self, now: float) -> Optional[str]:
+        """Vadesi gelmiş öne alınmış anahtarlardan en eskisi (heap girdisi tembel atılır)."""
+        due = self._due
+        ready = [(due[k], k) for k in self._boost if k in due and due[k] <= now]
+        if not ready:
+            return None
+        key = min(ready)[1]
+        del due[key]
+        return key
+
+    def take(self) -> Optional[str]:
+        """Vadesi gelen ilk anahtarı al (gerekirse bekle); kapatıldıysa None."""
+        with self._cv:
+            while not self._closed:
+                if self._boost:
+                    key = self._take_boosted(time.time())
+                    if key is not None:
+                        return key
+                heap = self._heap
+                while heap and self._due.get(heap[0][3]) != heap[0][0]:
+                    heapq.heappop(heap)     # eski girdi
+                wait = None
+                if heap:
+                    wait = heap[0][0] - time.time()
+                    if wait <= 0:
+                        key = heapq.heappop(heap)[3]
+                        del self._due[key]
+                        return key
+                self._cv.wait(wait)
+            return None
+
+    def record(self, key: str, price: float, median: float = 0.0) -> bool:
+        """Yeni fiyatı işle, aralığı uyarla ve yeniden takvimle; fiyat ya da medyan değiştiyse True.
+
+        Aralık yalnız en düşük fiyatın oynaklığına göre uyarlanır.
+        """
+        with self._cv:
+            iv = self.intervals.get(key, self.initial_interval)
+            old = self.last.get(key)
+            changed = False
+            if price > 0:
+                changed = (old is None or abs(price - old) > 1e-9
+                           or abs(median - self.last_median.get(key, 0.0)) > 1e-9)
+                self.last_median[key] = median
+                if old:
+                    if abs(price - old) / old >= WATCH_VOLATILITY:
+                        iv = max(self.min_interval, iv * 0.5)
+                    else:
+                        iv = min(self.max_interval, iv * 1.5)
+                self.last[key] = price
+            self.intervals[key] = iv
+            self._push(key, time.time() + iv)
+            return changed
+
+    def next_due(self) -> Optional[float]:
+        with self._cv:
+            return min(self._due.values()) if self._due else None
+
+    def close(self):
+        with self._cv:
+            self._closed = True
+            self._cv.notify_all()
+
+
+# -------------------- İzleyici --------------------
+class PriceWatcher(PriceFetcher):
+    """Durdurulana dek çalışan PriceFetcher: her item kendi aralığında yenilenir.
+
+    Aynı token bucket/AIMD bütçesini kullanır; on_progress yalnız fiyatı ya
+    da medyanı değişen (veya ilk kez öğrenilen) item'lar için çağrılır. Yenilemede taze
+    önbellek kaydı atlanır, sonuç yine önbelleğe yazılır.
+    """
+    def __init__(self, items, currency: int, max_workers: int, rps: float,
+                 min_interval: float = WATCH_MIN_INTERVAL,
+                 max_interval: float = WATCH_MAX_INTERVAL, **kwargs):
+        super().__init__(items, currency, max_workers=max_workers, rps=rps, **kwargs)
+        self.schedule = RefreshSchedule(min_interval, max_interval)
+        self.force_refresh = True
+
+    def stop(self):
+        super().stop()
+        self.schedule.close()
+
+    def prioritize(self, keys) -> None:
+        """Ekrandaki satırları yenileme takviminde öne al; thread güvenli."""
+        super().prioritize(keys)
+        self.schedule.prioritize(self._boost)
+
+    def _seed_schedule(self):
+        """Önbellekteki fiyatları yayınla; taze olanları TTL sonrasına, kalanları hemen takvimle."""
+        if self._nameid_seed:
+            self.cache.nameids.update(self._nameid_seed)
+        sites = self.sites_for_priority()
+        now = time.time()
+        for mh in self.keys:
+            cached = None
+            try:
+                cached = self._cached_result(mh)
+            except Exception as e:
+                self.metrics.error("cache", e)
+                print("Cache read error:", e, file=sys.stderr)
+            score = self._score(mh, cached, sites, now)
+            if cached is None:
+                self.schedule.add(mh, now, score)
+                continue
+            market_low, median, fresh, fetched_at = cached
+            if self.on_orders is not None:
+                self._emit_orders(mh, self._cached_histogram(mh))
+            self._emit(mh, market_low, median)
+            due = fetched_at + self._fresh_for(mh) if fresh else now
+            self.schedule.add(mh, due, score, last=market_low, median=median)
+
+    def _fresh_for(self, mh: str) -> float:
+        """Önbellek kaydının taze kaldığı süre (sn): sonucu veren ucun TTL'i."""
+        histogram = self.mode == "histogram" and self.cache.nameids.get(mh)
+        ttl = self.cache.ttls.get("histogram" if histogram else "priceoverview")
+        return self.schedule.initial_interval if ttl is None else float(ttl)
+
+    def _watch_worker(self):
+        while not self._should_stop():
+            mh = self.schedule.take()
+            if mh is None:
+                return
+            try:
+                key, market_low, median = self._fetch_one(mh)
+            except Exception as e:
+                self.metrics.error("worker", e)
+                print("Watch worker error:", e, file=sys.stderr)
+                key, market_low, median = mh, 0.0, 0.0
+            if self._should_stop():
+                return
+            self.metrics.item(market_low > 0)
+            if self.schedule.record(mh, market_low, median):
+                self._emit(key, market_low, median)
+            else:
+                self._orders.pop(key, None)     # değişmeyen sonucun alış verisi yazılmaz
+
+    def run(self):
+        from concurrent.futures import ThreadPoolExecutor
+        try:
+            self.metrics.start(0)     # izlemede bitiş yok: ETA hesaplanmaz
+            self._seed_schedule()
+            if not len(self.schedule) or self._should_stop():
+                return
+            n = max(1, min(int(self.max_workers), len(self.schedule)))
+            with ThreadPoolExecutor(max_workers=n) as ex:
+                for fut in [ex.submit(self._watch_worker) for _ in range(n)]:
+                    fut.result()
+        finally:
+            print("[RATE]", self.bucket.stats(), file=sys.stderr)
+            print("[HTTP]", shared_sessions().stats(), file=sys.stderr)
+            print("[METRICS]", summary_line(self.metrics), file=sys.stderr)
@@ -0,0 +1,226 @@
+# bench_fetch.py — uçtan uca fiyat çekme kıyaslaması (yerel Steam taklidine karşı)
+#
+# Her çekme motoru (FETCH_ENGINES; aiohttp yoksa "async" atlanır) GUI'nin
+# PriceFetchWorker'ı üzerinden soğuk önbellekle 100 / 1k / 10k item'la
+# çalıştırılır. item/sn, item başına p50/p99 gecikme ve item başına istek
+# raporlanır. --save ile sonuç kaydedilir; --compare ile kayıttan belirgin
+# yavaşlama varsa çıkış kodu 1 olur. PySide6 yoksa ya da --no-qt verilirse
+# çekiciler doğrudan make_fetcher ile kurulur.
+#
+#   python benchmarks/bench_fetch.py --sizes 100,1000 --latency 50 --p429 0.01
+#   python benchmarks/bench_fetch.py --sizes 1000 --save base.json
+#   python benchmarks/bench_fetch.py --sizes 1000 --compare base.json
+
+import os, sys, json, time, argparse, threading
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "app")
+sys.path.insert(0, os.path.abspath(APP_DIR))
+
+import steam_standin
+
+from skinmarketanalyzer import steam
+from skinmarketanalyzer.cache import PriceCache
+from skinmarketanalyzer.fetch import FETCH_ENGINES, FETCH_MODES, aiohttp_available, make_fetcher
+from skinmarketanalyzer.items import ItemStore
+
+WEARS = ("Factory New", "Minimal Wear", "Field-Tested", "Well-Worn", "Battle-Scarred")
+
+
+def make_items(n: int, nameid_share: float) -> ItemStore:
+    """n tekil item; ilk nameid_share oranındakiler item_nameid ile gelir (listings isteği gerekmez)."""
+    raw = []
+    with_id = int(n * nameid_share)
+    for i in range(n):
+        name = f"AK-47 | Bench {i} ({WEARS[i % len(WEARS)]})"
+        it = {"name": name, "sell_price": 0.5 + (i % 400) / 10.0}
+        if i < with_id:
+            it["item_nameid"] = steam_standin.nameid_for(name)
+        raw.append(it)
+    return ItemStore.from_raw(raw)
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(pct / 100.0 * (len(values) - 1))))]
+
+
+def _instrument(fetcher, latencies: list[float]):
+    """Item başına süre: kuyruktan alınmasından sonucunun hazır olmasına dek."""
+    if hasattr(fetcher, "_fetch_one_async"):
+        orig_async = fetcher._fetch_one_async
+
+        async def timed_async(mh):
+            t = time.perf_counter()
+            try:
+                return await orig_async(mh)
+            finally:
+                latencies.append(time.perf_counter() - t)
+        fetcher._fetch_one_async = timed_async
+    else:
+        orig = fetcher._fetch_one
+
+        def timed(mh):
+            t = time.perf_counter()
+            try:
+                return orig(mh)
+            finally:
+                latencies.append(time.perf_counter() - t)
+        fetcher._fetch_one = timed
+
+
+def _run_worker(worker, on_progress):
+    """GUI'deki gibi: işçi QThread'de, sonuç tamponu ana thread'de partiler halinde boşaltılır."""
+    from PySide6.QtCore import QEventLoop, QObject, QThread, Slot
+
+    class Sink(QObject):
+        @Slot(bool)
+        def drain(self, full=False):
+            prices, _ = worker.results.take()
+            for key, (market_low, median) in prices.items():
+                on_progress(key, market_low, median)
+
+    sink, loop, thread = Sink(), QEventLoop(), QThread()
+    worker.moveToThread(thread)
+    thread.started.connect(worker.run)
+    worker.results_ready.connect(sink.drain)
+    worker.finished.connect(thread.quit)
+    thread.finished.connect(loop.quit)
+    thread.start()
+    loop.exec()
+    thread.wait()
+    sink.drain()
+
+
+def run_once(engine: str, mode: str, store: ItemStore, args, use_qt: bool) -> dict:
+    cache = PriceCache(":memory:")          # her koşu soğuk önbellekle
+    done = [0]
+    lock = threading.Lock()
+
+    def on_progress(key, market_low, median):
+        with lock:
+            done[0] += 1
+
+    kwargs = dict(cache=cache, adaptive=args.adaptive, priority="order", mode=mode)
+    if use_qt:
+        from skinmarketanalyzer.gui import PriceFetchWorker
+        worker = PriceFetchWorker(store, currency=1, max_workers=args.workers, rps=args.rps,
+                                  engine=engine, **kwargs)
+        fetcher = worker.fetcher
+        run = lambda: _run_worker(worker, on_progress)
+    else:
+        fetcher = make_fetcher(engine, store, 1, args.workers, args.rps,
+                               on_progress=on_progress, **kwargs)
+        run = fetcher.run
+    latencies: list[float] = []
+    _instrument(fetcher, latencies)
+
+    args.server.reset_stats()
+    t0 = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - t0
+    hits = args.server.reset_stats()
+    cache.close()
+
+    n = len(set(store.keys))
+    requests = sum(v for k, v in hits.items() if k != "404")
+    return {
+        "engine": engine, "mode": mode, "items": n, "done": done[0],
+        "seconds": round(elapsed, 3),
+        "items_per_sec": round(n / elapsed, 2) if elapsed > 0 else 0.0,
+        "p50_ms": round(_percentile(latencies, 50) * 1000, 1),
+        "p99_ms": round(_percentile(latencies, 99) * 1000, 1),
+        "requests_per_item": round(requests / n, 3) if n else 0.0,
+        "throttled": hits.get("429", 0),
+        "success_false": hits.get("success_false", 0),
+    }
+
+
+def _key(rec: dict) -> str:
+    return f"{rec['engine']}/{rec['mode']}/{rec['items']}"
+
+
+def compare(results: list[dict], path: str, tolerance: float) -> bool:
+    """item/sn kayıttakinden tolerance oranından fazla düştüyse False."""
+    with open(path, "r", encoding="utf-8") as f:
+        base = {_key(r): r for r in json.load(f)}
+    ok = True
+    for rec in results:
+        old = base.get(_key(rec))
+        if not old or not old["items_per_sec"]:
+            continue
+        change = rec["items_per_sec"] / old["items_per_sec"] - 1.0
+        bad = change < -tolerance
+        ok &= not bad
+        print(f"{_key(rec):<28}{old['items_per_sec']:>10.1f} → {rec['items_per_sec']:<10.1f}"
+              f"{change * 100:+7.1f}%{'  ✗' if bad else ''}")
+    return ok
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Yerel Steam taklidine karşı fiyat çekme kıyaslaması")
+    ap.add_argument("--sizes", default="100,1000,10000", help="Virgülle ayrılmış item sayıları")
+    ap.add_argument("--engines", default=",".join(FETCH_ENGINES))
+    ap.add_argument("--modes", default="overview", help=f"Virgülle ayrılmış: {', '.join(FETCH_MODES)}")
+    ap.add_argument("--workers", type=int, default=8)
+    ap.add_argument("--rps", type=float, default=50.0, help="Token bucket hızı (istek/sn)")
+    ap.add_argument("--adaptive", action="store_true", help="AIMD hız denetimini aç")
+    ap.add_argument("--nameid-share", type=float, default=0.5,
+                    help="item_nameid ile gelen item oranı (histogram modu yalnız bunlarda tek istek)")
+    ap.add_argument("--latency", type=float, default=50.0, help="Taklit sunucu gecikmesi (ms)")
+    ap.add_argument("--jitter", type=float, default=20.0)
+    ap.add_argument("--p429", type=float, default=0.0)
+    ap.add_argument("--p-fail", type=float, default=0.0)
+    ap.add_argument("--p-empty", type=float, default=0.05)
+    ap.add_argument("--no-qt", action="store_true", help="PriceFetchWorker yerine doğrudan make_fetcher")
+    ap.add_argument("--save", default=None, help="Sonuçları JSON olarak yaz")
+    ap.add_argument("--compare", default=None, help="Önceki --save çıktısıyla karşılaştır")
+    ap.add_argument("--tolerance", type=float, default=0.2, help="İzin verilen item/sn düşüşü (oran)")
+    args = ap.parse_args()
+
+    use_qt = not args.no_qt
+    if use_qt:
+        try:
+            from PySide6.QtCore import QCoreApplication
+        except ImportError:
+            print("PySide6 yok: çekiciler doğrudan kuruluyor (--no-qt).", file=sys.stderr)
+            use_qt = False
+        else:
+            args.app = QCoreApplication.instance() or QCoreApplication([])
+
+    cfg = steam_standin.StandinConfig(args.latency, args.jitter, args.p429, args.p_fail, args.p_empty)
+    args.server = steam_standin.start(cfg)
+    steam.STEAM_BASE = args.server.base_url
+
+    engines = [e for e in args.engines.split(",") if e in FETCH_ENGINES]
+    if "async" in engines and not aiohttp_available():
+        print("aiohttp yok: 'async' motoru atlanıyor.", file=sys.stderr)
+        engines.remove("async")
+    modes = [m for m in args.modes.split(",") if m in FETCH_MODES]
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+
+    results = []
+    print(f"{'motor':<9}{'mod':<11}{'item':>7}{'sn':>9}{'item/sn':>9}{'p50 ms':>9}{'p99 ms':>9}"
+          f"{'istek/item':>11}{'429':>6}")
+    for n in sizes:
+        store = make_items(n, args.nameid_share)
+        for engine in engines:
+            for mode in modes:
+                rec = run_once(engine, mode, store, args, use_qt)
+                results.append(rec)
+                print(f"{rec['engine']:<9}{rec['mode']:<11}{rec['items']:>7}{rec['seconds']:>9.2f}"
+                      f"{rec['items_per_sec']:>9.1f}{rec['p50_ms']:>9.1f}{rec['p99_ms']:>9.1f}"
+                      f"{rec['requests_per_item']:>11.2f}{rec['throttled']:>6}", flush=True)
+
+    args.server.shutdown()
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        return 0 if compare(results, args.compare, args.tolerance) else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+# bench_import.py — kütüphane katmanının içe aktarma süresi ölçümü
+#
+# Her modül ayrı, temiz bir Python sürecinde içe aktarılır; medyan süre
+# bütçeyi aşarsa ya da Qt / requests / aiohttp gibi ağır modüller erken
+# yüklenirse çıkış kodu 1 olur.
+#
+#   python benchmarks/bench_import.py [--repeat 7]
+
+import os, sys, json, argparse, statistics, subprocess
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "app")
+
+# modül → bütçe (ms)
+BUDGETS = {
+    "skinmarketanalyzer": 15,
+    "skinmarketanalyzer.names": 25,
+    "skinmarketanalyzer.steam": 25,
+    "skinmarketanalyzer.items": 25,
+    "skinmarketanalyzer.cache": 40,
+    "skinmarketanalyzer.ratelimit": 25,
+    "skinmarketanalyzer.fetch": 60,
+    "skinmarketanalyzer.cli": 60,
+}
+
+# Bu modüller yalnız gerçekten gerektiğinde yüklenmeli
+HEAVY = ("PySide6", "requests", "urllib3", "aiohttp", "asyncio")
+
+PROBE = r"""
+import sys, time, json
+t0 = time.perf_counter()
+import {mod}
+dt = (time.perf_counter() - t0) * 1000.0
+print(json.dumps({{"ms": dt, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure(mod: str, repeat: int) -> tuple[float, list[str]]:
+    env = dict(os.environ, PYTHONPATH=os.path.abspath(APP_DIR))
+    times, heavy = [], []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", PROBE.format(mod=mod, heavy=HEAVY)],
+                             env=env, capture_output=True, text=True, check=True).stdout
+        rec = json.loads(out.strip().splitlines()[-1])
+        times.append(rec["ms"])
+        heavy = rec["heavy"]
+    return statistics.median(times), heavy
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--repeat", type=int, default=7)
+    args = ap.parse_args()
+
+    failed = False
+    print(f"{'modül':<32}{'medyan ms':>10}{'bütçe':>8}  ağır içe aktarmalar")
+    for mod, budget in BUDGETS.items():
+        ms, heavy = measure(mod, args.repeat)
+        bad = ms > budget or bool(heavy)
+        failed |= bad
+        flag = "  ✗" if bad else ""
+        print(f"{mod:<32}{ms:>10.1f}{budget:>8}  {', '.join(heavy) or '-'}{flag}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+# bench_names.py — isim ayrıştırma ve Pricempire link üretimi mikro kıyaslaması
+#
+# Gerçekçi karışımla (silah/bıçak/eldiven/ajan/sticker, StatTrak, Souvenir,
+# hazır link) N item üretir; satır başına pricempire_url_for (soğuk ve ılık
+# önbellek), toplu pricempire_urls, parse_item_name ve parse_money_to_float
+# sürelerini raporlar. --baseline ile başka bir names.py (ör. eski sürüm)
+# aynı iş yüküyle ölçülüp karşılaştırılır.
+#
+#   python benchmarks/bench_names.py --items 100000
+#   git show HEAD~1:app/skinmarketanalyzer/names.py > /tmp/names_old.py
+#   python benchmarks/bench_names.py --items 100000 --baseline /tmp/names_old.py
+
+import os, sys, time, random, argparse, importlib.util
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "app")
+sys.path.insert(0, os.path.abspath(APP_DIR))
+
+from skinmarketanalyzer import names
+
+WEARS = ("Factory New", "Minimal Wear", "Field-Tested", "Well-Worn", "Battle-Scarred")
+WEAPONS = ("AK-47", "AWP", "M4A1-S", "M4A4", "Desert Eagle", "USP-S", "Glock-18", "MP9", "P90",
+           "★ Karambit", "★ Butterfly Knife")
+GLOVES = ("Sport Gloves", "Driver Gloves", "Hand Wraps", "Specialist Gloves")
+AGENTS = ("Sir Bloody Darryl | The Professionals", "Cmdr. Mae 'Dead Cold' Jamison | SWAT",
+          "Special Agent Ava | FBI", "Number K | The Professionals")
+
+
+def make_items(n: int, distinct: int, seed: int = 0):
+    """(ad, kalite, link) üçlüleri; ad havuzu `distinct` tekil addan seçilir."""
+    rng = random.Random(seed)
+    pool = []
+    for k in range(distinct):
+        wear = WEARS[k % len(WEARS)]
+        kind = rng.random()
+        if kind < 0.70:
+            prefix = "StatTrak™ " if rng.random() < 0.2 else "Souvenir " if rng.random() < 0.1 else ""
+            name = f"{prefix}{rng.choice(WEAPONS)} | Skin {k} ({wear})"
+        elif kind < 0.80:
+            name = f"{rng.choice(GLOVES)} | Pattern {k} ({wear})"
+        elif kind < 0.90:
+            name = f"{rng.choice(AGENTS)} {k}"
+            wear = ""
+        else:
+            name = f"Sticker | Team {k} (Holo)"
+            wear = ""
+        link = (f"https://pricempire.com/cs2-items/skin/item-{k}/{names.WEAR_MAP.get(wear, 'field-tested')}"
+                if rng.random() < 0.1 else None)
+        pool.append((name, wear, link))
+    return [pool[rng.randrange(distinct)] for _ in range(n)]
+
+
+def load_module(path: str):
+    spec = importlib.util.spec_from_file_location("names_baseline", path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def clear_caches(mod):
+    for fn in ("slugify", "_parse_item_name", "build_pricempire_url", "pricempire_canonicalize"):
+        cache_clear = getattr(getattr(mod, fn, None), "cache_clear", None)
+        if cache_clear:
+            cache_clear()
+
+
+def row_url(mod, name, quality, link):
+    """Satır linki; pricempire_url_for olmayan eski sürümlerde GUI'nin eski satır içi akışı."""
+    if hasattr(mod, "pricempire_url_for"):
+        return mod.pricempire_url_for(name, quality, None, link)
+    if "sticker" in name.lower():
+        return None
+    if link:
+        pe = mod.pricempire_canonicalize(link)
+        if pe:
+            return pe
+    base = name
+    if quality and name.endswith(f" ({quality})"):
+        base = name[:-(len(quality) + 3)].rstrip()
+    return mod.build_pricempire_url(base, quality, None)
+
+
+def timed(fn) -> tuple[float, object]:
+    t = time.perf_counter()
+    out = fn()
+    return time.perf_counter() - t, out
+
+
+def run(mod, items, label: str) -> dict:
+    rows = [(n, q, l) for n, q, l in items]
+    res = {}
+    clear_caches(mod)
+    res["satır (soğuk)"], urls = timed(lambda: [row_url(mod, n, q, l) for n, q, l in rows])
+    res["satır (ılık)"], _ = timed(lambda: [row_url(mod, n, q, l) for n, q, l in rows])
+    if hasattr(mod, "pricempire_urls"):
+        clear_caches(mod)
+        ns, qs, ls = zip(*rows)
+        res["toplu (soğuk)"], bulk = timed(lambda: mod.pricempire_urls(list(ns), list(qs), list(ls)))
+        assert bulk == urls, "toplu ve satır sonuçları farklı"
+    clear_caches(mod)
+    res["parse_item_name"], _ = timed(lambda: [mod.parse_item_name(n) for n, _, _ in rows])
+    prices = [f"${(i % 99999) / 100:,.2f}" for i in range(len(rows))]
+    res["parse_money_to_float"], _ = timed(lambda: [mod.parse_money_to_float(p) for p in prices])
+    print(f"\n{label}: {len(rows)} item, {sum(u is not None for u in urls)} link")
+    for k, v in res.items():
+        print(f"  {k:<22}{v * 1000:>10.1f} ms{len(rows) / v if v else 0:>14,.0f} item/sn")
+    return res
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="İsim ayrıştırma / Pricempire link mikro kıyaslaması")
+    ap.add_argument("--items", type=int, default=100000)
+    ap.add_argument("--distinct", type=float, default=0.3, help="Tekil ad oranı (0–1)")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--baseline", default=None, help="Karşılaştırılacak başka bir names.py")
+    args = ap.parse_args()
+
+    items = make_items(args.items, max(1, int(args.items * args.distinct)), args.seed)
+    cur = run(names, items, "güncel")
+    if args.baseline:
+        base = run(load_module(args.baseline), items, f"baseline ({args.baseline})")
+        print()
+        for k, v in cur.items():
+            if k in base and v:
+                print(f"  {k:<22}{base[k] / v:>8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
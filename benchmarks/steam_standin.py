@@ -0,0 +1,180 @@
+# steam_standin.py — çevrimdışı Steam Market taklidi (kıyaslama ve elle deneme için)
+#
+# priceoverview, market/listings/730/<ad> (Market_LoadOrderSpread parçacığıyla)
+# ve itemordershistogram uçlarını taklit eder. Fiyatlar item adından
+# deterministik üretilir; gecikme, 429 ve success:false oranları ayarlanabilir.
+#
+#   python benchmarks/steam_standin.py --port 8765 --latency 80 --jitter 40 --p429 0.02
+#   SKINMARKET_STEAM_BASE=http://127.0.0.1:8765 python -m skinmarketanalyzer fetch items.json
+
+import sys, json, time, zlib, random, argparse, threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote_plus, urlsplit
+
+
+class StandinConfig:
+    """Sunucu davranışı; çalışırken değiştirilebilir (ör. kıyaslamalar arasında)."""
+    def __init__(self, latency_ms: float = 50.0, jitter_ms: float = 20.0, p429: float = 0.0,
+                 p_fail: float = 0.0, p_empty: float = 0.05, seed: int = 0):
+        self.latency_ms = latency_ms    # yanıt başına ortalama gecikme
+        self.jitter_ms = jitter_ms      # ± düzgün dağılımlı sapma
+        self.p429 = p429                # 429 Too Many Requests oranı
+        self.p_fail = p_fail            # priceoverview success:false oranı
+        self.p_empty = p_empty          # lowest_price'sız priceoverview (histogram yedeğine düşer)
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def roll(self, p: float) -> bool:
+        if p <= 0:
+            return False
+        with self.lock:
+            return self.rng.random() < p
+
+    def delay(self) -> float:
+        with self.lock:
+            ms = self.latency_ms + self.rng.uniform(-self.jitter_ms, self.jitter_ms)
+        return max(0.0, ms) / 1000.0
+
+
+def _h(text: str) -> int:
+    return zlib.crc32(text.encode("utf-8"))
+
+
+def nameid_for(mh: str) -> str:
+    return str(100000 + _h(mh) % 900000000)
+
+
+def cents_for(key: str) -> int:
+    return 3 + _h(key) % 99997        # 0.03 – 999.99
+
+
+def _money(cents: int) -> str:
+    return f"${cents / 100:,.2f}"
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"       # keep-alive: istemci bağlantı havuzu gerçekçi çalışır
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status: int, body: bytes, ctype: str = "application/json"):
+        self.send_response(status)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        srv = self.server
+        cfg = srv.config
+        parts = urlsplit(self.path)
+        path = parts.path
+        if path.startswith("/market/priceoverview"):
+            kind = "priceoverview"
+        elif path.startswith("/market/listings/730/"):
+            kind = "listings"
+        elif path.startswith("/market/itemordershistogram"):
+            kind = "histogram"
+        else:
+            srv.count("404")
+            return self._send(404, b"{}")
+        time.sleep(cfg.delay())
+        if cfg.roll(cfg.p429):
+            srv.count("429")
+            return self._send(429, b'{"success":false}')
+        srv.count(kind)
+
+        q = {k: v[0] for k, v in parse_qs(parts.query).items()}
+        if kind == "priceoverview":
+            mh = q.get("market_hash_name", "")
+            if cfg.roll(cfg.p_fail):
+                srv.count("success_false")
+                body = {"success": False}
+            elif cfg.roll(cfg.p_empty):
+                body = {"success": True, "volume": "0"}
+            else:
+                c = cents_for(mh)
+                body = {"success": True, "lowest_price": _money(c),
+                        "median_price": _money(c + c // 20), "volume": str(_h(mh) % 500)}
+            return self._send(200, json.dumps(body).encode())
+        if kind == "listings":
+            mh = unquote_plus(path[len("/market/listings/730/"):])
+            html = (f"<html><body><script>\n\tMarket_LoadOrderSpread( {nameid_for(mh)} );"
+                    f"\n</script></body></html>")
+            return self._send(200, html.encode(), "text/html; charset=utf-8")
+        nameid = q.get("item_nameid", "")
+        c = cents_for(nameid)
+        sells, buys = 1 + _h(nameid) % 900, _h(nameid[::-1]) % 400
+        body = {
+            "success": 1,
+            "lowest_sell_order": str(c),
+            "highest_buy_order": str(max(1, c - c // 10)) if buys else None,
+            "sell_order_summary": f'<span class="market_commodity_orders_header_promote">{sells}</span> satışta',
+            "buy_order_summary": f'<span class="market_commodity_orders_header_promote">{buys}</span> alış emri',
+            "sell_order_graph": [[c / 100, sells, ""]],
+            "buy_order_graph": [[c / 100, buys, ""]] if buys else [],
+        }
+        return self._send(200, json.dumps(body).encode())
+
+
+class StandinServer(ThreadingHTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, addr, config: StandinConfig):
+        super().__init__(addr, StandinHandler)
+        self.config = config
+        self.hits = Counter()
+        self._lock = threading.Lock()
+
+    def count(self, kind: str):
+        with self._lock:
+            self.hits[kind] += 1
+
+    def reset_stats(self) -> Counter:
+        with self._lock:
+            hits, self.hits = self.hits, Counter()
+        return hits
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def start(config: StandinConfig = None, host: str = "127.0.0.1", port: int = 0) -> StandinServer:
+    """Sunucuyu arka plan thread'inde başlat; port=0 → boş port."""
+    srv = StandinServer((host, port), config or StandinConfig())
+    threading.Thread(target=srv.serve_forever, name="steam-standin", daemon=True).start()
+    return srv
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Çevrimdışı Steam Market taklidi")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--latency", type=float, default=50.0, help="Ortalama gecikme (ms)")
+    ap.add_argument("--jitter", type=float, default=20.0, help="± gecikme sapması (ms)")
+    ap.add_argument("--p429", type=float, default=0.0, help="429 oranı (0–1)")
+    ap.add_argument("--p-fail", type=float, default=0.0, help="priceoverview success:false oranı")
+    ap.add_argument("--p-empty", type=float, default=0.05, help="lowest_price'sız yanıt oranı")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    cfg = StandinConfig(args.latency, args.jitter, args.p429, args.p_fail, args.p_empty, args.seed)
+    srv = StandinServer((args.host, args.port), cfg)
+    print(f"Steam taklidi: {srv.base_url}  (SKINMARKET_STEAM_BASE={srv.base_url})", file=sys.stderr)
+    try:
+        srv.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(dict(srv.hits), file=sys.stderr)
+        srv.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
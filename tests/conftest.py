@@ -0,0 +1,6 @@
+# conftest.py — testler paketi app/ altından içe aktarır (kurulum gerekmez)
+
+import os, sys
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "app")
+sys.path.insert(0, os.path.abspath(APP_DIR))
@@ -0,0 +1,92 @@
+# test_cache.py — PriceCache tazelik/bayatlık ve PriceHistory
+
+import time
+
+import pytest
+
+from skinmarketanalyzer.cache import HISTORY_COMPACT_INTERVAL, PriceCache
+
+MH = "AK-47 | Redline (Field-Tested)"
+
+
+@pytest.fixture
+def cache():
+    c = PriceCache(":memory:")
+    yield c
+    c.close()
+
+
+# -------------------- TTL / bayat kayıt --------------------
+def test_fresh_entry(cache):
+    cache.put("priceoverview", MH, 1, [12.5, 13.0])
+    e = cache.get("priceoverview", MH, 1)
+    assert e.value == [12.5, 13.0]
+    assert e.fresh
+
+
+def test_expired_entry_is_returned_stale(cache):
+    cache.put("priceoverview", MH, 1, [12.5, 13.0], fetched_at=time.time() - 3600)
+    e = cache.get("priceoverview", MH, 1)
+    assert e.value == [12.5, 13.0]
+    assert not e.fresh
+    assert e.age >= 3600
+
+
+def test_ttl_override_and_unknown_endpoint():
+    c = PriceCache(":memory:", ttls={"priceoverview": None})
+    c.put("priceoverview", MH, 1, [1.0, 1.0], fetched_at=0)
+    c.put("other", MH, 1, 1)
+    assert c.get("priceoverview", MH, 1).fresh      # None → hiç bayatlamaz
+    assert not c.get("other", MH, 1).fresh          # TTL'siz uç → hep bayat
+
+
+def test_currency_default_and_miss(cache):
+    cache.put("priceoverview", MH, 1, [1.0, 2.0])
+    assert cache.get("priceoverview", MH).value == [1.0, 2.0]
+    assert cache.get("priceoverview", MH, 3) is None
+    assert cache.get("histogram", MH, 1) is None
+
+
+def test_purge(cache):
+    cache.put("priceoverview", MH, 1, [1.0, 2.0], fetched_at=100)
+    cache.put("priceoverview", "other", 1, [1.0, 2.0])
+    cache.purge(time.time() - 60)
+    assert cache.get("priceoverview", MH, 1) is None
+    assert cache.get("priceoverview", "other", 1) is not None
+
+
+# -------------------- Fiyat geçmişi --------------------
+def test_record_many_skips_empty(cache):
+    h = cache.history
+    assert h.record_many([]) == 0
+    assert h.record_many([(MH, 1, None, None, None), ("", 1, 1.0, 1.0, None)]) == 0
+    assert h.record_many([(MH, 1, 10.0, 11.0, None)]) == 1
+    assert h.latest(MH)[1:] == (10.0, 11.0)
+
+
+def test_drops(cache):
+    now = time.time()
+    h = cache.history
+    h.record_many([
+        (MH, 1, 10.0, 10.0, now - 2 * 86400),
+        (MH, 1, 8.0, 8.0, now - 60),            # %20 düşüş
+        ("AWP | Asiimov (Field-Tested)", 1, 50.0, 50.0, now - 2 * 86400),
+        ("AWP | Asiimov (Field-Tested)", 1, 48.0, 48.0, now - 60),   # %4
+        ("New Item", 1, 5.0, 5.0, now - 60),    # referans gözlemi yok
+        (MH, 3, 10.0, 10.0, now - 2 * 86400),   # başka para birimi
+        (MH, 3, 1.0, 1.0, now - 60),
+    ])
+    drops = h.drops(pct=10.0, hours=24.0)
+    assert [(mh, old, new) for mh, old, new, _ in drops] == [(MH, 10.0, 8.0)]
+    assert drops[0][3] == pytest.approx(-20.0)
+    assert [d[0] for d in h.drops(pct=3.0)] == [MH, "AWP | Asiimov (Field-Tested)"]
+
+
+def test_compaction_runs_once_per_interval(cache):
+    h = cache.history
+    now = time.time()
+    assert not h.compact_due(now)                   # açılışta çalıştı
+    assert h.maybe_compact(now) is None
+    assert h.compact_due(now + HISTORY_COMPACT_INTERVAL)
+    assert h.maybe_compact(now + HISTORY_COMPACT_INTERVAL) == 0
+    assert not h.compact_due(now + HISTORY_COMPACT_INTERVAL)
@@ -0,0 +1,109 @@
+# test_fetch.py — FetchQueue öncelik heap'i ve stale-while-revalidate yayını
+
+import time
+
+import pytest
+
+from skinmarketanalyzer.cache import PriceCache
+from skinmarketanalyzer.fetch import FetchQueue, make_fetcher
+from skinmarketanalyzer.items import ItemStore
+
+
+def drain(q: FetchQueue) -> list:
+    out = []
+    while (key := q.pop()) is not None:
+        out.append(key)
+    return out
+
+
+# -------------------- FetchQueue --------------------
+def test_queue_orders_by_score_then_list_order():
+    q = FetchQueue(["a", "b", "c", "d"], {"b": 5.0, "c": 5.0, "d": float("nan")})
+    assert len(q) == 4
+    assert drain(q) == ["b", "c", "a", "d"]     # NaN en sona
+    assert q.pop() is None
+
+
+def test_queue_prioritize_and_release():
+    q = FetchQueue(["a", "b", "c", "d"], {"a": 4, "b": 3, "c": 2, "d": 1})
+    q.prioritize(["d", "c", "missing"])
+    assert q.pop() == "c"                       # öne alınanlar kendi içinde skorla
+    q.prioritize(["b"])                         # d normal sıraya döner
+    assert drain(q) == ["b", "a", "d"]
+
+
+def test_queue_set_scores_skips_taken_keys():
+    q = FetchQueue(["a", "b", "c"], {"a": 3, "b": 2, "c": 1})
+    assert q.pop() == "a"
+    q.set_scores({"a": 100, "c": 10})
+    assert drain(q) == ["c", "b"]
+
+
+def test_queue_compacts_stale_entries():
+    keys = [f"k{i}" for i in range(10)]
+    q = FetchQueue(keys)
+    for i in range(2000):
+        q.prioritize([keys[i % 10]])
+    assert len(q._heap) <= 4 * len(keys) + 1024
+    assert sorted(drain(q)) == sorted(keys)
+
+
+# -------------------- Bayat değer + başarısız yenileme --------------------
+MH = "AK-47 | Redline (Field-Tested)"
+
+
+def run_stale(engine: str, get):
+    cache = PriceCache(":memory:")
+    cache.put("priceoverview", MH, 1, [12.5, 13.0], fetched_at=time.time() - 3600)
+    out = []
+    f = make_fetcher(engine, ItemStore.from_raw([{"name": MH}]), 1, 2, 50.0,
+                     cache=cache, on_progress=lambda *a: out.append(a))
+    f._get = get
+    f.run()
+    return out
+
+
+def _raise(*a, **k):
+    raise ConnectionError("down")
+
+
+def _none(*a, **k):
+    return None
+
+
+async def _async_none(*a, **k):
+    return None
+
+
+@pytest.mark.parametrize("get", [_raise, _none])
+def test_failed_refresh_keeps_stale_value_threads(get):
+    assert run_stale("threads", get) == [(MH, 12.5, 13.0)]
+
+
+def test_failed_refresh_keeps_stale_value_async():
+    pytest.importorskip("aiohttp")
+    assert run_stale("async", _async_none) == [(MH, 12.5, 13.0)]
+
+
+def test_successful_refresh_replaces_stale_value():
+    def get(url, delay, as_json=True, endpoint="priceoverview"):
+        return {"success": True, "lowest_price": "$14.00", "median_price": "$14.50"}
+
+    assert run_stale("threads", get) == [(MH, 12.5, 13.0), (MH, 14.0, 14.5)]
+
+
+# -------------------- Alış emri verisi --------------------
+def test_orders_travel_with_their_result():
+    calls = []
+    f = make_fetcher("threads", ItemStore.from_raw([{"name": MH}]), 1, 1, 1.0,
+                     on_progress=lambda *a: calls.append(("price", *a)),
+                     on_orders=lambda *a: calls.append(("orders", *a)))
+    hist = {"buy": 11.0, "sell_count": 3, "buy_count": 7}
+    f._shown_stale.add(MH)
+    f._emit_orders(MH, hist)
+    f._emit_result(MH, 0.0, 0.0)        # yenileme başarısız: kayıt yok, alış verisi de atılır
+    assert calls == [] and not f._orders
+    f._emit_orders(MH, hist)
+    f._emit_result(MH, 12.0, 12.5)
+    assert calls == [("orders", MH, 11.0, 3, 7), ("price", MH, 12.0, 12.5)]
+    assert not f._orders
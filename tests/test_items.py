@@ -0,0 +1,69 @@
+# test_items.py — akışlı JSON okuyucu (_JsonStream / iter_items)
+
+import io, json
+
+import pytest
+
+from skinmarketanalyzer.items import _JsonStream, iter_batches, iter_items
+
+ITEMS = [{"name": "AK-47 | Redline", "sell_price": 12345.678, "stattrak": True},
+         {"name": "AWP | Asiimov", "sell_price": None, "tags": ["a", {"b": 1}]},
+         {"name": "Ünicode ★ Karambit", "sell_price": -0.5e-3}]
+
+
+class Chunked(io.StringIO):
+    """read() en fazla `size` karakter döndürür: değerler parça sınırında bölünür."""
+    def __init__(self, text: str, size: int):
+        super().__init__(text)
+        self.size = size
+
+    def read(self, n=-1):
+        return super().read(self.size if n is None or n < 0 else min(n, self.size))
+
+
+def read(text: str, chunk_size: int = 1 << 20) -> list:
+    return list(iter_items(Chunked(text, chunk_size)))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1 << 20])
+@pytest.mark.parametrize("shape", ["list", "wrapped", "lines"])
+def test_iter_items_shapes(shape, chunk_size):
+    if shape == "list":
+        text = json.dumps(ITEMS, ensure_ascii=False, indent=1)
+    elif shape == "wrapped":
+        text = json.dumps({"meta": {"n": 3}, "items": ITEMS, "tail": 1}, ensure_ascii=False)
+    else:
+        text = "\n".join(json.dumps(it, ensure_ascii=False) for it in ITEMS) + "\n"
+    assert read(text, chunk_size) == ITEMS
+
+
+def test_raw_decode_waits_for_split_number():
+    st = _JsonStream(io.StringIO("12345 true"), chunk_size=2)
+    assert st.value() == 12345
+    assert st.value() is True
+    assert st.peek() == ""
+
+
+def test_object_without_items_is_one_item():
+    assert read('{"name": "x", "n": 1}', 4) == [{"name": "x", "n": 1}]
+
+
+def test_non_dict_entries_are_skipped():
+    assert read('[1, {"name": "x"}, "s", null]') == [{"name": "x"}]
+
+
+def test_empty_inputs():
+    assert read("") == []
+    assert read("[]") == []
+    assert read("  {}  ") == [{}]
+
+
+@pytest.mark.parametrize("text", ["42", '[{"a": 1} {"b": 2}]', '{"a" 1}'])
+def test_invalid_json(text):
+    with pytest.raises(ValueError):
+        read(text, 4)
+
+
+def test_iter_batches():
+    assert list(iter_batches(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(iter_batches([], 2)) == []
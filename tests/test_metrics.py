@@ -0,0 +1,46 @@
+# test_metrics.py — FetchMetrics özeti ve darboğaz teşhisi
+
+import json
+
+from skinmarketanalyzer.metrics import FetchMetrics, diagnose
+
+
+def test_hit_ratio_counts_result_lookups_only():
+    m = FetchMetrics()
+    m.cache("result", "hit")
+    m.cache("result", "stale")
+    m.cache("result", "hit")
+    m.cache("result", "miss")
+    m.cache("priceoverview", "miss")
+    m.cache("nameid", "miss")
+    m.reject("priceoverview")
+    s = m.snapshot()
+    assert s["cache_hit_ratio"] == 0.5
+    assert s["success_false"] == 1
+    assert not any("success_false" in k for k in json.loads(m.to_json())["cache_lookups"])
+    assert 'skinmarket_success_false_total{endpoint="priceoverview"} 1' in m.to_prometheus()
+
+
+def test_client_delay_is_not_rate_limit_wait():
+    m = FetchMetrics()
+    for _ in range(10):
+        m.request("priceoverview", 200, 0.2, 100, 0, 0.0, 1.5)
+        m.item(True)
+    s = m.snapshot()
+    assert s["wait_share"] == 0.0
+    assert s["avg_delay_ms"] == 1500.0
+    assert diagnose(s) == "Steam gecikmesi"
+
+
+def test_diagnose_rate_limit():
+    m = FetchMetrics()
+    for _ in range(10):
+        m.request("priceoverview", 200, 0.1, 100, 0, 1.0)
+        m.item(True)
+    assert diagnose(m.snapshot()) == "hız sınırı"
+    m = FetchMetrics()
+    for i in range(10):
+        m.request("priceoverview", 200, 0.1)
+        m.item(True)
+    m.reject("priceoverview")
+    assert diagnose(m.snapshot()) == "hız sınırı"       # success:false yumuşak kısıtlamadır
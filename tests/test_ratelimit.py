@@ -0,0 +1,124 @@
+# test_ratelimit.py — TokenBucket, AsyncTokenBucket ve AIMD denetleyicisi
+
+import time, asyncio, threading
+
+import pytest
+
+from skinmarketanalyzer.ratelimit import AimdRateController, AsyncTokenBucket, TokenBucket
+
+
+# -------------------- TokenBucket --------------------
+def test_reserve_is_fifo_and_borrows():
+    b = TokenBucket(rate=10.0, burst=1)
+    now = b.last
+    assert b._reserve(1, now) == now                        # tampondaki token
+    assert b._reserve(1, now) == pytest.approx(now + 0.1)   # borçlanır: sırayla 1/rate arayla
+    assert b._reserve(1, now) == pytest.approx(now + 0.2)
+    assert b.tokens == pytest.approx(-2.0)
+
+
+def test_burst_then_rate():
+    b = TokenBucket(rate=20.0, burst=3)
+    t = time.monotonic()
+    for _ in range(3):
+        assert b.acquire()
+    assert time.monotonic() - t < 0.03
+    assert b.acquire()
+    assert time.monotonic() - t >= 0.04
+    assert b.stats()["granted"] == 4
+
+
+def test_cancel_wakes_waiter_and_refunds():
+    b = TokenBucket(rate=0.5, burst=1)
+    assert b.acquire()
+    out = []
+    th = threading.Thread(target=lambda: out.append(b.acquire()))
+    th.start()
+    time.sleep(0.05)
+    t = time.monotonic()
+    b.cancel()
+    th.join(1.0)
+    assert out == [False]
+    assert time.monotonic() - t < 0.5
+    assert b.tokens == pytest.approx(0.0, abs=0.1)
+    assert b.acquire() is False
+
+
+def test_stop_flag():
+    b = TokenBucket(rate=10.0, burst=1)
+    assert b.acquire(stop_flag=lambda: True) is False
+    assert b.tokens == pytest.approx(1.0)
+
+
+def test_set_rate_drain():
+    b = TokenBucket(rate=5.0, burst=3)
+    b.set_rate(0.001, drain=True)
+    assert b.rate == 0.01           # alt sınır
+    assert b.tokens <= 0.0
+
+
+# -------------------- AsyncTokenBucket --------------------
+def test_async_burst_then_rate():
+    async def main():
+        b = AsyncTokenBucket(rate=20.0, burst=2)
+        t = time.monotonic()
+        assert await b.acquire()
+        assert await b.acquire()
+        first = time.monotonic() - t
+        assert await b.acquire()
+        return first, time.monotonic() - t
+
+    first, total = asyncio.run(main())
+    assert first < 0.03
+    assert total >= 0.04
+
+
+def test_async_cancel():
+    async def main():
+        b = AsyncTokenBucket(rate=0.5, burst=1)
+        assert await b.acquire()
+        task = asyncio.ensure_future(b.acquire())
+        await asyncio.sleep(0.05)
+        b.cancel()
+        return await asyncio.wait_for(task, 1.0), await b.acquire()
+
+    assert asyncio.run(main()) == (False, False)
+
+
+# -------------------- AIMD --------------------
+def test_aimd_increase_is_bounded():
+    b = TokenBucket(rate=4.9, burst=1)
+    ctl = AimdRateController(b, max_rate=5.0, increase=1.0)
+    ctl.on_success()
+    assert b.rate == 5.0
+    ctl.on_success()
+    assert b.rate == 5.0
+
+
+def test_aimd_throttle_halves_once_per_cooldown():
+    changes = []
+    b = TokenBucket(rate=4.0, burst=3)
+    ctl = AimdRateController(b, min_rate=0.3, cooldown=60.0, on_change=changes.append)
+    ctl.on_throttle()
+    ctl.on_throttle()               # aynı dalga: ikinci düşüş yok
+    assert b.rate == 2.0
+    assert b.tokens <= 0.0          # burst tamponu boşaltılır
+    assert ctl.throttles == 2
+    assert changes == [2.0]
+
+
+def test_aimd_respects_min_rate():
+    b = TokenBucket(rate=0.4, burst=1)
+    ctl = AimdRateController(b, min_rate=0.3, cooldown=0.0)
+    for _ in range(3):
+        ctl.on_throttle()
+    assert b.rate == 0.3
+
+
+def test_aimd_disabled_keeps_rate():
+    b = TokenBucket(rate=2.0, burst=1)
+    ctl = AimdRateController(b, enabled=False)
+    ctl.on_success()
+    ctl.on_throttle()
+    assert b.rate == 2.0
+    assert ctl.throttles == 1
@@ -0,0 +1,113 @@
+# test_search.py — sorgu ayrıştırma ve SearchIndex eşleşmesi
+
+import pytest
+
+from skinmarketanalyzer.items import ItemStore
+from skinmarketanalyzer.search import FLAG_SOUVENIR, FLAG_STATTRAK, SearchIndex, _within_one, parse_query
+
+RAW = [
+    {"name": "AK-47 | Redline (Field-Tested)", "quality": "Classified"},
+    {"name": "StatTrak™ AK-47 | Redline (Minimal Wear)", "quality": "Classified"},
+    {"name": "AWP | Asiimov (Field-Tested)", "quality": "Covert"},
+    {"name": "Souvenir AWP | Dragon Lore (Factory New)", "quality": "Covert"},
+    {"name": "Sticker | Team Liquid (Holo)", "quality": "Remarkable"},
+    {"name": "M4A1-S | Printstream (Battle-Scarred)", "quality": "Covert"},
+]
+PROFIT = [5.0, 12.0, -3.0, 150.0, float("nan"), 10.0]
+
+
+@pytest.fixture(scope="module")
+def store():
+    st = ItemStore.from_raw(RAW)
+    for i, p in enumerate(PROFIT):
+        st.profit[i] = p
+    return st
+
+
+@pytest.fixture(scope="module")
+def index(store):
+    ix = SearchIndex()
+    ix.extend(store)
+    return ix
+
+
+def match(index, store, text):
+    return index.match(parse_query(text), store)
+
+
+# -------------------- parse_query --------------------
+def test_parse_query_parts():
+    q = parse_query("wear:fn StatTrak profit>=10,5 weapon:ak-47 Red-line -souvenir -wear:bs -skin:x -foo")
+    assert q.wears == {0}
+    assert q.not_wears == {4}
+    assert q.flags == FLAG_STATTRAK
+    assert q.not_flags == FLAG_SOUVENIR
+    assert [(c, v) for c, _, v in q.numeric] == [("profit", 10.5)]
+    assert q.fields == [("weapon", "ak47")]
+    assert q.not_fields == [("skin", "x")]
+    assert q.terms == ["redline"]
+    assert q.not_terms == ["foo"]
+
+
+def test_parse_query_edge_cases():
+    assert not parse_query("")
+    assert not parse_query("  -  --x -profit>10 ")     # anlamsız / desteklenmeyen olumsuzlar
+    assert parse_query("wear:field").wears == {2}       # önek eşleşmesi
+    assert parse_query("wear:fn wear:mw").wears == set()
+    assert parse_query("unknown:val").terms == ["unknownval"]
+    assert parse_query("name:st").fields == [("name", "st")]
+
+
+# -------------------- SearchIndex --------------------
+def test_empty_query_matches_all(index, store):
+    assert match(index, store, "") is None
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("redline", [0, 1]),
+    ("ak47 redline", [0, 1]),
+    ("-redline", [2, 3, 4, 5]),
+    ("stattrak", [1]),
+    ("st", [1]),
+    ("-st redline", [0]),
+    ("souvenir", [3]),
+    ("wear:ft", [0, 2]),
+    ("-wear:ft", [1, 3, 4, 5]),           # aşınmasız sticker kalır
+    ("wear:fn -souvenir", []),
+    ("weapon:awp", [2, 3]),
+    ("skin:asi", [2]),
+    ("-weapon:awp quality:covert", [5]),
+    ("covert", [2, 3, 5]),
+    ("profit>=10", [1, 3, 5]),
+    ("profit<0", [2]),                    # NaN hiçbir koşulu sağlamaz
+    ("profit>10 wear:bs", []),
+    ("zzz", []),
+    ("readline", [0, 1]),                 # tek harf fazla
+    ("asimov", [2]),                      # tek harf eksik
+    ("printstraem", []),                  # iki düzenleme: eşleşmez
+    ("printstrem", [5]),
+    ("covret", []),                       # yer değiştirme iki düzenlemedir
+    ("awx", []),                          # kısa terim yalnız tam eşleşir
+    ("-readline", [0, 1, 2, 3, 4, 5]),    # dışlayan terim bulanık değil
+])
+def test_match(index, store, text, expected):
+    assert match(index, store, text) == expected
+
+
+def test_within_one():
+    assert _within_one("redline", "redline")
+    assert _within_one("redline", "redlines")
+    assert _within_one("redline", "rdline")
+    assert _within_one("redline", "redlane")
+    assert not _within_one("redline", "rdlane")
+    assert not _within_one("redline", "redliness")
+
+
+def test_extend_indexes_only_new_rows(store):
+    ix = SearchIndex()
+    part = ItemStore.from_raw(RAW[:2])
+    ix.extend(part)
+    assert len(ix) == 2
+    ix.extend(store)
+    assert len(ix) == len(store)
+    assert ix.match(parse_query("awp"), store) == [2, 3]
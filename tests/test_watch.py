@@ -0,0 +1,68 @@
+# test_watch.py — izleme modu yenileme takvimi
+
+import time
+
+import pytest
+
+from skinmarketanalyzer.cache import PriceCache
+from skinmarketanalyzer.items import ItemStore
+from skinmarketanalyzer.watch import PriceWatcher, RefreshSchedule
+
+
+@pytest.fixture
+def schedule():
+    s = RefreshSchedule(min_interval=60, max_interval=1800, initial_interval=300)
+    now = time.time()
+    for i in range(4):
+        s.add(f"k{i}", now - 10 + i, score=4 - i)
+    s.add("late", now + 1000)
+    return s
+
+
+def test_take_in_due_order(schedule):
+    assert [schedule.take() for _ in range(4)] == ["k0", "k1", "k2", "k3"]
+
+
+def test_record_adapts_interval(schedule):
+    key = schedule.take()
+    schedule.record(key, 10.0)
+    assert schedule.intervals[key] == 300
+    schedule.record(key, 10.0)              # değişmedi → seyrekleşir
+    assert schedule.intervals[key] == 450
+    schedule.record(key, 12.0)              # oynak → sıklaşır
+    assert schedule.intervals[key] == 225
+
+
+def test_record_reports_median_change(schedule):
+    key = schedule.take()
+    assert schedule.record(key, 10.0, 11.0)
+    assert not schedule.record(key, 10.0, 11.0)
+    assert schedule.record(key, 10.0, 11.5)         # yalnız medyan değişti
+    assert not schedule.record(key, 0.0, 0.0)       # başarısız çekme değişim değil
+    assert schedule.intervals[key] == 450 * 1.5     # aralık yalnız fiyata göre
+
+
+def test_prioritize_takes_boosted_first(schedule):
+    schedule.prioritize(["k2", "late", "missing"])
+    assert schedule.take() == "k2"
+    assert schedule._due["late"] <= time.time() + 60    # en geç min_interval sonra
+    schedule.prioritize([])
+    assert [schedule.take() for _ in range(3)] == ["k0", "k1", "k3"]
+
+
+def test_close_releases_take(schedule):
+    for _ in range(4):
+        schedule.take()
+    schedule.close()
+    assert schedule.take() is None
+
+
+def test_fresh_cache_entry_is_refreshed_after_ttl():
+    mh = "AK-47 | Redline (Field-Tested)"
+    cache = PriceCache(":memory:")
+    fetched = time.time() - 60
+    cache.put("priceoverview", mh, 1, [12.5, 13.0], fetched_at=fetched)
+    w = PriceWatcher(ItemStore.from_raw([{"name": mh}]), 1, 1, 1.0, cache=cache)
+    w._seed_schedule()
+    assert w.schedule._due[mh] == pytest.approx(fetched + cache.ttls["priceoverview"])
+    assert w.schedule.last_median[mh] == 13.0